@@ -0,0 +1,58 @@
+from functools import partial
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+
+from .creation import DatabaseCreation
+from .pool import ConnectionPool, get_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    The PostgreSQL backend, with the connections taken from a `ConnectionPool` of the process when
+    `OPTIONS["pool"]` is set: True, or the arguments of the pool, e.g. `{"min_size": 2, "max_size": 10}`.
+
+    Like Django closes the connection at the end of a request with `CONN_MAX_AGE = 0`, it gives it back to the pool
+    here, so a request only waits for a connection when all of them are in use.
+    """
+
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connection_pool = None  # the pool of the open connection
+
+    @property
+    def pool(self) -> ConnectionPool | None:
+        options = self.settings_dict["OPTIONS"].get("pool")
+        if not options or self.alias == NO_DB_ALIAS:  # the maintenance connections to the `postgres` database
+            return None
+        if self.settings_dict["CONN_MAX_AGE"]:
+            raise ImproperlyConfigured("Pooled connections cannot be persistent, set CONN_MAX_AGE to 0.")
+
+        params = self.get_connection_params()
+        options = options if isinstance(options, dict) else {}
+        return get_pool(self.alias, params, options, partial(super().get_new_connection, params))
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop("pool", None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        connection = pool.getconn(partial(super().get_new_connection, conn_params))
+        self.connection_pool = pool
+        return connection
+
+    def _close(self):
+        if self.connection_pool is None:
+            return super()._close()
+
+        with self.wrap_database_errors:
+            self.connection_pool.putconn(self.connection)
+        self.connection, self.connection_pool = None, None
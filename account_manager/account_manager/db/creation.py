@@ -0,0 +1,9 @@
+from django.db.backends.postgresql import creation
+
+from .pool import close_pool
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        close_pool(self.connection.alias)  # idle pooled connections would block dropping the database
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -0,0 +1,35 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from rest_framework.permissions import SAFE_METHODS
+
+from .router import end_request, start_request
+
+
+class DatabaseRoutingMiddleware:
+    """Routes the queries of each request with `PrimaryReplicaRouter`, in sync and async requests alike"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token, response = start_request(request.method not in SAFE_METHODS), None
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token, succeeded=response is not None and response.status_code < 400)
+        return response
+
+    async def __acall__(self, request):
+        token, response = start_request(request.method not in SAFE_METHODS), None
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token, succeeded=response is not None and response.status_code < 400)
+        return response
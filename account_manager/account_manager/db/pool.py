@@ -0,0 +1,186 @@
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+import psycopg2
+from psycopg2 import extensions
+
+_pools: dict[str, tuple[str, "ConnectionPool"]] = {}  # database alias: (connection settings, pool)
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(psycopg2.OperationalError):
+    """No connection of the pool was free within its `timeout`, Django raises it as `OperationalError`"""
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of the psycopg2 connections to one database.
+
+    `getconn()` hands out an idle connection, or opens one while less than `max_size` are open, or waits up to
+    `timeout` seconds for one to be given back with `putconn()` and raises `PoolTimeout` then. `open()` opens the first
+    `min_size` connections ahead of the requests, more are opened on demand, idle ones above `min_size` are closed after
+    `max_idle` seconds. With `check`, an idle connection is
+    tested with `SELECT 1` before it is handed out, one closed by the server meanwhile is replaced.
+    """
+
+    def __init__(self, min_size=2, max_size=10, timeout=10.0, max_idle=600.0, check=True):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError(f"Expected 0 <= min_size <= max_size and max_size >= 1, got {min_size}, {max_size}.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.check = check
+
+        self._condition = threading.Condition()
+        self._idle = deque()  # (connection, given back at), the most recently used on the right
+        self._size = 0  # open connections, idle and in use
+        self._waiting = 0
+        self._counters = {"created": 0, "closed": 0, "failed_checks": 0, "timeouts": 0}
+
+    def getconn(self, connect: Callable):
+        """Returns a connection, `connect()` opens a new one"""
+        connection = self._reserve()
+        if connection is not None and self.check and not self._is_usable(connection):
+            self._close(connection, failed_check=True)
+            connection = None
+        return connection if connection is not None else self._connect(connect)
+
+    def open(self, connect: Callable):
+        """Opens idle connections until `min_size` are open, `connect()` opens a new one"""
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            self.putconn(self._connect(connect))
+
+    def putconn(self, connection):
+        """Gives a connection back, rolling back its open transaction, a broken one is closed"""
+        if not connection.closed and connection.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except psycopg2.Error:
+                connection.close()
+
+        with self._condition:
+            if connection.closed:
+                self._size -= 1
+                self._counters["closed"] += 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def close(self):
+        """Closes the idle connections, the ones in use are closed when given back"""
+        with self._condition:
+            while self._idle:
+                self._idle.popleft()[0].close()
+                self._size -= 1
+                self._counters["closed"] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "waiting": self._waiting,
+                **self._counters,
+            }
+
+    def _reserve(self):
+        """Pops an idle connection, or returns None with a slot reserved for a new one"""
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            self._close_expired()
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["timeouts"] += 1
+                    raise PoolTimeout(f"No connection of the pool was free within {self.timeout} seconds.")
+
+                self._waiting += 1
+                try:
+                    self._condition.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+            if self._idle:
+                return self._idle.pop()[0]
+            self._size += 1
+            return None
+
+    def _connect(self, connect: Callable):
+        """Opens a connection in a reserved slot, which is released when it fails"""
+        try:
+            connection = connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._counters["created"] += 1
+        return connection
+
+    def _close(self, connection, failed_check=False):
+        """Closes a connection whose slot is reused for a new one"""
+        connection.close()
+        with self._condition:
+            self._counters["closed"] += 1
+            self._counters["failed_checks"] += failed_check
+
+    def _close_expired(self):
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.max_idle:
+            self._idle.popleft()[0].close()
+            self._size -= 1
+            self._counters["closed"] += 1
+
+    def _is_usable(self, connection) -> bool:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except psycopg2.Error:
+            return False
+        return True
+
+
+def get_pool(alias: str, conn_params: dict, options: dict, connect: Callable) -> ConnectionPool:
+    """
+    Returns the pool of the database in this process, a changed database (e.g. the test one) gets a new pool, whose
+    first `min_size` connections are opened with `connect()` right away
+    """
+    key = repr((conn_params, options))
+    with _pools_lock:
+        pool_key, pool = _pools.get(alias, (None, None))
+        if pool_key == key:
+            return pool
+        if pool is not None:
+            pool.close()
+        pool = ConnectionPool(**options)
+        _pools[alias] = (key, pool)
+
+    pool.open(connect)
+    return pool
+
+
+def close_pool(alias: str):
+    """Closes the idle connections of the pool of the database, the next connection opens a new pool"""
+    with _pools_lock:
+        _, pool = _pools.pop(alias, (None, None))
+    if pool is not None:
+        pool.close()
+
+
+def get_pool_stats() -> dict[str, dict[str, int]]:
+    """Returns the stats of the connection pools of this process by database alias"""
+    with _pools_lock:
+        pools = {alias: pool for alias, (_, pool) in _pools.items()}
+    return {alias: pool.stats() for alias, pool in pools.items()}
@@ -0,0 +1,86 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PINNED_USER_KEY = "db:primary:{}"
+
+_routing: ContextVar["RequestRouting | None"] = ContextVar("database_routing", default=None)
+
+
+class RequestRouting:
+    """
+    The database routing of the request being served, set by `DatabaseRoutingMiddleware`. A write request uses the
+    primary, and so does a read request of a user who wrote in the last `DATABASE_PRIMARY_PIN_SECONDS`, once the
+    user is known (see `set_request_user()`).
+    """
+
+    def __init__(self, write: bool):
+        self.write = write
+        self.use_primary = write
+        self.user_id = None
+
+    def set_user(self, user_id: int):
+        self.user_id = user_id
+        if not self.use_primary and cache.get(PINNED_USER_KEY.format(user_id)):
+            self.use_primary = True
+
+
+def start_request(write: bool):
+    """Routes the queries of the current context for a request, returns the token `end_request()` resets"""
+    return _routing.set(RequestRouting(write))
+
+
+def end_request(token, succeeded: bool):
+    """Pins the user of a succeeded write request to the primary, until the replicas have its changes"""
+    routing = _routing.get()
+    _routing.reset(token)
+    if routing is not None and routing.write and succeeded and routing.user_id is not None:
+        cache.set(PINNED_USER_KEY.format(routing.user_id), True, settings.DATABASE_PRIMARY_PIN_SECONDS)
+
+
+def set_request_user(user_id: int):
+    """Tells the routing of the current request which user it serves, called once the user is authenticated"""
+    routing = _routing.get()
+    if routing is not None:
+        routing.set_user(user_id)
+
+
+@contextmanager
+def use_primary():
+    """Reads from the primary within the block, e.g. rows which are cached afterwards"""
+    token = _routing.set(None)
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends the reads of read requests to a random one of `DATABASE_REPLICAS` and everything else to the primary:
+    writes, reads of write requests and of pinned users (see `RequestRouting`), reads in a transaction of the primary
+    and the queries outside requests, e.g. of management commands.
+    """
+
+    def db_for_read(self, model, **hints):
+        routing = _routing.get()
+        if routing is None or routing.use_primary or not settings.DATABASE_REPLICAS or self.in_transaction():
+            return None
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def in_transaction(self) -> bool:
+        """The reads of a transaction of the primary must see its writes"""
+        return connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True  # the replicas have the rows of the primary
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return False if db in settings.DATABASE_REPLICAS else None
@@ -0,0 +1,20 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .pool import get_pool_stats
+
+
+@extend_schema(tags=["internal"], responses=OpenApiTypes.OBJECT)
+class DatabasePoolView(APIView):
+    """
+    Returns the stats of the connection pools by database alias, e.g. `in_use`, `waiting` and `created`. They are
+    the ones of the worker process which serves the request, empty when DATABASE_POOL is off.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_pool_stats())
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .db.views import DatabasePoolView
+
+urlpatterns = [
+    path("api/internal/db-pool/", DatabasePoolView.as_view(), name="db-pool"),
+]
@@ -27,7 +27,14 @@ __all__ = [
     "TEMPLATES",
     "ROOT_URLCONF",
     "WSGI_APPLICATION",
+    "ASGI_APPLICATION",
+    "DATABASE_POOL",
+    "DATABASE_POOL_OPTIONS",
     "DATABASES",
+    "DATABASE_REPLICAS",
+    "DATABASE_ROUTERS",
+    "DATABASE_PRIMARY_PIN_SECONDS",
+    "CACHES",
     "AUTH_PASSWORD_VALIDATORS",
     "LANGUAGE_CODE",
     "TIME_ZONE",
@@ -36,8 +43,28 @@ __all__ = [
     "STATIC_URL",
     "DEFAULT_AUTO_FIELD",
     "REST_FRAMEWORK",
+    "PAGINATION_PAGE_SIZE",
+    "PAGINATION_MAX_PAGE_SIZE",
+    "BULK_MAX_ITEMS",
+    "PROJECT_CACHE_TIMEOUT",
+    "AUTH_USER_CACHE_TIMEOUT",
+    "ASYNC_VIEWS",
+    "SERVER_INTERFACE",
+    "SERVER_WORKERS",
+    "SERVER_THREADS",
+    "SERVER_KEEPALIVE",
+    "SERVER_TIMEOUT",
+    "SERVER_GRACEFUL_TIMEOUT",
+    "SERVER_MAX_REQUESTS",
+    "SERVER_MAX_REQUESTS_JITTER",
     "SIMPLE_JWT",
     "SPECTACULAR_SETTINGS",
+    "ENCRYPTION_KEYS",
+    "CREDENTIAL_CIPHER_WORKERS",
+    "CREDENTIAL_CIPHER_CHUNK_SIZE",
+    "REMINDER_NOTIFIER_BACKEND",
+    "REMINDER_CLAIM_TIMEOUT",
+    "TELEGRAM_BOT_TOKEN",
 ]
 
 load_dotenv()
@@ -77,6 +104,7 @@ AUTH_USER_MODEL = "user.User"
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "account_manager.db.middleware.DatabaseRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -103,18 +131,61 @@ TEMPLATES = [
 
 ROOT_URLCONF = "account_manager.urls"
 WSGI_APPLICATION = "account_manager.wsgi.application"
+ASGI_APPLICATION = "account_manager.asgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# PostgreSQL, `account_manager.db` keeps the connections of a process in a pool when DATABASE_POOL is on,
+# otherwise the requests of a thread reuse its connection for DATABASE_CONN_MAX_AGE seconds. Django does not support
+# persistent connections under ASGI (see SERVER_INTERFACE), there a request closes its connection unless it is pooled.
+DATABASE_POOL = os.getenv("DATABASE_POOL", "false").lower() == "true"
+persistent_connections = not DATABASE_POOL and os.getenv("SERVER_INTERFACE", "wsgi") != "asgi"
+DATABASE_POOL_OPTIONS = {
+    "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", 2)),
+    "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", 10)),  # per process, keep workers x max_size below the limit
+    "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", 10)),  # seconds a request waits for a free connection
+    "max_idle": float(os.getenv("DATABASE_POOL_MAX_IDLE", 600)),
+    "check": os.getenv("DATABASE_CONN_HEALTH_CHECKS", "true").lower() == "true",
+}
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql_psycopg2",
+        "ENGINE": "account_manager.db",
         "NAME": os.environ.get("POSTGRES_DB"),
         "USER": os.environ.get("POSTGRES_USER"),
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_HOST"),
         "PORT": os.environ.get("POSTGRES_PORT"),
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", 60)) if persistent_connections else 0,
+        "CONN_HEALTH_CHECKS": DATABASE_POOL_OPTIONS["check"],
+        "OPTIONS": {"pool": DATABASE_POOL_OPTIONS} if DATABASE_POOL else {},
+    }
+}
+
+# Read replicas, comma-separated `host[:port]` of the primary's database, the reads of GET requests go to them. A user
+# stays on the primary for DATABASE_PRIMARY_PIN_SECONDS after a write. The host of the primary simulates a replica.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(host for host in os.getenv("DATABASE_REPLICA_HOSTS", "").split(",") if host.strip()):
+    host, _, port = replica.strip().partition(":")
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{index}")
+
+DATABASE_ROUTERS = ["account_manager.db.router.PrimaryReplicaRouter"]
+DATABASE_PRIMARY_PIN_SECONDS = int(os.getenv("DATABASE_PRIMARY_PIN_SECONDS", 10))
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "account-manager"),
     }
 }
 
@@ -158,11 +229,37 @@ STATIC_URL = "/static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("authorization.authentication.CachedJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# Cursor pagination of list endpoints, `?page_size=` is capped by the max page size
+PAGINATION_PAGE_SIZE = int(os.getenv("PAGINATION_PAGE_SIZE", 50))
+PAGINATION_MAX_PAGE_SIZE = int(os.getenv("PAGINATION_MAX_PAGE_SIZE", 500))
+
+# Max number of objects sent to a `.../bulk/` endpoint in one request
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 2000))
+
+# Seconds a project list/detail response stays cached, writes invalidate it earlier (see `project.cache`)
+PROJECT_CACHE_TIMEOUT = int(os.getenv("PROJECT_CACHE_TIMEOUT", 300))
+
+# Seconds the user of a JWT stays cached, saving or deleting the user invalidates it earlier
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT", 60))
+
+# Serves the project, task and credential reads with async views, only enable it when served by an ASGI server
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", "false").lower() == "true"
+
+# Production server, `manage.py serve` (gunicorn), the options of the command override them
+SERVER_INTERFACE = os.getenv("SERVER_INTERFACE", "wsgi")  # "wsgi" or "asgi", which needs ASYNC_VIEWS to pay off
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+SERVER_THREADS = int(os.getenv("SERVER_THREADS", 1))
+SERVER_KEEPALIVE = int(os.getenv("SERVER_KEEPALIVE", 5))
+SERVER_TIMEOUT = int(os.getenv("SERVER_TIMEOUT", 30))
+SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", 30))
+SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", 1000))
+SERVER_MAX_REQUESTS_JITTER = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", 100))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
@@ -176,3 +273,21 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "0.1.0",
     "SERVE_INCLUDE_SCHEMA": False,
 }
+
+# Credentials encryption
+# from cryptography.fernet import Fernet; Fernet.generate_key()
+# Comma-separated: the first key encrypts, the rest only decrypt until `manage.py rotate_credential_keys` is done.
+
+ENCRYPTION_KEYS = [key.strip() for key in os.getenv("ENCRYPTION_KEY", "").split(",") if key.strip()]
+
+# Thread pool used by batch encrypt/decrypt, e.g. `Credential.objects.decrypt_passwords()`
+CREDENTIAL_CIPHER_WORKERS = int(os.getenv("CREDENTIAL_CIPHER_WORKERS", min(8, os.cpu_count() or 1)))
+CREDENTIAL_CIPHER_CHUNK_SIZE = int(os.getenv("CREDENTIAL_CIPHER_CHUNK_SIZE", 500))
+
+# Task reminders, sent by `manage.py send_reminders`
+# `project.notifiers.LocMemNotifier` keeps them in memory instead, for local development
+REMINDER_NOTIFIER_BACKEND = os.getenv("REMINDER_NOTIFIER_BACKEND", "project.notifiers.TelegramNotifier")
+TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
+# Seconds a worker may take to send a claimed batch before another worker claims it again, keep it above
+# batch size x the timeout of the notifier (100 x 10s for Telegram)
+REMINDER_CLAIM_TIMEOUT = int(os.getenv("REMINDER_CLAIM_TIMEOUT", 1800))
@@ -0,0 +1,11 @@
+from tests.conftest import (  # noqa: F401
+    Projects,
+    Users,
+    api_client,
+    auth_client,
+    clear_cache,
+    django_db_setup,
+    projects,
+    users,
+    without_silk,
+)
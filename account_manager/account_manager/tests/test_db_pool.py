@@ -0,0 +1,209 @@
+import threading
+import time
+
+import psycopg2
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError, connection
+from django.urls import reverse
+from psycopg2 import extensions
+from rest_framework import status
+
+from account_manager.db.base import DatabaseWrapper
+from account_manager.db.pool import ConnectionPool, PoolTimeout, close_pool
+
+from .conftest import Users
+
+
+# ----- ConnectionPool Tests -------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestConnectionPool:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self):
+        self.connections = []
+        yield
+        for conn in self.connections:
+            conn.close()
+
+    def test_connection_is_reused(self):
+        pool = ConnectionPool()
+        conn = pool.getconn(self.connect)
+        pool.putconn(conn)
+
+        assert pool.getconn(self.connect) is conn
+        stats = pool.stats()
+        assert (stats["created"], stats["in_use"], stats["idle"]) == (1, 1, 0)
+
+    def test_timeout(self):
+        pool = ConnectionPool(min_size=0, max_size=1, timeout=0.05)
+        pool.getconn(self.connect)
+
+        with pytest.raises(PoolTimeout):
+            pool.getconn(self.connect)
+        assert pool.stats()["timeouts"] == 1
+
+    def test_waits_for_connection(self):
+        pool = ConnectionPool(min_size=0, max_size=1, timeout=5)
+        conn = pool.getconn(self.connect)
+        checked_out = []
+        waiter = threading.Thread(target=lambda: checked_out.append(pool.getconn(self.connect)))
+        waiter.start()
+        while not pool.stats()["waiting"]:
+            time.sleep(0.001)
+
+        pool.putconn(conn)
+        waiter.join()
+
+        assert checked_out == [conn]
+        assert pool.stats()["waiting"] == 0
+
+    def test_transaction_is_rolled_back(self):
+        pool = ConnectionPool()
+        conn = pool.getconn(self.connect)
+        conn.autocommit = False
+        conn.cursor().execute("SELECT 1")
+
+        pool.putconn(conn)
+
+        assert conn.info.transaction_status == extensions.TRANSACTION_STATUS_IDLE
+
+    def test_terminated_connection_is_replaced(self):
+        pool = ConnectionPool()
+        conn = pool.getconn(self.connect)
+        pool.putconn(conn)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_terminate_backend(%s)", [conn.info.backend_pid])
+
+        new_conn = pool.getconn(self.connect)
+
+        assert new_conn is not conn
+        stats = pool.stats()
+        assert (stats["created"], stats["closed"], stats["failed_checks"], stats["size"]) == (2, 1, 1, 1)
+
+    def test_closed_connection_frees_slot(self):
+        pool = ConnectionPool(min_size=0, max_size=1, timeout=0.05)
+        conn = pool.getconn(self.connect)
+        conn.close()
+
+        pool.putconn(conn)
+
+        assert pool.getconn(self.connect) is not conn
+
+    @pytest.mark.parametrize("min_size, expected_created", [(0, 2), (1, 1)])
+    def test_idle_connections_above_min_size_expire(self, min_size, expected_created):
+        pool = ConnectionPool(min_size=min_size, max_idle=0)
+        pool.putconn(pool.getconn(self.connect))
+
+        pool.getconn(self.connect)
+
+        assert pool.stats()["created"] == expected_created
+
+    def test_failed_connect_frees_slot(self):
+        pool = ConnectionPool(min_size=0, max_size=1, timeout=0.05)
+
+        with pytest.raises(psycopg2.OperationalError):
+            pool.getconn(lambda: psycopg2.connect(**{**self.get_params(), "dbname": "missing"}))
+
+        assert pool.stats()["size"] == 0
+        pool.getconn(self.connect)
+
+    def test_open(self):
+        pool = ConnectionPool(min_size=2)
+        pool.open(self.connect)
+
+        conn = pool.getconn(self.connect)
+
+        assert conn in self.connections[:2]
+        stats = pool.stats()
+        assert (stats["created"], stats["in_use"], stats["idle"]) == (2, 1, 1)
+
+    @pytest.mark.parametrize("min_size, max_size", [(3, 2), (0, 0), (-1, 2)])
+    def test_invalid_size(self, min_size, max_size):
+        with pytest.raises(ValueError):
+            ConnectionPool(min_size=min_size, max_size=max_size)
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_params(self) -> dict:
+        return connection.get_connection_params()
+
+    def connect(self):
+        conn = psycopg2.connect(**self.get_params())
+        conn.autocommit = True
+        self.connections.append(conn)
+        return conn
+
+
+# ----- Pooled DatabaseWrapper Tests -----------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestPooledDatabaseWrapper:
+
+    alias = "pooled"
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users):
+        self.auth_client = auth_client
+        self.users: Users = users
+        yield
+        close_pool(self.alias)
+
+    def test_connection_goes_back_to_pool(self):
+        wrapper = self.get_wrapper()
+        wrapper.ensure_connection()
+        backend_pid = wrapper.connection.info.backend_pid
+
+        wrapper.close()
+        assert wrapper.connection is None
+        wrapper.ensure_connection()
+
+        assert wrapper.connection.info.backend_pid == backend_pid
+        assert wrapper.pool.stats()["created"] == 1
+
+    def test_min_size_is_opened_with_pool(self):
+        pool = self.get_wrapper(OPTIONS=self.get_options(min_size=2, max_size=2)).pool
+
+        stats = pool.stats()
+        assert (stats["created"], stats["idle"]) == (2, 2)
+
+    def test_pool_timeout(self):
+        wrappers = [self.get_wrapper(), self.get_wrapper()]
+        wrappers[0].ensure_connection()
+
+        with pytest.raises(OperationalError):
+            wrappers[1].ensure_connection()
+
+    def test_queries(self):
+        wrapper = self.get_wrapper()
+
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            assert cursor.fetchone() == (1,)
+
+    def test_persistent_connections_are_rejected(self):
+        with pytest.raises(ImproperlyConfigured):
+            self.get_wrapper(CONN_MAX_AGE=60).ensure_connection()
+
+    def test_pool_stats(self):
+        self.get_wrapper().ensure_connection()
+
+        response = self.auth_client(self.users.admin).get(reverse("db-pool"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[self.alias]["in_use"] == 1
+
+    @pytest.mark.parametrize("auth_user", ["not_auth", "user1"])
+    def test_pool_stats_access(self, auth_user):
+        response = self.auth_client(getattr(self.users, auth_user)).get(reverse("db-pool"))
+
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_wrapper(self, **settings_dict):
+        return DatabaseWrapper(
+            {**connection.settings_dict, "CONN_MAX_AGE": 0, "OPTIONS": self.get_options(), **settings_dict},
+            alias=self.alias,
+        )
+
+    def get_options(self, min_size=0, max_size=1) -> dict:
+        pool = {"min_size": min_size, "max_size": max_size, "timeout": 0.05}
+        return {**connection.settings_dict["OPTIONS"], "pool": pool}
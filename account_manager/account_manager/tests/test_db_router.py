@@ -0,0 +1,192 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.core.cache import cache
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account_manager.db.router import (
+    PINNED_USER_KEY,
+    PrimaryReplicaRouter,
+    end_request,
+    set_request_user,
+    start_request,
+    use_primary,
+)
+from project.models import Task
+
+from .conftest import Projects, Users
+
+# ----- Router Test Case Schemas ---------------------------------------------------------------------------------------
+R_TestCase = nt("Routing", ["request_kind", "pinned", "expected_db"])
+
+# ----- Router Test Cases ----------------------------------------------------------------------------------------------
+routing_test_cases = [
+    # "request_kind", "pinned", "expected_db"
+    R_TestCase(None, False, None),
+    R_TestCase("read", False, "replica"),
+    R_TestCase("read", True, None),
+    R_TestCase("write", False, None),
+]
+
+
+# ----- PrimaryReplicaRouter Tests -------------------------------------------------------------------------------------
+class TestPrimaryReplicaRouter:
+
+    user_id = 1
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, settings):
+        settings.DATABASE_REPLICAS = ["replica"]
+        settings.DATABASE_PRIMARY_PIN_SECONDS = 10
+        self.router = PrimaryReplicaRouter()
+        cache.clear()
+
+    @pytest.mark.parametrize("test_case", routing_test_cases)
+    def test_db_for_read(self, test_case: R_TestCase):
+        if test_case.pinned:
+            cache.set(PINNED_USER_KEY.format(self.user_id), True)
+
+        with self.request(test_case.request_kind):
+            assert self.router.db_for_read(Task) == test_case.expected_db
+
+    def test_writes_go_to_primary(self):
+        with self.request("read"):
+            assert self.router.db_for_write(Task) == "default"
+
+    def test_no_replicas(self, settings):
+        settings.DATABASE_REPLICAS = []
+
+        with self.request("read"):
+            assert self.router.db_for_read(Task) is None
+
+    def test_use_primary(self):
+        with self.request("read"), use_primary():
+            assert self.router.db_for_read(Task) is None
+
+    def test_transaction_reads_primary(self, monkeypatch):
+        monkeypatch.setattr(connection, "in_atomic_block", True)
+
+        with self.request("read"):
+            assert self.router.db_for_read(Task) is None
+
+    @pytest.mark.parametrize(
+        "request_kind, succeeded, expected_pinned",
+        [("write", True, True), ("write", False, None), ("read", True, None)],
+    )
+    def test_pin_after_write(self, request_kind, succeeded, expected_pinned):
+        token = start_request(request_kind == "write")
+        set_request_user(self.user_id)
+        end_request(token, succeeded)
+
+        assert cache.get(PINNED_USER_KEY.format(self.user_id)) is expected_pinned
+
+    def test_allow_migrate(self):
+        assert self.router.allow_migrate("replica", "project") is False
+        assert self.router.allow_migrate("default", "project") is None
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def request(self, request_kind):
+        """Routes like a read or write request of the user, or outside requests with None"""
+        return RequestContext(request_kind, self.user_id)
+
+
+class RequestContext:
+    def __init__(self, request_kind, user_id):
+        self.request_kind, self.user_id, self.token = request_kind, user_id, None
+
+    def __enter__(self):
+        if self.request_kind is not None:
+            self.token = start_request(self.request_kind == "write")
+            set_request_user(self.user_id)
+
+    def __exit__(self, *exc_info):
+        if self.token is not None:
+            end_request(self.token, succeeded=False)
+
+
+# ----- Simulated Replica Tests ----------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestSimulatedReplica:
+    """
+    `replica` is a second connection to the test database, it reads the committed test data but not the rows
+    written by a test, like a lagging replica
+    """
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, settings, monkeypatch, users, projects):
+        connections.settings["replica"] = {**connections.settings["default"]}
+        settings.DATABASE_REPLICAS = ["replica"]
+        # The transaction of the test case is not one of the app
+        depth = len(connection.atomic_blocks)
+        monkeypatch.setattr(
+            PrimaryReplicaRouter, "in_transaction", lambda router: len(connection.atomic_blocks) > depth
+        )
+
+        self.users: Users = users
+        self.projects: Projects = projects
+        yield
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+
+    def test_reads_go_to_replica(self):
+        response, replica_queries = self.get_tasks(self.users.user1)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert replica_queries
+
+    def test_writer_reads_own_writes(self):
+        client = self.get_client(self.users.user1)
+        created = client.post(self.get_url(), {"title": "Written"}, format="json")
+
+        response, replica_queries = self.get_tasks(self.users.user1)
+
+        assert created.status_code == status.HTTP_201_CREATED
+        assert "Written" in [task["title"] for task in response.data["results"]]
+        assert not replica_queries
+
+    def test_other_users_read_replica(self):
+        self.get_client(self.users.user1).post(self.get_url(), {"title": "Written"}, format="json")
+
+        _, replica_queries = self.get_tasks(self.users.user2, self.projects.project__user2)
+
+        assert replica_queries
+
+    def test_failed_write_does_not_pin(self):
+        response = self.get_client(self.users.user1).post(self.get_url(), {}, format="json")
+
+        _, replica_queries = self.get_tasks(self.users.user1)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert replica_queries
+
+    def test_transaction_reads_primary(self):
+        token = start_request(write=False)
+        try:
+            with transaction.atomic(), CaptureQueriesContext(connections["replica"]) as context:
+                list(Task.objects.all())
+        finally:
+            end_request(token, succeeded=True)
+
+        assert not context.captured_queries
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_client(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        return client
+
+    def get_url(self, project=None):
+        project = project or self.projects.project__user1
+        return reverse("task-list", kwargs={"user_id": project.user_id, "project_id": project.id})
+
+    def get_tasks(self, user, project=None):
+        with CaptureQueriesContext(connections["replica"]) as context:
+            response = self.get_client(user).get(self.get_url(project))
+        return response, context.captured_queries
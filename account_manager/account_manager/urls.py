@@ -20,6 +20,7 @@ from django.contrib import admin
 from django.urls import include, path
 
 from .docs import urlpatterns as docs
+from .internal import urlpatterns as internal
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -29,6 +30,7 @@ urlpatterns = [
 ]
 
 urlpatterns += docs
+urlpatterns += internal
 
 if settings.DEBUG:
     urlpatterns += [
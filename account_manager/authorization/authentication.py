@@ -0,0 +1,96 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from account_manager.db.router import set_request_user, use_primary
+
+USER_KEY = "auth:user:{}"
+
+
+def invalidate_cached_user(user_id: int):
+    """Drops the cached user, so the next request of the user reads the saved row"""
+    key = USER_KEY.format(user_id)
+    cache.delete(key)
+
+    # Dropped again on commit, a request authenticated meanwhile would cache the row read before the commit otherwise
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Authenticates like `JWTAuthentication`, but keeps the user of the token in the cache for
+    `AUTH_USER_CACHE_TIMEOUT` seconds, so most requests do not read the users table. A cache hit runs no query: the
+    revocation check compares the token with the hash of the cached password, only a miss reads the primary.
+
+    Saving or deleting a user drops the cached one (see `authorization.signals`). A user changed by a queryset
+    `update()`, or in another process with a per-process cache backend, keeps authenticating until the timeout.
+    """
+
+    async def aauthenticate(self, request):
+        """`authenticate()` of async views, a cache miss reads the user in the sync thread"""
+        header = self.get_header(request)
+        raw_token = self.get_raw_token(header) if header is not None else None
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    def get_user(self, validated_token):
+        user = self.get_cached_user(validated_token)
+        if user is None:
+            user = self.cache_user(validated_token, self.read_user(validated_token))
+        set_request_user(user.id)  # the reads of a user who just wrote go to the primary
+        return user
+
+    async def aget_user(self, validated_token):
+        # The async cache methods, a shared backend would block the event loop otherwise
+        user = await self.aget_cached_user(validated_token)
+        if user is None:
+            user = await self.acache_user(validated_token, await sync_to_async(self.read_user)(validated_token))
+        set_request_user(user.id)
+        return user
+
+    def read_user(self, validated_token):
+        # From the primary, the cached row outlives the lag of a replica
+        with use_primary():
+            return super().get_user(validated_token)  # only active users get through
+
+    def get_cached_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        user = cache.get(USER_KEY.format(user_id)) if user_id is not None else None
+        return self.check_revoked(validated_token, user)
+
+    async def aget_cached_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        user = await cache.aget(USER_KEY.format(user_id)) if user_id is not None else None
+        return self.check_revoked(validated_token, user)
+
+    def check_revoked(self, validated_token, user):
+        """Returns the cached user, unless the token was issued before the password changed"""
+        if user is not None and api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+        return user
+
+    def cache_user(self, validated_token, user):
+        cache.set(USER_KEY.format(validated_token[api_settings.USER_ID_CLAIM]), user, settings.AUTH_USER_CACHE_TIMEOUT)
+        return user
+
+    async def acache_user(self, validated_token, user):
+        key = USER_KEY.format(validated_token[api_settings.USER_ID_CLAIM])
+        await cache.aset(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+        return user
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Documents `CachedJWTAuthentication` as the same bearer JWT scheme"""
+
+    target_class = CachedJWTAuthentication
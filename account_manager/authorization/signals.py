@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from user.models import User
+
+from .authentication import invalidate_cached_user
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_cache(sender, instance: User, **kwargs):
+    invalidate_cached_user(instance.id)
@@ -0,0 +1 @@
+from tests.conftest import Users, api_client, django_db_setup, users, without_silk  # noqa: F401
@@ -0,0 +1,105 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from project.models import Project
+
+from .conftest import Users
+
+
+# ----- CachedJWTAuthentication Tests ----------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestCachedJWTAuthentication:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, api_client, users):
+        self.client = api_client
+        self.users: Users = users
+        self.user = users.user1
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    def test_user_is_read_once(self):
+        assert self.count_user_queries() == 1
+        assert self.count_user_queries() == 0
+
+    @pytest.mark.parametrize("check_revoke_token", [False, True])
+    def test_cached_user_reads_nothing(self, monkeypatch, check_revoke_token):
+        monkeypatch.setattr(api_settings, "CHECK_REVOKE_TOKEN", check_revoke_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        project = Project.objects.create(user=self.user, title="Authenticated")
+        url = reverse("task-list", kwargs={"user_id": self.user.id, "project_id": project.id})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        # The revocation check compares the cached password hash, the task list itself never reads users
+        assert response.status_code == status.HTTP_200_OK
+        assert not [query for query in context.captured_queries if '"user_user"' in query["sql"]]
+
+    def test_save_invalidates_user(self):
+        self.client.get(self.get_url())
+
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(self.get_url())
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_delete_invalidates_user(self):
+        self.client.get(self.get_url())
+
+        self.user.delete()
+
+        response = self.client.get(self.get_url())
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_users_are_cached_separately(self):
+        self.client.get(self.get_url())
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.users.user2)}")
+
+        response = self.client.get(reverse("user-detail", kwargs={"pk": self.users.user2.id}))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["id"] == self.users.user2.id
+
+    def test_token_without_user(self):
+        token = AccessToken()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = self.client.get(self.get_url())
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revoked_token_is_rejected_from_cache(self, monkeypatch):
+        # simplejwt modules keep the settings object they imported, the `settings` fixture would not reach them
+        monkeypatch.setattr(api_settings, "CHECK_REVOKE_TOKEN", True)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.client.get(self.get_url())
+        old_token = AccessToken.for_user(self.user)
+
+        self.user.set_password("new password")
+        self.user.save()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        assert self.client.get(self.get_url()).status_code == status.HTTP_200_OK  # caches the changed user
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {old_token}")
+        assert self.client.get(self.get_url()).status_code == status.HTTP_401_UNAUTHORIZED
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self):
+        return reverse("user-detail", kwargs={"pk": self.user.id})
+
+    def count_user_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.get_url())
+
+        assert response.status_code == status.HTTP_200_OK
+        authenticate = [query for query in context.captured_queries if 'FROM "user_user"' in query["sql"]]
+        return len(authenticate) - 1  # the view reads the user once more
@@ -0,0 +1,81 @@
+import pytest
+
+from tests.conftest import without_silk  # noqa: F401
+
+from .utils import BenchmarkResult, LatencyResult, get_change, load_results, measure, measure_latency, save_results
+
+_results: list[BenchmarkResult | LatencyResult] = []
+_baseline: dict[str, float] = {}
+
+
+# ----- Options --------------------------------------------------------------------------------------------------------
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--benchmark-save", metavar="PATH", help="Write the results as JSON, to compare a later run with.")
+    group.addoption(
+        "--benchmark-compare",
+        metavar="PATH",
+        help="Fail the benchmarks which are slower than in the JSON results of a previous run.",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=20.0,
+        metavar="PERCENT",
+        help="Slowdown per operation which fails a compared benchmark, 20 by default.",
+    )
+
+
+def pytest_configure(config):
+    if path := config.getoption("benchmark_compare"):
+        _baseline.update(load_results(path))
+
+
+def record(config, result: BenchmarkResult | LatencyResult):
+    _results.append(result)
+    change, threshold = get_change(result, _baseline), config.getoption("benchmark_threshold")
+    if change is not None and change > threshold:
+        pytest.fail(f"{result.name} is {change:.1f}% slower than the compared run, above the threshold of {threshold}%")
+
+
+# ----- Benchmark Fixtures ---------------------------------------------------------------------------------------------
+@pytest.fixture
+def benchmark(pytestconfig):
+    def _benchmark(name, func, operations, repeat=3):
+        result = measure(name, func, operations, repeat)
+        record(pytestconfig, result)
+        return result
+
+    return _benchmark
+
+
+@pytest.fixture
+def latency_benchmark(pytestconfig):
+    def _latency_benchmark(name, func, operations, warmup=10):
+        result = measure_latency(name, func, operations, warmup)
+        record(pytestconfig, result)
+        return result
+
+    return _latency_benchmark
+
+
+# ----- Reporting ------------------------------------------------------------------------------------------------------
+def pytest_sessionfinish(session):
+    if _results and (path := session.config.getoption("benchmark_save")):
+        save_results(path, _results)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+
+    terminalreporter.section("benchmarks")
+    for result in _results:
+        if isinstance(result, LatencyResult):
+            p50, p99 = (result.percentile(percent) * 1000 for percent in (50, 99))
+            timing = f"{len(result.latencies):>10} ops   p50 {p50:>7.3f} ms   p99 {p99:>7.3f} ms"
+        else:
+            timing = f"{result.operations:>10} ops {result.seconds:>9.4f} s {result.ops_per_second:>12.1f} ops/s"
+        change = get_change(result, _baseline)
+        timing += f" {change:>+8.1f}%" if change is not None else ""
+        terminalreporter.write_line(f"{result.name:<56} {timing}")
@@ -0,0 +1,61 @@
+import asyncio
+import importlib
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import clear_url_caches, reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account_manager import urls as root_urls
+from project import urls as project_urls
+from project.models import Project, Task
+from user.models import User
+
+CONCURRENCY = 500
+PROJECTS = 20
+TASKS = 20
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def project(db, without_silk):  # noqa: F811
+    user = User.objects.create_user("async", "async@gmail.com", "password")
+    projects = Project.objects.bulk_create(Project(user=user, title=f"Project {index}") for index in range(PROJECTS))
+    Task.objects.bulk_create(Task(project=projects[0], title=f"Task {index}") for index in range(TASKS))
+    return projects[0]
+
+
+@pytest.fixture
+def read_views(request, settings):
+    """Reloads the URLs with the `ASYNC_VIEWS` of the test, and with the original one afterwards"""
+    original = settings.ASYNC_VIEWS
+    settings.ASYNC_VIEWS = request.param
+    reload_urls()
+    yield request.param
+    settings.ASYNC_VIEWS = original
+    reload_urls()
+
+
+def reload_urls():
+    importlib.reload(project_urls)
+    importlib.reload(root_urls)
+    clear_url_caches()
+
+
+# ----- Async Views Benchmarks -----------------------------------------------------------------------------------------
+@pytest.mark.parametrize("read_views", [False, True], ids=["sync", "async"], indirect=True)
+@pytest.mark.parametrize("url_name", ["task-list", "project-list"])
+def test_concurrent_reads(benchmark, project, read_views, url_name):
+    """`CONCURRENCY` GETs in flight at once through the ASGI handler, like an ASGI server under a burst"""
+    client, headers = AsyncClient(), {"Authorization": f"Bearer {AccessToken.for_user(project.user)}"}
+    kwargs = {"project_id": project.id} if url_name == "task-list" else {}
+    url = reverse(url_name, kwargs={"user_id": project.user_id, **kwargs})
+    query_params = {"expand": "stats"}  # the stats are not cached, every request runs its queries
+
+    async def burst():
+        responses = await asyncio.gather(*(client.get(url, query_params, headers=headers) for _ in range(CONCURRENCY)))
+        assert all(response.status_code == 200 for response in responses)
+
+    name = f"GET {url_name} x{CONCURRENCY} concurrent [{'async' if read_views else 'sync'} views]"
+    benchmark(name, async_to_sync(burst), CONCURRENCY)
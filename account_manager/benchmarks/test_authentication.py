@@ -0,0 +1,75 @@
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account_manager.db.router import end_request, start_request
+from authorization.authentication import CachedJWTAuthentication
+from project.models import Project, Task
+from user.models import User
+
+REQUESTS = 2_000
+TASKS = 20
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def project(db, without_silk):  # noqa: F811
+    user = User.objects.create_user("auth", "auth@gmail.com", "password")
+    project = Project.objects.create(user=user, title="Authentication")
+    Task.objects.bulk_create(Task(project=project, title=f"Task {index}") for index in range(TASKS))
+    return project
+
+
+# ----- Authentication Benchmarks --------------------------------------------------------------------------------------
+@pytest.mark.parametrize("authentication_class", [JWTAuthentication, CachedJWTAuthentication])
+@pytest.mark.parametrize("url_name", ["user-detail", "task-list"])
+def test_authenticated_request(latency_benchmark, monkeypatch, project, authentication_class, url_name):
+    monkeypatch.setattr(APIView, "authentication_classes", [authentication_class])
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(project.user)}")
+    if url_name == "user-detail":
+        url = reverse(url_name, kwargs={"pk": project.user_id})
+    else:
+        url = reverse(url_name, kwargs={"user_id": project.user_id, "project_id": project.id})
+
+    def run():
+        response = client.get(url)
+        assert response.status_code == 200
+
+    with CaptureQueriesContext(connection) as context:
+        run()
+        run()
+    queries = len(context.captured_queries) // 2
+
+    name = f"GET {url_name} [{authentication_class.__name__}, queries: {queries}]"
+    latency_benchmark(name, run, REQUESTS)
+
+
+@pytest.mark.parametrize("authentication_class", [JWTAuthentication, CachedJWTAuthentication])
+def test_authenticate(latency_benchmark, project, authentication_class):
+    """`authenticate()` alone, the rest of a request varies more than the user lookup takes"""
+    authentication = authentication_class()
+    header = f"Bearer {AccessToken.for_user(project.user)}"
+    request = Request(RequestFactory().get("/", HTTP_AUTHORIZATION=header))
+
+    def run():
+        token = start_request(write=False)  # the routing of a read request, like `DatabaseRoutingMiddleware`
+        try:
+            user, _ = authentication.authenticate(request)
+        finally:
+            end_request(token, succeeded=True)
+        assert user.id == project.user_id
+
+    with CaptureQueriesContext(connection) as context:
+        run()
+        run()
+    queries = len(context.captured_queries) // 2
+
+    latency_benchmark(f"authenticate [{authentication_class.__name__}, queries: {queries}]", run, REQUESTS)
@@ -0,0 +1,26 @@
+import pytest
+
+from project.crypto import get_cipher
+
+PLAINTEXT = "correct horse battery staple"
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def tokens():
+    return get_cipher().encrypt_many([PLAINTEXT] * 100_000)
+
+
+# ----- Batch Decrypt Benchmarks ---------------------------------------------------------------------------------------
+@pytest.mark.parametrize("rows", [1_000, 10_000, 100_000])
+@pytest.mark.parametrize("max_workers", [1, 4, 8])
+def test_decrypt_many(benchmark, tokens, rows, max_workers):
+    values = tokens[:rows]
+    mode = "serial" if max_workers == 1 else f"pool of {max_workers}"
+
+    def run():
+        get_cipher().decrypt_many(values, max_workers)
+
+    result = benchmark(f"decrypt_many {rows} rows [{mode}]", run, rows)
+
+    assert result.operations == rows
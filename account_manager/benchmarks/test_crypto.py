@@ -0,0 +1,42 @@
+import pytest
+from cryptography.fernet import Fernet
+from django.conf import settings
+
+from project.crypto import get_cipher
+
+OPERATIONS = 5_000
+PLAINTEXT = "correct horse battery staple"
+
+
+# ----- Baseline: a new Fernet for every call --------------------------------------------------------------------------
+def encrypt_with_new_fernet(plaintext: str) -> str:
+    return Fernet(settings.ENCRYPTION_KEYS[0].encode()).encrypt(plaintext.encode()).decode()
+
+
+def decrypt_with_new_fernet(token: str) -> str:
+    return Fernet(settings.ENCRYPTION_KEYS[0].encode()).decrypt(token.encode()).decode()
+
+
+# ----- Cipher Benchmarks ----------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("mode", ["new fernet per call", "cached cipher"])
+def test_encrypt(benchmark, mode):
+    encrypt = encrypt_with_new_fernet if mode == "new fernet per call" else get_cipher().encrypt
+
+    def run():
+        for _ in range(OPERATIONS):
+            encrypt(PLAINTEXT)
+
+    benchmark(f"encrypt [{mode}]", run, OPERATIONS)
+
+
+@pytest.mark.parametrize("mode", ["new fernet per call", "cached cipher"])
+def test_decrypt(benchmark, mode):
+    baseline = mode == "new fernet per call"
+    decrypt = decrypt_with_new_fernet if baseline else get_cipher().decrypt
+    token = encrypt_with_new_fernet(PLAINTEXT) if baseline else get_cipher().encrypt(PLAINTEXT)  # without the prefix
+
+    def run():
+        for _ in range(OPERATIONS):
+            decrypt(token)
+
+    benchmark(f"decrypt [{mode}]", run, OPERATIONS)
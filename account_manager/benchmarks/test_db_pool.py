@@ -0,0 +1,66 @@
+import pytest
+from django.db import close_old_connections, connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account_manager.db.pool import close_pool
+from project.models import Project, Task
+from user.models import User
+
+REQUESTS = 2_000
+TASKS = 20
+MODES = {
+    # "mode": (CONN_MAX_AGE, OPTIONS["pool"])
+    "connection per request": (0, None),
+    "persistent connection": (60, None),
+    "pool": (0, {"min_size": 2, "max_size": 10}),
+}
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def project(transactional_db, without_silk):  # noqa: F811
+    """Committed, the connection is closed between the requests"""
+    user = User.objects.create_user("pool", "pool@gmail.com", "password")
+    project = Project.objects.create(user=user, title="Pool")
+    Task.objects.bulk_create(Task(project=project, title=f"Task {index}") for index in range(TASKS))
+    return project
+
+
+@pytest.fixture
+def connection_mode(request):
+    """Reconfigures the default connection for the mode of the test, and back afterwards"""
+    settings_dict = connection.settings_dict
+    original = settings_dict["CONN_MAX_AGE"], settings_dict["OPTIONS"]
+    conn_max_age, pool = MODES[request.param]
+
+    connection.close()
+    options = {key: value for key, value in original[1].items() if key != "pool"}
+    settings_dict["CONN_MAX_AGE"], settings_dict["OPTIONS"] = conn_max_age, {**options, "pool": pool}
+    yield request.param
+
+    connection.close()
+    close_pool(connection.alias)
+    settings_dict["CONN_MAX_AGE"], settings_dict["OPTIONS"] = original
+
+
+# ----- Connection Pool Benchmarks -------------------------------------------------------------------------------------
+@pytest.mark.parametrize("connection_mode", list(MODES), indirect=True)
+def test_request_latency(latency_benchmark, project, connection_mode):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(project.user)}")
+    url = reverse("task-list", kwargs={"user_id": project.user_id, "project_id": project.id})
+    backend_pids = set()
+
+    def run():
+        # The test client does not close the connection at the end of a request like the request handler does
+        response = client.get(url)
+        backend_pids.add(connection.connection.info.backend_pid)
+        close_old_connections()
+        assert response.status_code == 200
+
+    for _ in range(20):
+        run()
+    name = f"GET task-list [{connection_mode}, {len(backend_pids)}/20 connections]"
+    latency_benchmark(name, run, REQUESTS)
@@ -0,0 +1,110 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project.crypto import get_cipher
+from project.models import Credential, Project
+from project.serializers import CredentialSerializer, ProjectDetailSerializer
+from user.models import User
+
+CREDENTIALS = 1_000
+SAVES = 200
+REQUESTS = 200
+PAGE_SIZE = 20
+PASSWORD = "correct horse battery staple"
+
+INSERT_TASKS = """
+    INSERT INTO project_task (project_id, title, description, is_active, created_at, updated_at)
+    SELECT %s, 'Task ' || n, 'Routine maintenance', n %% 4 <> 0, now(), now() FROM generate_series(1, %s) AS n
+"""
+INSERT_CREDENTIALS = """
+    INSERT INTO project_credential (project_id, email, password, service_name, username, created_at, updated_at)
+    SELECT %s, 'user@gmail.com', %s, 'Service ' || n, 'user' || n, now(), now() FROM generate_series(1, %s) AS n
+"""
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def project(db, without_silk):  # noqa: F811
+    user = User.objects.create_user("hot", "hot@gmail.com", "password")
+    return Project.objects.create(user=user, title="Hot paths")
+
+
+def fill(project: Project, rows: int):
+    """Adds `rows` tasks and credentials, the passwords encrypted like `Credential.save()` does"""
+    with connection.cursor() as cursor:
+        cursor.execute(INSERT_TASKS, [project.id, rows])
+        cursor.execute(INSERT_CREDENTIALS, [project.id, get_cipher().encrypt(PASSWORD), rows])
+        cursor.execute("ANALYZE project_task, project_credential")
+
+
+# ----- Serializer Benchmarks ------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("reveal_password", [False, True])
+def test_credential_to_representation(benchmark, reveal_password):
+    password = get_cipher().encrypt(PASSWORD)
+    credentials = [
+        Credential(id=index, project_id=1, email="user@gmail.com", password=password, service_name=f"Service {index}")
+        for index in range(CREDENTIALS)
+    ]
+    serializer = CredentialSerializer(context={"reveal_password": reveal_password})
+
+    def run():
+        for credential in credentials:
+            serializer.to_representation(credential)
+
+    mode = "revealed" if reveal_password else "masked"
+    benchmark(f"CredentialSerializer.to_representation [{mode}]", run, CREDENTIALS)
+
+
+@pytest.mark.parametrize("rows", [100, 1_000])
+def test_project_detail_serializer(benchmark, project, rows):
+    fill(project, rows)
+    instance = Project.objects.prefetch_related("credentials", "tasks").get(id=project.id)
+
+    def run():
+        data = ProjectDetailSerializer(instance).data
+        assert len(data["tasks"]) == len(data["credentials"]) == rows
+
+    benchmark(f"ProjectDetailSerializer {rows} tasks + credentials", run, 2 * rows)
+
+
+# ----- Model Benchmarks -----------------------------------------------------------------------------------------------
+def test_credential_save(benchmark, project):
+    def run():
+        for index in range(SAVES):
+            Credential(
+                project=project, email="user@gmail.com", password=PASSWORD, service_name=f"Service {index}"
+            ).save()
+
+    benchmark("Credential.save [encrypts the password]", run, SAVES)
+
+
+# ----- View Benchmarks ------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("basename", ["task", "credential"])
+def test_base_viewset_list(latency_benchmark, project, basename):
+    fill(project, 10_000)
+    client = APIClient()
+    client.force_authenticate(project.user)
+    url = reverse(f"{basename}-list", kwargs={"user_id": project.user_id, "project_id": project.id})
+
+    def run():
+        response = client.get(url, {"page_size": PAGE_SIZE})
+        assert len(response.data["results"]) == PAGE_SIZE
+
+    latency_benchmark(f"GET {basename}-list, page of {PAGE_SIZE} of 10000", run, REQUESTS)
+
+
+@pytest.mark.parametrize("basename", ["task", "credential"])
+def test_base_viewset_retrieve(latency_benchmark, project, basename):
+    fill(project, 10_000)
+    client = APIClient()
+    client.force_authenticate(project.user)
+    instance = getattr(project, f"{basename}s").last()
+    path_params = {"user_id": project.user_id, "project_id": project.id, "id": instance.id}
+    url = reverse(f"{basename}-detail", kwargs=path_params)
+
+    def run():
+        assert client.get(url).status_code == 200
+
+    latency_benchmark(f"GET {basename}-detail of 10000", run, REQUESTS)
@@ -0,0 +1,34 @@
+import pytest
+
+from project.importer import AccountImporter
+from project.models import Project
+from user.models import User
+
+ROWS = 50_000
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def project(db):
+    user = User.objects.create_user("importer", "importer@gmail.com", "password")
+    return Project.objects.create(user=user, title="Import")
+
+
+# ----- Import Benchmarks ----------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("resource", ["task", "credential"])
+@pytest.mark.parametrize("use_copy", [False, True])
+def test_import_accounts(benchmark, project, resource, use_copy):
+    if resource == "task":
+        rows = [{"title": f"Task {index}", "remind_at": "2030-01-01T10:00:00Z"} for index in range(ROWS)]
+    else:
+        rows = [
+            {"email": "user@gmail.com", "password": f"password{index}", "service_name": "GitHub"}
+            for index in range(ROWS)
+        ]
+    importer = AccountImporter(project, resource, batch_size=1000, use_copy=use_copy)
+
+    def run():
+        importer.run(iter(rows))
+
+    mode = "COPY" if use_copy else "bulk_create"
+    benchmark(f"import {ROWS} {resource}s [{mode}]", run, ROWS, repeat=1)
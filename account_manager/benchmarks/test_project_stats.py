@@ -0,0 +1,66 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project.models import Project
+from user.models import User
+
+PROJECTS = 1_000
+TASKS_PER_PROJECT = 1_000
+CREDENTIALS_PER_PROJECT = 10
+PAGE_SIZE = 20
+
+# Rows are generated by PostgreSQL, building a million tasks in Python would take longer than the benchmarks
+INSERT_TASKS = """
+    INSERT INTO project_task (project_id, title, remind_at, is_active, created_at, updated_at)
+    SELECT project.id, 'Task ' || n, CASE WHEN n %% 10 = 0 THEN now() + n * interval '1 minute' END, n %% 4 <> 0,
+           now(), now()
+    FROM project_project AS project CROSS JOIN generate_series(1, %s) AS n
+    WHERE project.user_id = %s
+"""
+INSERT_CREDENTIALS = """
+    INSERT INTO project_credential (project_id, email, password, service_name, created_at, updated_at)
+    SELECT project.id, 'user@gmail.com', 'password', 'Service ' || n, now(), now()
+    FROM project_project AS project CROSS JOIN generate_series(1, %s) AS n
+    WHERE project.user_id = %s
+"""
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def dashboard_user(db, without_silk):  # noqa: F811
+    user = User.objects.create_user("dashboard", "dashboard@gmail.com", "password")
+    Project.objects.bulk_create(Project(user=user, title=f"Project {index}") for index in range(PROJECTS))
+    with connection.cursor() as cursor:
+        cursor.execute(INSERT_TASKS, [TASKS_PER_PROJECT, user.id])
+        cursor.execute(INSERT_CREDENTIALS, [CREDENTIALS_PER_PROJECT, user.id])
+        cursor.execute("ANALYZE project_project, project_task, project_credential")
+    return user
+
+
+# ----- Project Stats Benchmarks ---------------------------------------------------------------------------------------
+@pytest.mark.parametrize("mode", ["detail per project", "list ?expand=stats"])
+def test_project_dashboard(benchmark, dashboard_user, mode):
+    client = APIClient()
+    client.force_authenticate(dashboard_user)
+    url = reverse("project-list", kwargs={"user_id": dashboard_user.id})
+
+    def run():
+        cache.clear()  # every run reads the database, not the responses cached by the previous one
+        if mode == "list ?expand=stats":
+            projects = client.get(url, {"expand": "stats", "page_size": PAGE_SIZE}).data["results"]
+            stats = [project["stats"] for project in projects]
+        else:
+            projects = client.get(url, {"page_size": PAGE_SIZE}).data["results"]
+            path_params = {"user_id": dashboard_user.id}
+            details = [
+                client.get(reverse("project-detail", kwargs={**path_params, "project_id": project["id"]}))
+                for project in projects
+            ]
+            stats = [sum(task["is_active"] for task in detail.data["tasks"]) for detail in details]
+        assert len(stats) == PAGE_SIZE
+
+    name = f"dashboard of {PROJECTS} projects x {TASKS_PER_PROJECT} tasks, page of {PAGE_SIZE} [{mode}]"
+    benchmark(name, run, PAGE_SIZE)
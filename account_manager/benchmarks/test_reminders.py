@@ -0,0 +1,35 @@
+import pytest
+from django.utils import timezone
+
+from project.models import Project, Task
+from project.notifiers import LocMemNotifier
+from project.reminders import dispatch_due_reminders
+from user.models import User
+
+REMINDERS = 100_000
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def due_tasks(transactional_db):
+    """Every batch has to commit like in production, dead index entries of sent tasks are never pruned otherwise"""
+    user = User.objects.create_user("reminders", "reminders@gmail.com", "password", telegram_id=1)
+    project = Project.objects.create(user=user, title="Reminders")
+    remind_at = timezone.now()
+    tasks = (Task(project=project, title=f"Task {index}", remind_at=remind_at) for index in range(REMINDERS))
+    Task.objects.bulk_create(tasks, batch_size=5_000)
+    return project
+
+
+# ----- Reminder Dispatch Benchmarks -----------------------------------------------------------------------------------
+@pytest.mark.parametrize("batch_size", [100, 1_000])
+def test_dispatch_due_reminders(benchmark, due_tasks, batch_size):
+    notifier = LocMemNotifier()
+    LocMemNotifier.outbox.clear()
+
+    def run():
+        dispatch_due_reminders(notifier, batch_size)
+
+    benchmark(f"dispatch {REMINDERS} reminders [batch of {batch_size}]", run, REMINDERS, repeat=1)
+
+    assert sum(task.project_id == due_tasks.id for task in LocMemNotifier.outbox) == REMINDERS
@@ -0,0 +1,66 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project.models import Project
+from user.models import User
+
+USERS = 100
+PROJECTS_PER_USER = 10
+TASKS_PER_PROJECT = 1_000
+CREDENTIALS_PER_PROJECT = 100
+PAGE_SIZE = 20
+
+# A million tasks and 100k credentials generated by PostgreSQL, the search vectors are filled by the database
+INSERT_TASKS = """
+    INSERT INTO project_task (project_id, title, description, is_active, created_at, updated_at)
+    SELECT project.id,
+           (ARRAY['deploy', 'invoice', 'backup', 'rotate', 'review', 'migrate', 'audit', 'renew'])[1 + n %% 8]
+               || ' ' || (ARRAY['server', 'keys', 'domain', 'database', 'billing'])[1 + n %% 5],
+           CASE WHEN n %% 1000 = 0 THEN 'Kubernetes cluster upgrade' ELSE 'Routine maintenance' END,
+           true, now(), now()
+    FROM project_project AS project CROSS JOIN generate_series(1, %s) AS n
+"""
+INSERT_CREDENTIALS = """
+    INSERT INTO project_credential (project_id, email, password, service_name, username, login_url, created_at,
+                                    updated_at)
+    SELECT project.id, 'user@gmail.com', 'password',
+           (ARRAY['AWS', 'GitHub', 'GitLab', 'Google', 'Heroku', 'Slack', 'Stripe'])[1 + n %% 7], 'user' || n %% 50,
+           'https://' || (ARRAY['aws.amazon.com', 'github.com', 'gitlab.com', 'google.com'])[1 + n %% 4] || '/login',
+           now(), now()
+    FROM project_project AS project CROSS JOIN generate_series(1, %s) AS n
+"""
+
+
+# ----- Fixtures -------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def search_user(db, without_silk):  # noqa: F811
+    users = User.objects.bulk_create(
+        User(username=f"search{index}", email=f"search{index}@gmail.com") for index in range(USERS)
+    )
+    Project.objects.bulk_create(
+        Project(user=user, title=f"Project {index}") for user in users for index in range(PROJECTS_PER_USER)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(INSERT_TASKS, [TASKS_PER_PROJECT])
+        cursor.execute(INSERT_CREDENTIALS, [CREDENTIALS_PER_PROJECT])
+        cursor.execute("ANALYZE project_project, project_task, project_credential")
+    return users[0]
+
+
+# ----- Search Benchmarks ----------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("query", ["kubernetes", "backup server", "aws", "gi"])
+def test_search(benchmark, search_user, query):
+    client = APIClient()
+    client.force_authenticate(search_user)
+    url = reverse("project-search", kwargs={"user_id": search_user.id})
+    searches = 10
+
+    def run():
+        for _ in range(searches):
+            response = client.get(url, {"q": query, "page_size": PAGE_SIZE})
+            assert response.data["results"]
+
+    rows = USERS * PROJECTS_PER_USER * TASKS_PER_PROJECT
+    benchmark(f"search '{query}' in {rows} tasks, page of {PAGE_SIZE}", run, searches)
@@ -0,0 +1,102 @@
+import json
+import math
+import subprocess
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Callable
+
+
+class BenchmarkResult(namedtuple("BenchmarkResult", ["name", "operations", "seconds"])):
+    __slots__ = ()
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.operations / self.seconds if self.seconds else float("inf")
+
+    @property
+    def seconds_per_operation(self) -> float:
+        return self.seconds / self.operations
+
+    def as_json(self) -> dict:
+        return {
+            "operations": self.operations,
+            "seconds": self.seconds,
+            "seconds_per_operation": self.seconds_per_operation,
+        }
+
+
+def measure(name: str, func: Callable, operations: int, repeat: int = 3) -> BenchmarkResult:
+    """Runs `func` `repeat` times and keeps the fastest run; `func` must perform `operations` operations per call."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return BenchmarkResult(name, operations, min(timings))
+
+
+class LatencyResult(namedtuple("LatencyResult", ["name", "latencies"])):
+    __slots__ = ()
+
+    @property
+    def seconds_per_operation(self) -> float:
+        """The median latency, steadier than the mean when a few operations stall"""
+        return self.percentile(50)
+
+    def percentile(self, percent: float) -> float:
+        """Latency in seconds that `percent`% of the operations did not exceed (nearest rank)"""
+        latencies = sorted(self.latencies)
+        return latencies[max(math.ceil(len(latencies) * percent / 100) - 1, 0)]
+
+    def as_json(self) -> dict:
+        return {
+            "operations": len(self.latencies),
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "seconds_per_operation": self.seconds_per_operation,
+        }
+
+
+def measure_latency(name: str, func: Callable, operations: int, warmup: int = 10) -> LatencyResult:
+    """Times each of `operations` calls of `func`, after `warmup` calls that are not recorded."""
+    for _ in range(warmup):
+        func()
+
+    latencies = []
+    for _ in range(operations):
+        started = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - started)
+    return LatencyResult(name, latencies)
+
+
+# ----- Stored Results -------------------------------------------------------------------------------------------------
+def get_commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def save_results(path: str, results: list[BenchmarkResult | LatencyResult]):
+    """Writes the results by name as JSON, with the commit they were measured on"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"commit": get_commit(), "results": {result.name: result.as_json() for result in results}}
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def load_results(path: str) -> dict[str, float]:
+    """Reads the seconds per operation by name from the results written by `save_results()`"""
+    results = json.loads(Path(path).read_text())["results"]
+    return {name: result["seconds_per_operation"] for name, result in results.items()}
+
+
+def get_change(result: BenchmarkResult | LatencyResult, baseline: dict[str, float]) -> float | None:
+    """Percentage by which the result is slower (positive) or faster (negative) than in `baseline`"""
+    previous = baseline.get(result.name)
+    if not previous:
+        return None
+    return (result.seconds_per_operation / previous - 1) * 100
@@ -0,0 +1,74 @@
+import hashlib
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+USER_VERSION_KEY = "projects:user:{}:version"
+PROJECT_VERSION_KEY = "projects:project:{}:version"
+
+
+def get_versions(keys: list[str]) -> list[int]:
+    versions = cache.get_many(keys)
+    for key in set(keys) - set(versions):
+        # A missing counter starts at the current time, so it never restarts at a version an old entry was stored with
+        cache.add(key, time.time_ns(), timeout=None)
+        versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(keys: list[str]) -> list[int]:
+    """`get_versions()` of async views, which must not block the event loop on a shared cache"""
+    versions = await cache.aget_many(keys)
+    for key in set(keys) - set(versions):
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(key: str):
+    try:
+        cache.incr(key)
+    except ValueError:
+        get_versions([key])
+
+
+def invalidate(keys: list[str]):
+    for key in keys:
+        bump_version(key)
+
+    # Bumped again on commit, a response cached meanwhile from data read before the commit would be stale otherwise
+    transaction.on_commit(lambda: [bump_version(key) for key in keys])
+
+
+def invalidate_user(user_id: int):
+    """Invalidates the cached project list of the user"""
+    invalidate([USER_VERSION_KEY.format(user_id)])
+
+
+def invalidate_projects(project_ids: Iterable[int]):
+    """Invalidates the cached details of the projects, e.g. after their credentials or tasks changed"""
+    invalidate([PROJECT_VERSION_KEY.format(project_id) for project_id in set(project_ids)])
+
+
+def get_response_key(user_id: int, full_path: str, project_id: int | None = None) -> str:
+    """Cache key of a project list (or detail, with `project_id`) response, made stale by bumping the versions"""
+    return make_response_key(user_id, full_path, get_versions(get_version_keys(user_id, project_id)))
+
+
+async def aget_response_key(user_id: int, full_path: str, project_id: int | None = None) -> str:
+    """`get_response_key()` of async views"""
+    return make_response_key(user_id, full_path, await aget_versions(get_version_keys(user_id, project_id)))
+
+
+def get_version_keys(user_id: int, project_id: int | None) -> list[str]:
+    keys = [USER_VERSION_KEY.format(user_id)]
+    if project_id is not None:
+        keys.append(PROJECT_VERSION_KEY.format(project_id))
+    return keys
+
+
+def make_response_key(user_id: int, full_path: str, versions: list[int]) -> str:
+    path_hash = hashlib.md5(full_path.encode(), usedforsecurity=False).hexdigest()
+    return f"projects:response:{user_id}:{'.'.join(map(str, versions))}:{path_hash}"
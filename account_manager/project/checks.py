@@ -0,0 +1,14 @@
+from django.core.checks import Error, Tags, register
+from django.core.exceptions import ImproperlyConfigured
+
+from .crypto import get_cipher
+
+
+@register(Tags.security)
+def check_encryption_key(app_configs, **kwargs):
+    """Fails fast on startup when credential passwords could not be encrypted or decrypted."""
+    try:
+        get_cipher()
+    except ImproperlyConfigured as exc:
+        return [Error(str(exc), hint="Generate one with `Fernet.generate_key()`.", id="project.E001")]
+    return []
@@ -0,0 +1,101 @@
+import json
+from itertools import groupby, islice
+from operator import attrgetter
+from typing import AsyncIterator, Generator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Credential, Project, Task
+from .serializers import CredentialSerializer, ProjectSerializer, TaskSerializer
+
+
+class ProjectGroups:
+    """Children read in `project_id` order, handed out one project at a time like the inner side of a merge join"""
+
+    def __init__(self, children: Iterable):
+        self.groups = groupby(children, key=attrgetter("project_id"))
+        self.current = next(self.groups, None)
+
+    def pop(self, project_id: int) -> Iterator:
+        # Children of a project created after the projects were read are skipped
+        while self.current is not None and self.current[0] < project_id:
+            self.current = next(self.groups, None)
+
+        if self.current is not None and self.current[0] == project_id:
+            yield from self.current[1]
+            self.current = next(self.groups, None)
+
+
+class ProjectTreeExport:
+    """
+    Streams every project of a user with its credentials and tasks, as one JSON document or as NDJSON lines.
+
+    Projects, credentials and tasks are read with three server-side cursors ordered by project and merged on the fly,
+    so memory use stays the same however large the account is. Passwords are masked unless `reveal_passwords` is set.
+    Under ASGI the output has to go through `aiter()`.
+    """
+
+    chunk_size = 2000
+    batch_size = 100  # strings read per hop to the sync thread by `aiter()`
+
+    def __init__(self, user_id: int, reveal_passwords: bool = False):
+        self.user_id = user_id
+        self.serializers = {
+            "project": ProjectSerializer(),
+            "credential": CredentialSerializer(context={"reveal_password": reveal_passwords}),
+            "task": TaskSerializer(),
+        }
+
+    def iter_json(self) -> Iterator[str]:
+        """`{"projects": [{...project, "credentials": [...], "tasks": [...]}, ...]}`, one project at a time"""
+        yield '{"projects": ['
+        for index, (project, children) in enumerate(self.iter_tree()):
+            yield ("," if index else "") + self.dumps("project", project)[:-1]
+            for resource, instances in children.items():
+                yield f', "{resource}s": ['
+                yield from (
+                    ("," if position else "") + self.dumps(resource, obj) for position, obj in enumerate(instances)
+                )
+                yield "]"
+            yield "}"
+        yield "]}\n"
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """One `{"type": ..., ...}` line per object, every project is followed by its credentials and tasks"""
+        for project, children in self.iter_tree():
+            yield self.dumps("project", project, with_type=True) + "\n"
+            for resource, instances in children.items():
+                yield from (self.dumps(resource, obj, with_type=True) + "\n" for obj in instances)
+
+    async def aiter(self, chunks: Generator[str, None, None]) -> AsyncIterator[str]:
+        """
+        Streams `iter_json()` or `iter_ndjson()` to an ASGI server, which reads a sync iterator whole before sending
+        anything. The strings are read `batch_size` at a time in the sync thread, where the transaction of
+        `iter_tree()` stays open between the batches.
+        """
+        read_batch = sync_to_async(lambda: list(islice(chunks, self.batch_size)))
+        try:
+            while batch := await read_batch():
+                yield "".join(batch)
+        finally:
+            await sync_to_async(chunks.close)()  # ends the transaction in the thread which opened it
+
+    def iter_tree(self) -> Iterator[tuple[Project, dict[str, Iterator]]]:
+        with transaction.atomic():  # server-side cursors live until the end of the transaction
+            projects = Project.objects.filter(user_id=self.user_id).order_by("id")
+            credentials = ProjectGroups(self.iter_children(Credential))
+            tasks = ProjectGroups(self.iter_children(Task))
+            for project in projects.iterator(self.chunk_size):
+                yield project, {"credential": credentials.pop(project.id), "task": tasks.pop(project.id)}
+
+    def iter_children(self, model) -> Iterator:
+        queryset = model.objects.filter(project__user_id=self.user_id).order_by("project_id", "id")
+        return queryset.iterator(self.chunk_size)
+
+    def dumps(self, resource: str, instance, with_type: bool = False) -> str:
+        representation = self.serializers[resource].to_representation(instance)
+        if with_type:
+            representation = {"type": resource, **representation}
+        return json.dumps(representation, cls=JSONEncoder)
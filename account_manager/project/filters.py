@@ -0,0 +1,79 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import BooleanField, DateTimeField
+from rest_framework import filters, serializers
+from rest_framework.exceptions import ValidationError
+
+
+class WhitelistFilter(filters.BaseFilterBackend):
+    """
+    Filters by the lookups whitelisted in `filter_fields` of the view, e.g. `{"remind_at": ["gte", "lte"]}` accepts
+    `?remind_at__gte=` and `?remind_at__lte=`, the `exact` lookup as `?remind_at=`.
+
+    Values are converted by the model field and become WHERE clauses of the query, an invalid value is a 400 and a
+    timestamp without an offset is read in `TIME_ZONE`. Only whitelist columns that lead an index after `project`, so
+    a filter never scans the whole table.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        lookups = {}
+        for param, (field_name, lookup) in self.get_params(view).items():
+            if param in request.query_params:
+                field = queryset.model._meta.get_field(field_name)
+                lookups[f"{field_name}__{lookup}"] = self.to_python(param, field, lookup, request.query_params[param])
+        return queryset.filter(**lookups)
+
+    def get_params(self, view) -> dict[str, tuple[str, str]]:
+        """Maps the query parameters to their field and lookup"""
+        return {
+            field_name if lookup == "exact" else f"{field_name}__{lookup}": (field_name, lookup)
+            for field_name, lookups in getattr(view, "filter_fields", {}).items()
+            for lookup in lookups
+        }
+
+    def to_python(self, param: str, field, lookup: str, value: str):
+        try:
+            if lookup == "isnull" or isinstance(field, BooleanField):
+                return serializers.BooleanField().to_internal_value(value)  # accepts `true` and `false`
+            if isinstance(field, DateTimeField):
+                return serializers.DateTimeField().to_internal_value(value)  # aware, unlike `field.to_python()`
+            return field.to_python(value)
+        except DjangoValidationError as exc:
+            raise ValidationError({param: exc.messages})
+        except ValidationError as exc:
+            raise ValidationError({param: exc.detail})
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": param,
+                "required": False,
+                "in": "query",
+                "description": f"Filters by `{field_name}` ({lookup}).",
+                "schema": {"type": "string"},
+            }
+            for param, (field_name, lookup) in self.get_params(view).items()
+        ]
+
+
+class WhitelistOrderingFilter(filters.OrderingFilter):
+    """
+    Orders by the comma-separated `?ordering=` of the `ordering_fields` of the view, e.g. `?ordering=-title`.
+
+    Unlike DRF's filter, a field which is not whitelisted or given twice is a 400 instead of being ignored.
+    `CursorPagination` reads the ordering from this filter and adds the primary key, so whitelist non-null columns that
+    lead an index after `project` and are followed by `id`.
+    """
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        valid_fields = super().remove_invalid_fields(queryset, fields, view, request)
+        invalid_fields = [field for field in fields if field not in valid_fields]
+        if invalid_fields:
+            allowed = [item[0] for item in self.get_valid_fields(queryset, view, {"request": request})]
+            message = f"Cannot order by {', '.join(invalid_fields)}, expected any of {allowed}."
+            raise ValidationError({self.ordering_param: [message]})
+
+        names = [field.lstrip("-") for field in valid_fields]
+        if duplicates := sorted({name for name in names if names.count(name) > 1}):
+            message = f"Cannot order by {', '.join(duplicates)} more than once."
+            raise ValidationError({self.ordering_param: [message]})
+        return valid_fields
@@ -0,0 +1,184 @@
+import csv
+import io
+import json
+import time
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from django.db import connection, transaction
+from django.db.models import Model
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from .cache import invalidate_projects
+from .models import Credential, Project
+from .serializers import AccountImportSerializer, CredentialSerializer, TaskSerializer
+
+FORMATS = AccountImportSerializer.formats
+
+
+class InvalidRow(str):
+    """A line which could not be parsed, `AccountImporter` reports it as the error of its row"""
+
+
+def read_rows(lines: Iterable[str], file_format: str) -> Iterator[dict | InvalidRow]:
+    """
+    Parses CSV (with a header line) or NDJSON one row at a time, so the file is never loaded whole.
+
+    A line which is not valid JSON becomes an `InvalidRow`, a file which cannot be decoded or split into CSV rows
+    raises `ValidationError`.
+    """
+    try:
+        if file_format == "csv":
+            # An empty cell means the column was not given, so optional fields fall back to their defaults
+            yield from ({key: value for key, value in row.items() if value != ""} for row in csv.DictReader(lines))
+        else:
+            yield from (parse_json(line) for line in lines if line.strip())
+    except UnicodeDecodeError:
+        raise ValidationError({"file": ["The file is not UTF-8 encoded."]}) from None
+    except csv.Error as exc:
+        raise ValidationError({"file": [f"The file is not valid CSV: {exc}."]}) from None
+
+
+def parse_json(line: str) -> dict | InvalidRow:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as exc:
+        return InvalidRow(f"Invalid JSON: {exc.msg} at column {exc.colno}.")
+
+
+def copy_instances(model: type[Model], instances: list[Model]):
+    """
+    Inserts `instances` with PostgreSQL `COPY ... FROM STDIN`, which skips per-row statement overhead.
+
+    Values go through the same `pre_save`/`get_db_prep_save` steps as `save()`, so `auto_now` fields are set.
+    """
+    fields = [field for field in model._meta.concrete_fields if not (field.primary_key or field.generated)]
+    buffer = io.StringIO()
+    for instance in instances:
+        values = (field.get_db_prep_save(field.pre_save(instance, add=True), connection) for field in fields)
+        buffer.write("\t".join(map(copy_text, values)) + "\n")
+    buffer.seek(0)
+
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    sql = f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+    with connection.cursor() as cursor:
+        cursor.copy_expert(sql, buffer)
+
+
+def copy_text(value) -> str:
+    """Encodes a value for the `COPY` text format"""
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+class ImportReport:
+    max_errors = 100
+
+    def __init__(self, rows: int = 0):
+        self.rows = rows
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+        self.started = time.monotonic()
+
+    @property
+    def seconds(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.imported / self.seconds if self.seconds else 0.0
+
+    def add_error(self, row: int, errors):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row, "errors": errors})
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class AccountImporter:
+    """
+    Imports credentials and tasks into a project from an iterable of rows, e.g. `read_rows()` or the NDJSON export.
+
+    The type of every row is its `type` value (`credential` or `task`), or `default_type`; `project` rows of an export
+    are skipped. Batches are validated with the `CredentialSerializer`/`TaskSerializer` rules in one pass, passwords
+    are encrypted with `encrypt_many`, and rows are loaded with `COPY` on PostgreSQL or `bulk_create` elsewhere.
+    """
+
+    serializer_classes = {"credential": CredentialSerializer, "task": TaskSerializer}
+
+    def __init__(self, project: Project, default_type: str | None = None, batch_size: int = 1000, use_copy=True):
+        self.project = project
+        self.default_type = default_type
+        self.batch_size = batch_size
+        self.use_copy = use_copy and connection.vendor == "postgresql"
+
+    def run(self, rows: Iterable[dict], skip: int = 0, on_batch: Callable[[ImportReport], None] | None = None):
+        """Imports `rows` after the first `skip` ones in batches, each in its own transaction"""
+        report = ImportReport(rows=skip)
+        remaining = islice(rows, skip, None)
+        while batch := list(islice(remaining, self.batch_size)):
+            with transaction.atomic():
+                self.import_batch(batch, report)
+            invalidate_projects([self.project.id])  # neither COPY nor bulk_create send post_save
+            report.rows += len(batch)
+            if on_batch:
+                on_batch(report)
+        return report
+
+    def import_batch(self, batch: list[dict], report: ImportReport):
+        rows_by_type = {resource: [] for resource in self.serializer_classes}
+        for number, row in enumerate(batch, start=report.rows + 1):
+            if isinstance(row, InvalidRow):
+                report.add_error(number, {api_settings.NON_FIELD_ERRORS_KEY: [row]})
+                continue
+            resource = (row.get("type") or self.default_type) if isinstance(row, dict) else None
+            if resource in rows_by_type:
+                rows_by_type[resource].append((number, row))
+            elif resource != "project":
+                report.add_error(number, {"type": [f"Expected one of {sorted(self.serializer_classes)}."]})
+
+        for resource, numbered_rows in rows_by_type.items():
+            if numbered_rows:
+                report.imported += self.load(resource, numbered_rows, report)
+
+    def load(self, resource: str, numbered_rows: list[tuple[int, dict]], report: ImportReport) -> int:
+        serializer = self.serializer_classes[resource]()
+        model = serializer.Meta.model
+
+        instances = []
+        for number, row in numbered_rows:
+            try:
+                attrs = self.validate(serializer, row)
+            except ValidationError as exc:
+                report.add_error(number, exc.detail)
+            else:
+                instances.append(model(project=self.project, **attrs))
+
+        if not instances:
+            return 0
+        if model is Credential:
+            Credential.objects.encrypt_passwords(instances)
+        if self.use_copy:
+            copy_instances(model, instances)
+        else:
+            model.objects.bulk_create(instances)
+        return len(instances)
+
+    def validate(self, serializer, row: dict) -> dict:
+        attrs = serializer.run_validation(row)
+        # An export made without `reveal_passwords=true` holds the mask, which must not replace the password
+        if isinstance(serializer, CredentialSerializer) and attrs.get("password") == serializer.password_mask:
+            raise ValidationError({"password": ["The password is masked, export with `reveal_passwords=true`."]})
+        return attrs
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from project.importer import FORMATS, AccountImporter, ImportReport, read_rows
+from project.models import Project
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Imports credentials and tasks into a project from a CSV or NDJSON file. "
+        "Rows are validated and loaded in batches with COPY; a checkpoint is saved after each batch and "
+        "an interrupted import is resumed from it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--format", choices=FORMATS, help="File format, taken from the file extension by default.")
+        parser.add_argument(
+            "--type",
+            choices=list(AccountImporter.serializer_classes),
+            help="Type of the rows without a `type` column.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows loaded per transaction.")
+        parser.add_argument("--no-copy", action="store_true", help="Load with bulk_create instead of COPY.")
+        parser.add_argument("--checkpoint", type=Path, help="File keeping the imported row count, PATH.checkpoint.")
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        path: Path = options["path"]
+        checkpoint: Path = options["checkpoint"] or path.with_name(f"{path.name}.checkpoint")
+        file_format = options["format"] or path.suffix.lstrip(".")
+        if file_format not in FORMATS:
+            raise CommandError(f"Unknown file format '{file_format}', pass --format.")
+
+        try:
+            project = Project.objects.get(id=options["project_id"])
+        except Project.DoesNotExist:
+            raise CommandError(f"Project {options['project_id']} does not exist.")
+
+        skip = 0 if options["restart"] else self.load_checkpoint(checkpoint)
+        if skip:
+            self.stdout.write(f"Resuming after row {skip}.")
+
+        importer = AccountImporter(project, options["type"], options["batch_size"], use_copy=not options["no_copy"])
+        with path.open(newline="", encoding="utf-8") as stream:
+            try:
+                report = importer.run(
+                    read_rows(stream, file_format), skip, lambda report: self.on_batch(report, checkpoint)
+                )
+            except ValidationError as exc:
+                raise CommandError(" ".join(exc.detail["file"]))
+
+        checkpoint.unlink(missing_ok=True)
+        for error in report.errors:
+            self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.imported} rows ({report.failed} failed) in {report.seconds:.1f}s, "
+                f"{report.rows_per_second:.0f} rows/s."
+            )
+        )
+
+    def on_batch(self, report: ImportReport, checkpoint: Path):
+        checkpoint.write_text(json.dumps({"rows": report.rows}))
+        if self.verbosity > 1:
+            self.stdout.write(f"{report.rows} rows read, {report.rows_per_second:.0f} rows/s.")
+
+    def load_checkpoint(self, checkpoint: Path) -> int:
+        if not checkpoint.exists():
+            return 0
+        return json.loads(checkpoint.read_text())["rows"]
@@ -0,0 +1,69 @@
+import json
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from project.crypto import get_cipher
+from project.models import Credential
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Re-encrypts credential passwords with the primary (first) ENCRYPTION_KEY. "
+        "Runs online in small keyset-paginated batches, saves a checkpoint after each one and can be resumed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows re-encrypted per transaction.")
+        parser.add_argument("--rate", type=float, default=0, help="Max rows per second, 0 disables the limit.")
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            default=Path("rotate_credential_keys.checkpoint"),
+            help="File keeping the last rotated credential id.",
+        )
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+
+    def handle(self, *args, **options):
+        checkpoint: Path = options["checkpoint"]
+        last_id = 0 if options["restart"] else self.load_checkpoint(checkpoint)
+        if last_id:
+            self.stdout.write(f"Resuming after credential id {last_id}.")
+
+        rotated, started = 0, time.monotonic()
+        while batch := self.rotate_batch(last_id, options["batch_size"]):
+            rotated += len(batch)
+            last_id = batch[-1].id
+            self.save_checkpoint(checkpoint, last_id)
+            self.throttle(rotated, started, options["rate"])
+
+        checkpoint.unlink(missing_ok=True)
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"Rotated {rotated} credentials in {elapsed:.1f}s."))
+
+    def rotate_batch(self, last_id: int, batch_size: int) -> list[Credential]:
+        """Locks the next batch of rows, so concurrent password updates are not overwritten with stale ciphertext"""
+        with transaction.atomic():
+            queryset = Credential.objects.select_for_update().filter(id__gt=last_id).order_by("id").only("password")
+            batch = list(queryset[:batch_size])
+
+            passwords = get_cipher().rotate_many([credential.password for credential in batch])
+            for credential, password in zip(batch, passwords):
+                credential.password = password
+            Credential.objects.bulk_update(batch, ["password"])
+
+        return batch
+
+    def throttle(self, rotated: int, started: float, rate: float):
+        if rate > 0:
+            time.sleep(max(0.0, rotated / rate - (time.monotonic() - started)))
+
+    def load_checkpoint(self, checkpoint: Path) -> int:
+        if not checkpoint.exists():
+            return 0
+        return json.loads(checkpoint.read_text())["last_id"]
+
+    def save_checkpoint(self, checkpoint: Path, last_id: int):
+        checkpoint.write_text(json.dumps({"last_id": last_id}))
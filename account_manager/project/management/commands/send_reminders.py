@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from project.notifiers import get_notifier
+from project.reminders import dispatch_due_reminders
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Sends due task reminders through REMINDER_NOTIFIER_BACKEND. "
+        "Due tasks are locked with SKIP LOCKED, so several workers can run at the same time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Reminders claimed and sent per batch.")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and poll for due reminders every N seconds, 0 sends the due ones once and exits.",
+        )
+
+    def handle(self, *args, **options):
+        notifier = get_notifier()
+        while True:
+            started = time.monotonic()
+            delivered = dispatch_due_reminders(notifier, options["batch_size"])
+            elapsed = time.monotonic() - started
+            if delivered or not options["interval"]:
+                self.stdout.write(self.style.SUCCESS(f"Sent {delivered} reminders in {elapsed:.1f}s."))
+
+            if not options["interval"]:
+                return
+            time.sleep(max(0.0, options["interval"] - elapsed))
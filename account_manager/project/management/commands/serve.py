@@ -0,0 +1,118 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils.module_loading import import_string
+
+INTERFACES = {
+    # "interface": (application setting, gunicorn worker class of one thread, of several threads)
+    "wsgi": ("WSGI_APPLICATION", "sync", "gthread"),
+    "asgi": ("ASGI_APPLICATION", "uvicorn_worker.UvicornWorker", "uvicorn_worker.UvicornWorker"),
+}
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Serves the app in production with gunicorn: a master process restarts its worker processes when they die, "
+        "after --max-requests requests, and gracefully on SIGHUP. SIGTERM lets the workers finish their requests."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bind", default="0.0.0.0:8000", help="Address to listen on, HOST:PORT or unix:PATH.")
+        parser.add_argument(
+            "--interface",
+            choices=INTERFACES,
+            default=settings.SERVER_INTERFACE,
+            help="Serve `WSGI_APPLICATION` with sync workers or `ASGI_APPLICATION` with uvicorn workers.",
+        )
+        parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="Worker processes.")
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=settings.SERVER_THREADS,
+            help="Request threads per WSGI worker, ASGI workers run sync code in the thread pool of their loop.",
+        )
+        parser.add_argument(
+            "--keep-alive",
+            type=int,
+            default=settings.SERVER_KEEPALIVE,
+            help="Seconds an idle keep-alive connection is kept open, put it above the idle timeout of a proxy.",
+        )
+        parser.add_argument(
+            "--timeout", type=int, default=settings.SERVER_TIMEOUT, help="Seconds before a silent worker is killed."
+        )
+        parser.add_argument(
+            "--graceful-timeout",
+            type=int,
+            default=settings.SERVER_GRACEFUL_TIMEOUT,
+            help="Seconds the workers get to finish their requests on a restart or a stop.",
+        )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            default=settings.SERVER_MAX_REQUESTS,
+            help="Requests after which a worker is replaced, bounding its memory growth, 0 never replaces it.",
+        )
+        parser.add_argument(
+            "--max-requests-jitter",
+            type=int,
+            default=settings.SERVER_MAX_REQUESTS_JITTER,
+            help="Random extra requests per worker, so the workers are not all replaced at once.",
+        )
+
+    def handle(self, *args, **options):
+        config = self.get_config(options)
+        if options["interface"] == "asgi" and any(db["CONN_MAX_AGE"] for db in connections.settings.values()):
+            # The settings only turn persistent connections off for SERVER_INTERFACE, not for the option
+            raise CommandError('Persistent connections are not supported under ASGI, set SERVER_INTERFACE = "asgi".')
+        if settings.ASYNC_VIEWS and options["interface"] == "wsgi":
+            self.stderr.write(self.style.WARNING("ASYNC_VIEWS is on, the async views need --interface asgi."))
+
+        self.run(config)
+
+    def get_config(self, options) -> dict:
+        """Returns the gunicorn settings of the options, and `app`, the dotted path of the application"""
+        if options["workers"] < 1 or options["threads"] < 1:
+            raise CommandError("--workers and --threads must be at least 1.")
+
+        setting, worker_class, threaded_worker_class = INTERFACES[options["interface"]]
+        return {
+            "app": getattr(settings, setting),
+            "bind": [options["bind"]],
+            "workers": options["workers"],
+            "threads": options["threads"],
+            "worker_class": threaded_worker_class if options["threads"] > 1 else worker_class,
+            "keepalive": options["keep_alive"],
+            "timeout": options["timeout"],
+            "graceful_timeout": options["graceful_timeout"],
+            "max_requests": options["max_requests"],
+            "max_requests_jitter": options["max_requests_jitter"],
+            # Worker heartbeats, a disk-backed /tmp can stall them in containers
+            "worker_tmp_dir": "/dev/shm" if os.path.isdir("/dev/shm") else None,
+            "accesslog": "-",
+        }
+
+    def run(self, config: dict):
+        """Runs the gunicorn master in this process, it returns when the server stops"""
+        try:
+            from gunicorn.app.base import BaseApplication
+
+            if "." in config["worker_class"]:
+                import_string(config["worker_class"])
+        except ImportError as exc:
+            raise CommandError(f"{exc.name} is not installed, `poetry install` adds it.") from exc
+
+        workers = f"{config['workers']} {config['worker_class']} workers"
+        self.stdout.write(f"Serving {config['app']} on {', '.join(config['bind'])} with {workers}.")
+
+        class Server(BaseApplication):
+            def load_config(self):
+                for key, value in config.items():
+                    if key != "app":
+                        self.cfg.set(key, value)
+
+            def load(self):
+                return import_string(config["app"])  # in each worker, after the fork
+
+        Server().run()
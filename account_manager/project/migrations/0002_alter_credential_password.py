@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0001_add_project_models"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="credential",
+            name="password",
+            field=models.TextField(verbose_name="password"),
+        ),
+    ]
@@ -0,0 +1,54 @@
+from cryptography.fernet import InvalidToken
+from django.db import migrations
+
+from project.crypto import CredentialCipher, get_cipher
+
+BATCH_SIZE = 1000
+
+
+def iterate_batches(queryset):
+    """Walks the queryset by primary key in `BATCH_SIZE` chunks, so the table is never loaded at once."""
+    last_id = 0
+    while batch := list(queryset.filter(id__gt=last_id).order_by("id")[:BATCH_SIZE]):
+        yield batch
+        last_id = batch[-1].id
+
+
+def mark_password(cipher, password):
+    try:
+        cipher.fernet.decrypt(password.encode())
+    except InvalidToken:
+        return cipher.encrypt(password)
+    return CredentialCipher.prefix + password
+
+
+def add_password_marker(apps, schema_editor):
+    credential_model = apps.get_model("project", "Credential")
+    queryset = credential_model.objects.using(schema_editor.connection.alias).only("id", "password")
+
+    for batch in iterate_batches(queryset.exclude(password__startswith=CredentialCipher.prefix)):
+        cipher = get_cipher()
+        for credential in batch:
+            credential.password = mark_password(cipher, credential.password)
+        credential_model.objects.using(schema_editor.connection.alias).bulk_update(batch, ["password"])
+
+
+def remove_password_marker(apps, schema_editor):
+    credential_model = apps.get_model("project", "Credential")
+    queryset = credential_model.objects.using(schema_editor.connection.alias).only("id", "password")
+
+    for batch in iterate_batches(queryset.filter(password__startswith=CredentialCipher.prefix)):
+        for credential in batch:
+            credential.password = credential.password.removeprefix(CredentialCipher.prefix)
+        credential_model.objects.using(schema_editor.connection.alias).bulk_update(batch, ["password"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0002_alter_credential_password"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_password_marker, remove_password_marker),
+    ]
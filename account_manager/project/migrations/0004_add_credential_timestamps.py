@@ -0,0 +1,25 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0003_add_credential_password_marker"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="credential",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now, verbose_name="created at"),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="credential",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="updated at"),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # indexes are built concurrently, without blocking writes to the tables
+
+    dependencies = [
+        ("project", "0004_add_credential_timestamps"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="credential",
+            index=models.Index(fields=["project", "id"], name="credential_project_id_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="credential",
+            index=models.Index(fields=["project", "created_at", "id"], name="credential_project_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="project",
+            index=models.Index(fields=["user", "created_at", "id"], name="project_user_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(fields=["project", "id"], name="task_project_id_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(fields=["project", "created_at", "id"], name="task_project_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True)), fields=["remind_at"], name="task_active_remind_at_idx"
+            ),
+        ),
+        # The composite indexes lead with the foreign key, so they serve every lookup the single column ones did
+        migrations.AlterField(
+            model_name="project",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="projects",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="credential",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="credentials",
+                to="project.project",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tasks",
+                to="project.project",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # indexes are built concurrently, without blocking writes to the tables
+
+    dependencies = [
+        ("project", "0005_add_access_path_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="reminder_sent_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name="reminder sent at"),
+        ),
+        RemoveIndexConcurrently(
+            model_name="task",
+            name="task_active_remind_at_idx",
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("reminder_sent_at__isnull", True)),
+                fields=["remind_at", "id"],
+                name="task_pending_remind_at_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-18 21:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # the index is built concurrently, without blocking writes to the table
+
+    dependencies = [
+        ("project", "0006_add_task_reminder_sent_at"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(
+                    ("is_active", True), ("remind_at__isnull", False), ("reminder_sent_at__isnull", True)
+                ),
+                fields=["project", "remind_at"],
+                name="task_project_pending_idx",
+            ),
+        ),
+    ]
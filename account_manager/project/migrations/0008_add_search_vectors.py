@@ -0,0 +1,69 @@
+# Generated by Django 5.0.14 on 2026-10-18 21:40
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # indexes are built concurrently, without blocking writes to the tables
+
+    dependencies = [
+        ("project", "0007_add_task_project_pending_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="credential",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.SearchVector("service_name", config="simple", weight="A"),
+                        "||",
+                        django.contrib.postgres.search.SearchVector("username", config="simple", weight="B"),
+                        django.contrib.postgres.search.SearchConfig("simple"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        models.Func(
+                            models.F("login_url"),
+                            models.Value("[^[:alnum:]]+"),
+                            models.Value(" "),
+                            models.Value("g"),
+                            function="regexp_replace",
+                        ),
+                        config="simple",
+                        weight="C",
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector("title", config="simple", weight="A"),
+                    "||",
+                    django.contrib.postgres.search.SearchVector("description", config="simple", weight="B"),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="credential",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="credential_search_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="task_search_idx"),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:01
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False  # indexes are built concurrently, without blocking writes to the tables
+
+    dependencies = [
+        ("project", "0008_add_search_vectors"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="credential",
+            index=models.Index(fields=["project", "service_name", "id"], name="credential_project_service_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(fields=["project", "title", "id"], name="task_project_title_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="task",
+            index=models.Index(fields=["project", "remind_at", "id"], name="task_project_remind_at_idx"),
+        ),
+    ]
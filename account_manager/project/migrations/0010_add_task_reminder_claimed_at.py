@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0009_add_filter_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="reminder_claimed_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name="reminder claimed at"),
+        ),
+    ]
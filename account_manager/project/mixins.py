@@ -0,0 +1,395 @@
+import hashlib
+from datetime import datetime
+from functools import cached_property
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Aggregate, Count, Max, QuerySet
+from django.http import HttpResponse
+from django.shortcuts import aget_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from .cache import aget_response_key, get_response_key, invalidate_projects
+from .models import Project
+from .serializers import BulkDestroySerializer, parse_names
+
+
+class ProjectScopeMixin:
+    """
+    Scopes a viewset to the project from the URL, which must belong to the requesting user.
+
+    The project is resolved with a single primary key lookup before the handler runs and is cached on the view,
+    so querysets filter children by the indexed `project_id` column instead of joining `Project` on every query.
+    """
+
+    project_url_kwarg = "project_id"
+    user_url_kwarg = "user_id"
+
+    @cached_property
+    def project(self) -> Project:
+        return get_object_or_404(self.get_project_queryset(), id=self.kwargs.get(self.project_url_kwarg))
+
+    def get_project_queryset(self):
+        user_id = self.kwargs.get(self.user_url_kwarg)
+        if not user_id == self.request.user.id:
+            raise PermissionDenied("You do not have permission.")
+        return Project.objects.only("id", "user_id").filter(user_id=user_id)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.project  # resolved here, so a foreign or missing project fails before the handler runs
+
+    async def ainitial(self, request, *args, **kwargs):
+        await super().ainitial(request, *args, **kwargs)
+        queryset = self.get_project_queryset()
+        self.project = await aget_object_or_404(queryset, id=self.kwargs.get(self.project_url_kwarg))
+
+    def perform_create(self, serializer):
+        serializer.save(project=self.project)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_projects([self.project.id])
+
+
+class SparseFieldsMixin:
+    """
+    Narrows `list` and `retrieve` responses to the comma-separated `?fields=` and adds the `?expand=` ones, see
+    `DynamicFieldsMixin`. Only the columns of the remaining fields are selected and only the remaining nested
+    relations are prefetched.
+    """
+
+    narrowed_actions = ("list", "retrieve")
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in self.narrowed_actions:  # writes validate every field, whatever the query says
+            context["fields"] = parse_names(self.request.query_params.get("fields"))
+            context["expand"] = parse_names(self.request.query_params.get("expand"))
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action not in self.narrowed_actions:
+            return queryset
+
+        # The pagination reads the ordering fields of the last row of a page for the next cursor
+        ordering = self.paginator.get_ordering(self.request, queryset, self) if self.paginator else ()
+        ordering = [field.lstrip("-") for field in ordering]
+        return self.get_serializer().narrow_queryset(queryset, *ordering)
+
+
+class BulkModelMixin:
+    """
+    Creates, partially updates and deletes lists of objects at `.../bulk/`, each with one query in one transaction.
+
+    Nothing is written when any item is invalid, the response then holds a list with the errors of every item at its
+    index (an empty object for valid items).
+    """
+
+    def bulk_create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            self.perform_create(serializer)
+        invalidate_projects([self.project.id])  # bulk_create does not send post_save
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, request, *args, **kwargs):
+        items = request.data if isinstance(request.data, list) else []
+        ids = [item["id"] for item in items if isinstance(item, dict) and isinstance(item.get("id"), int)]
+
+        instances = self.get_queryset().filter(id__in=ids)
+        serializer = self.get_serializer(instances, data=request.data, many=True, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+        invalidate_projects([self.project.id])
+        return Response(serializer.data)
+
+    def bulk_destroy(self, request, *args, **kwargs):
+        serializer = BulkDestroySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = set(serializer.validated_data["ids"])
+
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(id__in=ids)
+            missing_ids = ids - set(queryset.select_for_update().values_list("id", flat=True))
+            if missing_ids:
+                raise ValidationError({"ids": [f"Objects with ids {sorted(missing_ids)} do not exist."]})
+            queryset.delete()
+        invalidate_projects([self.project.id])
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ConditionalGetMixin:
+    """
+    Adds `ETag` and `Last-Modified` headers to `list` and `retrieve` responses and answers `If-None-Match` and
+    `If-Modified-Since` with 304 Not Modified before anything is serialized.
+
+    Both validators come from one aggregate query over the objects the response is built from (see
+    `get_freshness_query()`): the latest `updated_at` and the row count, which changes the ETag when a row is deleted.
+    `Last-Modified` would miss deletions, so it is only sent where a deletion answers 404 instead (see
+    `has_last_modified()`); clients should poll with `If-None-Match`.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.aget_conditional_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.aget_conditional_response(super().aretrieve, request, *args, **kwargs)
+
+    def get_conditional_response(self, handler, request, *args, **kwargs):
+        if not self.has_validators():
+            return handler(request, *args, **kwargs)
+
+        queryset, aggregates = self.get_freshness_query()
+        etag, timestamp = self.get_validators(request, *self.read_freshness(queryset.aggregate(**aggregates)))
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        return self.set_validators(response, etag, timestamp)
+
+    async def aget_conditional_response(self, handler, request, *args, **kwargs):
+        if not self.has_validators():
+            return await handler(request, *args, **kwargs)
+
+        queryset, aggregates = self.get_freshness_query()
+        etag, timestamp = self.get_validators(request, *self.read_freshness(await queryset.aaggregate(**aggregates)))
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = await handler(request, *args, **kwargs)
+        return self.set_validators(response, etag, timestamp)
+
+    def has_validators(self) -> bool:
+        return True
+
+    def has_last_modified(self) -> bool:
+        """Only the detail of a single object, the response of a deleted one is a 404 rather than a stale 304"""
+        return self.action == "retrieve"
+
+    def get_freshness_query(self) -> tuple[QuerySet, dict[str, Aggregate]]:
+        """Returns the objects of the response and the aggregates read by `read_freshness()`"""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset.order_by(), {"last_modified": Max("updated_at"), "count": Count("id")}
+
+    def read_freshness(self, row: dict) -> tuple[datetime | None, int]:
+        """Returns the latest `updated_at` and the count of the objects in the response"""
+        return row["last_modified"], row["count"]
+
+    def get_validators(self, request, last_modified: datetime | None, count: int) -> tuple[str, int | None]:
+        # The URL and the media type select the page, the fields and the format of the same rows
+        validator = f"{request.get_full_path()}:{request.accepted_media_type}:{last_modified}:{count}"
+        etag = f'W/"{hashlib.md5(validator.encode(), usedforsecurity=False).hexdigest()}"'
+        if last_modified is None or not self.has_last_modified():
+            return etag, None  # `If-Modified-Since` is ignored without a timestamp
+        return etag, int(last_modified.timestamp())
+
+    def set_validators(self, response, etag: str, timestamp: int | None):
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
+
+
+class CachedResponseMixin:
+    """
+    Serves `list` and `retrieve` responses from the cache, keyed by user, URL and the versions bumped on writes.
+
+    The `ETag` and `Last-Modified` headers are stored along, so conditional requests are answered from the cache too.
+    Responses revealing passwords are never stored, the cache would keep them in plaintext otherwise.
+    """
+
+    project_url_kwarg = "project_id"
+    cached_headers = ("ETag", "Last-Modified")
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.aget_cached_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.aget_cached_response(super().aretrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        key = self.get_cache_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return self.get_cached_response_from(request, *cached)
+
+        response = handler(request, *args, **kwargs)
+        if (entry := self.get_cache_entry(response)) is not None:
+            cache.set(key, entry, settings.PROJECT_CACHE_TIMEOUT)
+        return response
+
+    async def aget_cached_response(self, handler, request, *args, **kwargs):
+        # The async cache methods, a shared backend would block the event loop otherwise
+        key = await self.aget_cache_key(request)
+        if key is None:
+            return await handler(request, *args, **kwargs)
+
+        cached = await cache.aget(key)
+        if cached is not None:
+            return self.get_cached_response_from(request, *cached)
+
+        response = await handler(request, *args, **kwargs)
+        if (entry := self.get_cache_entry(response)) is not None:
+            await cache.aset(key, entry, settings.PROJECT_CACHE_TIMEOUT)
+        return response
+
+    def get_cache_key(self, request) -> str | None:
+        """Returns the key of the response, or None when it must not be cached"""
+        self.get_queryset()  # runs the access checks before anything is read from the cache
+        if not self.is_cacheable():
+            return None
+        return get_response_key(request.user.id, request.get_full_path(), self.kwargs.get(self.project_url_kwarg))
+
+    async def aget_cache_key(self, request) -> str | None:
+        self.get_queryset()
+        if not self.is_cacheable():
+            return None
+        return await aget_response_key(
+            request.user.id, request.get_full_path(), self.kwargs.get(self.project_url_kwarg)
+        )
+
+    def get_cache_entry(self, response) -> tuple | None:
+        """The data and headers stored for the response, None for a response which is not stored"""
+        if response.status_code != status.HTTP_200_OK:
+            return None
+        headers = {header: response[header] for header in self.cached_headers if response.has_header(header)}
+        return response.data, headers
+
+    def is_cacheable(self) -> bool:
+        return not self.get_serializer_context().get("reveal_password")
+
+    def get_cached_response_from(self, request, data, headers: dict[str, str]):
+        last_modified = parse_http_date_safe(headers["Last-Modified"]) if "Last-Modified" in headers else None
+        response = get_conditional_response(request, etag=headers.get("ETag"), last_modified=last_modified)
+        if response is None:
+            response = Response(data)
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+
+class AsyncReadMixin:
+    """
+    Serves `list` and `retrieve` with coroutines when the view is built by `as_async_view()`, so under ASGI a GET
+    awaits its queries with the async ORM instead of running the whole view in the sync thread. Other methods go to
+    the sync view.
+
+    `alist()` and `aretrieve()` mirror the sync handlers and the other mixins extend them like `list()` and
+    `retrieve()`, with an async variant of every step that queries. Serializing (which decrypts passwords) and
+    rendering run in the sync thread, so they never block the event loop. Place this mixin right before the DRF view
+    class: `ainitial()` calls `APIView.initial()`, which must not query once the user is authenticated.
+    """
+
+    async_actions = {"list": "alist", "retrieve": "aretrieve"}
+
+    @classmethod
+    def as_async_view(cls, actions: dict[str, str], **initkwargs):
+        sync_view = sync_to_async(cls.as_view(actions, **initkwargs))
+
+        async def view(request, *args, **kwargs):
+            action = actions.get(request.method.lower())
+            if action not in cls.async_actions:
+                return await sync_view(request, *args, **kwargs)
+
+            self = cls(**initkwargs)
+            self.action_map, self.action = actions, action
+            return await self.adispatch(getattr(self, cls.async_actions[action]), request, *args, **kwargs)
+
+        view.cls, view.initkwargs, view.actions = cls, initkwargs, actions  # read by the schema generation
+        return csrf_exempt(view)
+
+    async def adispatch(self, handler, request, *args, **kwargs):
+        """
+        `APIView.dispatch()` of async views: authentication and the handler are awaited, everything else is DRF's own
+        code. `APIView.initial()` checks the permissions once the user is known and `finish_dispatch()` handles what
+        the handler returned or raised in the sync thread.
+        """
+        self.args, self.kwargs = args, kwargs
+        self.request = request = self.initialize_request(request, *args, **kwargs)
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            outcome = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            outcome = exc
+        return await sync_to_async(self.finish_dispatch)(request, outcome, *args, **kwargs)
+
+    def finish_dispatch(self, request, outcome: Response | Exception, *args, **kwargs) -> HttpResponse:
+        """The end of `APIView.dispatch()`, plus rendering: Django would render in the sync thread otherwise"""
+        response = self.handle_exception(outcome) if isinstance(outcome, Exception) else outcome
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        if not hasattr(self.response, "render"):
+            return self.response
+        self.response.render()
+        return HttpResponse(self.response.content, status=self.response.status_code, headers=self.response.headers)
+
+    async def ainitial(self, request, *args, **kwargs):
+        await self.aperform_authentication(request)
+        super().initial(request, *args, **kwargs)
+
+    async def aperform_authentication(self, request):
+        """Authenticates like `request.user`, awaiting the authenticators which have an `aauthenticate()` coroutine"""
+        for authenticator in request.authenticators:
+            authenticate = getattr(authenticator, "aauthenticate", None) or sync_to_async(authenticator.authenticate)
+            try:
+                user_auth_tuple = await authenticate(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+        request._not_authenticated()
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.paginator is None:
+            return Response(await self.aserialize([instance async for instance in queryset], many=True))
+
+        page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        return self.get_paginated_response(await self.aserialize(page, many=True))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return Response(await self.aserialize(await self.aget_object()))
+
+    async def aserialize(self, instance, many: bool = False):
+        """The serializer data, built in the sync thread: credentials decrypt their passwords on the way"""
+        return await sync_to_async(lambda: self.get_serializer(instance, many=many).data)()
+
+    async def aget_object(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        instance = await aget_object_or_404(queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        self.check_object_permissions(self.request, instance)
+        return instance
@@ -1,13 +1,62 @@
-import os
+import operator
+from datetime import datetime
+from functools import reduce
 
-from cryptography.fernet import Fernet, InvalidToken
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import Count, F, Func, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from user.models import User
 
+from .crypto import CredentialCipher, get_cipher
+
+# Names, logins and URLs are not natural language, so words are indexed as they are, without stemming
+SEARCH_CONFIG = "simple"
+
+
+def search_vector(*weighted_fields: tuple[str | Func, str]) -> SearchVector:
+    """Concatenates the vectors of the fields with their weights, e.g. `search_vector(("title", "A"))`"""
+    vectors = [SearchVector(field, weight=weight, config=SEARCH_CONFIG) for field, weight in weighted_fields]
+    return reduce(operator.add, vectors)
+
+
+def url_words(field: str) -> Func:
+    """Splits a URL into words, the parser would keep `github.com/login` as a single token otherwise"""
+    return Func(F(field), Value("[^[:alnum:]]+"), Value(" "), Value("g"), function="regexp_replace")
+
+
+class SearchVectorManager(models.Manager):
+    """Leaves `search_vector` out of the selected columns, it is only read by the database when searching"""
+
+    def get_queryset(self):
+        return super().get_queryset().defer("search_vector")
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_stats(self):
+        """
+        Annotates `active_tasks_count`, `credentials_count` and `next_reminder_at` (of the pending reminders) with
+        correlated subqueries, so the children are counted in the same statement without being loaded.
+        """
+        tasks = Task.objects.filter(project_id=OuterRef("id")).order_by().values("project_id")
+        active_tasks = tasks.filter(is_active=True).annotate(value=Count("id")).values("value")
+        credentials = Credential.objects.filter(project_id=OuterRef("id")).order_by().values("project_id")
+        return self.annotate(
+            active_tasks_count=Coalesce(Subquery(active_tasks), 0),
+            credentials_count=Coalesce(Subquery(credentials.annotate(value=Count("id")).values("value")), 0),
+            next_reminder_at=Subquery(tasks.pending().annotate(value=Min("remind_at")).values("value")),
+        )
+
 
 class Project(models.Model):
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "created_at", "id"], name="project_user_created_idx"),
+        ]
+
     title = models.CharField(_("project title"), max_length=255)
     description = models.TextField(_("project description"), null=True, blank=True)
     is_active = models.BooleanField(_("is active"), default=True)
@@ -15,24 +64,69 @@ class Project(models.Model):
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
 
-    objects = models.Manager()
-    user: User = models.ForeignKey(User, on_delete=models.CASCADE, related_name="projects")
+    objects = ProjectQuerySet.as_manager()
+    user: User = models.ForeignKey(User, on_delete=models.CASCADE, related_name="projects", db_index=False)
 
     def __str__(self):
         return f"Title: {self.title}; User: {self.user}"
 
 
+class CredentialQuerySet(models.QuerySet):
+    def decrypt_passwords(self, max_workers: int | None = None) -> dict[int, str]:
+        """Returns raw passwords by credential id, decrypting them in a bounded thread pool"""
+        rows = list(self.values_list("id", "password"))
+        passwords = get_cipher().decrypt_many([password for _, password in rows], max_workers)
+        return {credential_id: password for (credential_id, _), password in zip(rows, passwords)}
+
+    def bulk_create(self, credentials, *args, **kwargs):
+        """Encrypts raw passwords in one batch first, bulk operations do not call `Credential.save()`"""
+        credentials = list(credentials)
+        self.encrypt_passwords(credentials)
+        return super().bulk_create(credentials, *args, **kwargs)
+
+    def bulk_update(self, credentials, fields, *args, **kwargs):
+        credentials = list(credentials)
+        if "password" in fields:
+            self.encrypt_passwords(credentials)
+        return super().bulk_update(credentials, fields, *args, **kwargs)
+
+    def encrypt_passwords(self, credentials: list["Credential"]):
+        raw = [credential for credential in credentials if not credential.is_encrypted_password]
+        passwords = get_cipher().encrypt_many([credential.password for credential in raw])
+        for credential, password in zip(raw, passwords):
+            credential.password = password
+
+
 class Credential(models.Model):
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "id"], name="credential_project_id_idx"),
+            models.Index(fields=["project", "created_at", "id"], name="credential_project_created_idx"),
+            models.Index(fields=["project", "service_name", "id"], name="credential_project_service_idx"),
+            GinIndex(fields=["search_vector"], name="credential_search_idx"),
+        ]
+
     email = models.EmailField(_("email address"))
-    password = models.CharField(_("password"), max_length=128)
+    password = models.TextField(_("password"))
     service_name = models.CharField(_("service name"), max_length=50)
 
     username = models.CharField(_("username"), max_length=150, null=True, blank=True)
     phone_number = models.CharField(_("phone number"), max_length=15, null=True, blank=True)
     login_url = models.URLField(_("login url"), null=True, blank=True)
 
-    objects = models.Manager()
-    project: Project = models.ForeignKey("Project", on_delete=models.CASCADE, related_name="credentials")
+    search_vector = models.GeneratedField(
+        expression=search_vector(("service_name", "A"), ("username", "B"), (url_words("login_url"), "C")),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    objects = SearchVectorManager.from_queryset(CredentialQuerySet)()
+    project: Project = models.ForeignKey(
+        "Project", on_delete=models.CASCADE, related_name="credentials", db_index=False
+    )
 
     def __str__(self):
         return f"Service: {self.service_name}; User: {self.project.user}"
@@ -44,37 +138,70 @@ class Credential(models.Model):
 
     @property
     def is_encrypted_password(self):
-        try:
-            self.decrypt_password()
-        except InvalidToken:
-            return False
-        return True
+        return CredentialCipher.is_encrypted(self.password)
 
     @property
-    def encryption_key(self):
-        return os.getenv("ENCRYPTION_KEY").encode()
+    def cipher(self) -> CredentialCipher:
+        return get_cipher()
 
     def set_password(self):
         self.password = self.encrypt_password()
 
     def encrypt_password(self):
-        return Fernet(self.encryption_key).encrypt(self.password.encode()).decode()
+        return self.cipher.encrypt(self.password)
 
     def decrypt_password(self):
-        return Fernet(self.encryption_key).decrypt(self.password.encode()).decode()
+        return self.cipher.decrypt(self.password)
+
+
+class TaskQuerySet(models.QuerySet):
+    def pending(self):
+        """Active tasks with a reminder that has not been sent yet"""
+        return self.filter(is_active=True, remind_at__isnull=False, reminder_sent_at__isnull=True)
+
+    def due(self, now: datetime):
+        """Pending tasks with a reminder at or before `now`"""
+        return self.pending().filter(remind_at__lte=now)
 
 
 class Task(models.Model):
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "id"], name="task_project_id_idx"),
+            models.Index(fields=["project", "created_at", "id"], name="task_project_created_idx"),
+            models.Index(fields=["project", "title", "id"], name="task_project_title_idx"),
+            models.Index(fields=["project", "remind_at", "id"], name="task_project_remind_at_idx"),
+            models.Index(
+                fields=["remind_at", "id"],
+                condition=models.Q(is_active=True, reminder_sent_at__isnull=True),
+                name="task_pending_remind_at_idx",
+            ),
+            models.Index(
+                fields=["project", "remind_at"],
+                condition=models.Q(is_active=True, remind_at__isnull=False, reminder_sent_at__isnull=True),
+                name="task_project_pending_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="task_search_idx"),
+        ]
+
     title = models.CharField(_("task title"), max_length=255)
     description = models.TextField(_("task description"), null=True, blank=True)
     remind_at = models.DateTimeField(_("remind at"), null=True, blank=True)
+    reminder_sent_at = models.DateTimeField(_("reminder sent at"), null=True, blank=True, editable=False)
+    reminder_claimed_at = models.DateTimeField(_("reminder claimed at"), null=True, blank=True, editable=False)
     is_active = models.BooleanField(_("is active"), default=True)
 
+    search_vector = models.GeneratedField(
+        expression=search_vector(("title", "A"), ("description", "B")),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
 
-    objects = models.Manager()
-    project: "Project" = models.ForeignKey("Project", on_delete=models.CASCADE, related_name="tasks")
+    objects = SearchVectorManager.from_queryset(TaskQuerySet)()
+    project: "Project" = models.ForeignKey("Project", on_delete=models.CASCADE, related_name="tasks", db_index=False)
 
     def __str__(self):
         return f"Title: {self.title}; User: {self.project.user}"
@@ -0,0 +1,90 @@
+import logging
+from functools import cache
+from typing import Iterable
+
+import requests
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationError(Exception):
+    pass
+
+
+class BaseNotifier:
+    """
+    Delivers task reminders to their owners.
+
+    Subclasses implement `send()` for a single task and raise `NotificationError` when it could not be delivered;
+    `send_many()` can be overridden by backends able to deliver a whole batch at once.
+    """
+
+    def send(self, task: Task):
+        raise NotImplementedError("Subclasses of BaseNotifier must provide a send() method")
+
+    def send_many(self, tasks: Iterable[Task]) -> list[Task]:
+        """Returns the delivered tasks, failed ones are logged and left for the next run"""
+        delivered = []
+        for task in tasks:
+            try:
+                self.send(task)
+            except NotificationError:
+                logger.warning("Reminder for task %s was not delivered", task.id, exc_info=True)
+            else:
+                delivered.append(task)
+        return delivered
+
+    def get_message(self, task: Task) -> str:
+        return "\n\n".join(filter(None, [f"Reminder: {task.title}", task.description]))
+
+
+class TelegramNotifier(BaseNotifier):
+    """Sends reminders with the Telegram Bot API to the `telegram_id` chat of the project owner"""
+
+    api_url = "https://api.telegram.org/bot{token}/sendMessage"
+    timeout = 10
+
+    def __init__(self):
+        self.url = self.api_url.format(token=settings.TELEGRAM_BOT_TOKEN)
+        self.session = requests.Session()  # keeps the connection to the API alive between messages
+
+    def send(self, task: Task):
+        chat_id = task.project.user.telegram_id
+        if chat_id is None:
+            logger.info("Reminder for task %s skipped, the user has no telegram id", task.id)
+            return
+
+        try:
+            response = self.session.post(
+                self.url, json={"chat_id": chat_id, "text": self.get_message(task)}, timeout=self.timeout
+            )
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            raise NotificationError(str(exc)) from exc
+
+
+class LocMemNotifier(BaseNotifier):
+    """Keeps sent reminders in `LocMemNotifier.outbox` instead of delivering them, for tests and local development"""
+
+    outbox: list[Task] = []
+
+    def send(self, task: Task):
+        self.outbox.append(task)
+
+
+@cache
+def get_notifier() -> BaseNotifier:
+    """Returns the process-wide notifier configured by `settings.REMINDER_NOTIFIER_BACKEND`"""
+    return import_string(settings.REMINDER_NOTIFIER_BACKEND)()
+
+
+@receiver(setting_changed)
+def reset_notifier(*, setting, **kwargs):
+    if setting in ("REMINDER_NOTIFIER_BACKEND", "TELEGRAM_BOT_TOKEN"):
+        get_notifier.cache_clear()
@@ -0,0 +1,132 @@
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+
+
+def reverse_ordering(ordering: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination over every `ordering` field, not only the first one like DRF's implementation does.
+
+    The ordering always ends with the primary key, so positions are unique and a page is fetched with an index range
+    scan starting right after the cursor, instead of an OFFSET that grows with the page number.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = settings.PAGINATION_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.PAGINATION_MAX_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.get_page_slice(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """`paginate_queryset()` of async views, the page is fetched with the async ORM"""
+        return self.set_page([row async for row in self.get_page_slice(queryset, request, view)])
+
+    def get_page_slice(self, queryset, request, view=None):
+        """Returns the lazy queryset of the page and one more row, which tells whether there is a next page"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        ordering = reverse_ordering(self.ordering) if self.is_reversed() else self.ordering
+        return self.get_page_queryset(queryset, ordering)[: self.page_size + 1]
+
+    def set_page(self, results: list) -> list:
+        self.page = results[: self.page_size]
+        has_more = len(results) > self.page_size
+        if self.is_reversed():
+            self.page.reverse()
+
+        self.has_next = True if self.is_reversed() else has_more
+        self.has_previous = has_more if self.is_reversed() else self.cursor is not None
+        self.display_page_controls = self.has_previous or self.has_next
+        return self.page
+
+    def is_reversed(self) -> bool:
+        return bool(self.cursor and self.cursor.reverse)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not {"id", "-id"} & set(ordering):
+            ordering += ("-id" if ordering[-1].startswith("-") else "id",)
+        return ordering
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(pagination.Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(pagination.Cursor(offset=0, reverse=True, position=position))
+
+    def get_page_queryset(self, queryset, ordering: tuple[str, ...]):
+        """Orders the queryset and skips the rows up to the cursor"""
+        queryset = queryset.order_by(*ordering)
+        if self.cursor and self.cursor.position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(queryset, ordering, self.cursor.position))
+        return queryset
+
+    def get_keyset_filter(self, queryset, ordering: tuple[str, ...], position: str) -> Q:
+        """
+        Builds `(a, b, id) > (x, y, z)` for the given ordering directions.
+
+        It is expanded as `a >= x AND (a > x OR (b >= y AND (b > y OR id > z)))`, so the leading condition of every
+        level is a plain range on the index and PostgreSQL can start the scan at the cursor.
+        """
+        try:
+            values = json.loads(position)
+            fields = [self.get_ordering_field(queryset, field.lstrip("-")) for field in ordering]
+            values = [field.to_python(value) for field, value in zip(fields, values, strict=True)]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        keyset_filter = None
+        for field, value in reversed(list(zip(ordering, values))):
+            lookup = f"{field.lstrip('-')}__{'lt' if field.startswith('-') else 'gt'}"
+            if keyset_filter is None:
+                keyset_filter = Q(**{lookup: value})
+            else:
+                keyset_filter = Q(**{f"{lookup}e": value}) & (Q(**{lookup: value}) | keyset_filter)
+        return keyset_filter
+
+    def get_ordering_field(self, queryset, name: str):
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        return queryset.model._meta.get_field(name)
+
+    def _get_position_from_instance(self, instance, ordering):
+        if isinstance(instance, dict):  # rows of `values()`
+            return json.dumps([str(instance[field.lstrip("-")]) for field in ordering])
+        return json.dumps([str(getattr(instance, field.lstrip("-"))) for field in ordering])
+
+
+class UnionCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the union of a list of `values()` querysets, e.g. rows of several tables.
+
+    A union cannot be filtered, so the cursor is applied to every queryset before they are combined. All of them have
+    to select the ordering fields, which must identify a row across the querysets.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+    def get_page_queryset(self, querysets, ordering: tuple[str, ...]):
+        get_page_queryset = super().get_page_queryset  # a comprehension has no zero-argument `super()`
+        first, *others = [get_page_queryset(queryset, ordering).order_by() for queryset in querysets]
+        return first.union(*others, all=True).order_by(*ordering)
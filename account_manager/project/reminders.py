@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import invalidate_projects
+from .models import Task
+from .notifiers import BaseNotifier, get_notifier
+
+
+def dispatch_due_reminders(
+    notifier: BaseNotifier | None = None, batch_size: int = 100, now: datetime | None = None
+) -> int:
+    """
+    Sends every reminder due at `now` and returns how many were delivered.
+
+    A batch is claimed in a short transaction which locks it with `FOR UPDATE SKIP LOCKED`, so several workers can run
+    side by side without picking the same tasks, and is sent after the commit: no lock is held while the notifier waits
+    on the network. The delivered tasks are marked as sent in a second short transaction, failed ones are released and
+    retried on the next run. A claim older than `REMINDER_CLAIM_TIMEOUT` (a worker died while sending) is taken over.
+    """
+    notifier = notifier or get_notifier()
+    now = now or timezone.now()
+
+    delivered, failed_ids = 0, set()
+    while result := dispatch_batch(notifier, now, failed_ids, batch_size):
+        sent, failed = result
+        delivered += sent
+        failed_ids.update(failed)
+    return delivered
+
+
+def dispatch_batch(
+    notifier: BaseNotifier, now: datetime, failed_ids: set[int], batch_size: int
+) -> tuple[int, list[int]] | None:
+    """Sends the oldest due batch and returns the number delivered with the ids of the tasks that failed"""
+    tasks, claimed_at = claim_batch(now, failed_ids, batch_size)
+    if not tasks:
+        return None
+
+    sent_ids = {task.id for task in notifier.send_many(tasks)}
+    record_batch(tasks, sent_ids, claimed_at)
+    return len(sent_ids), [task.id for task in tasks if task.id not in sent_ids]
+
+
+def claim_batch(now: datetime, failed_ids: set[int], batch_size: int) -> tuple[list[Task], datetime]:
+    """Stamps the oldest due batch nobody else is sending with the returned claim time"""
+    claimed_at = timezone.now()
+    unclaimed = Q(reminder_claimed_at__isnull=True)
+    unclaimed |= Q(reminder_claimed_at__lt=claimed_at - timedelta(seconds=settings.REMINDER_CLAIM_TIMEOUT))
+
+    with transaction.atomic():
+        # Undelivered tasks are skipped, so they are not picked again within one run
+        queryset = Task.objects.due(now).filter(unclaimed).exclude(id__in=failed_ids).select_related("project__user")
+        queryset = queryset.select_for_update(skip_locked=True, of=("self",)).order_by("remind_at", "id")
+        tasks = list(queryset[:batch_size])
+        Task.objects.filter(id__in=[task.id for task in tasks]).update(reminder_claimed_at=claimed_at)
+    return tasks, claimed_at
+
+
+def record_batch(tasks: list[Task], sent_ids: set[int], claimed_at: datetime):
+    """Marks the delivered tasks as sent and releases the batch, unless it was rescheduled or claimed over meanwhile"""
+    sent_at = timezone.now()
+    with transaction.atomic():
+        claimed = Task.objects.filter(id__in=[task.id for task in tasks], reminder_claimed_at=claimed_at)
+        # `update()` skips `auto_now`, yet `updated_at` has to move for the ETag of the task responses to change
+        claimed.filter(id__in=sent_ids).update(reminder_sent_at=sent_at, reminder_claimed_at=None, updated_at=sent_at)
+        if len(sent_ids) < len(tasks):
+            claimed.exclude(id__in=sent_ids).update(reminder_claimed_at=None)  # failed ones are retried by the next run
+        invalidate_projects(task.project_id for task in tasks if task.id in sent_ids)
@@ -0,0 +1,18 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Newline delimited JSON, one object per line; lets views negotiate `?format=ndjson` for streamed exports"""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"  # noqa: VNE003
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        return "".join(json.dumps(item, cls=JSONEncoder) + "\n" for item in items).encode(self.charset)
@@ -0,0 +1,43 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import CharField, F, FloatField, QuerySet, Value
+from django.db.models.functions import Cast, Coalesce, Left
+
+from .models import SEARCH_CONFIG, Credential, Task
+from .pagination import UnionCursorPagination
+
+SEARCH_TYPES = ("credential", "task")
+
+
+def parse_search_query(text: str | None) -> SearchQuery | None:
+    """Matches rows containing every word of `text` as a word prefix, so `aws cons` finds `AWS Console`"""
+    words = re.findall(r"\w+", text or "")
+    if not words:
+        return None
+    return SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw", config=SEARCH_CONFIG)
+
+
+def search_hits(user_id: int, query: SearchQuery, types=SEARCH_TYPES) -> list[QuerySet]:
+    """
+    Returns a `values()` queryset of hits per type, in the tasks and credentials of all projects of the user.
+
+    Every hit has the same columns (`type`, `id`, `project`, `name`, `detail` and `rank`), so the querysets can be
+    combined with `union()`. The rank is cast to double precision, the cursor compares the exact value it returned.
+    """
+    details = {
+        "credential": (Credential, F("service_name"), Coalesce("username", "login_url", output_field=CharField())),
+        "task": (Task, F("title"), Left("description", 200)),
+    }
+    hits = []
+    for resource in sorted(set(types) & set(details)):
+        model, name, detail = details[resource]
+        queryset = model.objects.filter(project__user_id=user_id, search_vector=query).annotate(
+            type=Value(resource), rank=Cast(SearchRank(F("search_vector"), query), FloatField())
+        )
+        hits.append(queryset.values("type", "id", "project", "rank", name=name, detail=detail))
+    return hits
+
+
+class SearchPagination(UnionCursorPagination):
+    ordering = ("-rank", "type", "id")
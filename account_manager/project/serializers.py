@@ -1,43 +1,216 @@
+from functools import cached_property
+from typing import Callable
+
+from django.conf import settings
+from django.db.models import Prefetch, QuerySet
 from rest_framework import serializers
 
+from .crypto import CredentialCipher
 from .models import Credential, Project, Task
 
 
-class CredentialSerializer(serializers.ModelSerializer):
+def parse_names(value: str | None) -> set[str]:
+    """Parses a comma-separated query parameter, e.g. `?fields=id,title,tasks.title`"""
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+class DynamicFieldsMixin:
+    """
+    Narrows the output to the names in the `fields` context value and adds the `expandable_fields` named in `expand`.
+
+    Nested fields are named with the path to them, e.g. `tasks.title`; a nested serializer without names of its own
+    keeps all of its fields.
+    """
+
+    expandable_fields: dict[str, Callable[[], serializers.Field]] = {}
+
+    @property
+    def field_path(self) -> str:
+        names, node = [], self
+        while node.parent is not None:
+            names.append(node.field_name)  # empty for the child of a list serializer
+            node = node.parent
+        return ".".join(name for name in reversed(names) if name)
+
+    def get_requested_names(self, key: str) -> set[str]:
+        prefix = f"{self.field_path}." if self.field_path else ""
+        names = self.context.get(key, ())
+        return {name.removeprefix(prefix).split(".")[0] for name in names if name.startswith(prefix)}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        expand = self.get_requested_names("expand") & set(self.expandable_fields)
+        for name in expand:
+            fields[name] = self.expandable_fields[name]()
+
+        if requested := self.get_requested_names("fields"):
+            fields = {name: field for name, field in fields.items() if name in requested | expand}
+        return fields
+
+    def narrow_queryset(self, queryset: QuerySet, *extra_fields: str) -> QuerySet:
+        """
+        Selects only the columns read by the fields with `.only()` and prefetches only the relations of the nested
+        serializers, each narrowed the same way.
+        """
+        opts = self.Meta.model._meta
+        concrete_fields = {field.name for field in opts.concrete_fields}
+        columns, prefetches = set(extra_fields), []
+        for field in self.fields.values():
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.ListSerializer) and isinstance(field.child, DynamicFieldsMixin):
+                relation = opts.get_field(field.source)
+                children = field.child.narrow_queryset(relation.related_model.objects.all(), relation.field.name)
+                prefetches.append(Prefetch(field.source, queryset=children))
+            elif field.source.split(".")[0] in concrete_fields:
+                columns.add(field.source.split(".")[0])
+        return queryset.only(*columns).prefetch_related(*prefetches)
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    Creates or updates a list of objects with one validation pass and a single `bulk_create`/`bulk_update` query.
+
+    For updates `instance` holds the objects being changed, every item is matched to one of them by its `id`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("max_length", settings.BULK_MAX_ITEMS)
+        super().__init__(*args, **kwargs)
+        self.seen_ids = set()
+
+    @cached_property
+    def instances_by_id(self) -> dict:
+        return {instance.id: instance for instance in self.instance}
+
+    def to_internal_value(self, data):
+        self.seen_ids.clear()
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        instance_id = data.get("id") if isinstance(data, dict) else None
+        if instance_id not in self.instances_by_id:
+            raise serializers.ValidationError({"id": ["Object with this id does not exist."]})
+        if instance_id in self.seen_ids:
+            raise serializers.ValidationError({"id": ["Object with this id is listed more than once."]})
+
+        self.seen_ids.add(instance_id)
+        self.child.instance = self.instances_by_id[instance_id]
+        return {**super().run_child_validation(data), "id": instance_id}
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        return model.objects.bulk_create([model(**attrs) for attrs in validated_data])
+
+    def update(self, instance, validated_data):
+        model = self.child.Meta.model
+        auto_now_fields = [field for field in model._meta.concrete_fields if getattr(field, "auto_now", False)]
+
+        instances, fields = [], {field.name for field in auto_now_fields}
+        for attrs in validated_data:
+            obj = self.instances_by_id[attrs.pop("id")]
+            for field, value in attrs.items():
+                setattr(obj, field, value)
+            for field in auto_now_fields:
+                field.pre_save(obj, add=False)
+            fields.update(attrs)
+            instances.append(obj)
+
+        model.objects.bulk_update(instances, list(fields))
+        return instances
+
+
+class BulkDestroySerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=settings.BULK_MAX_ITEMS
+    )
+
+
+class AccountImportSerializer(serializers.Serializer):
+    formats = ("csv", "ndjson")
+
+    file = serializers.FileField()  # noqa: VNE002
+    file_format = serializers.ChoiceField(choices=formats, required=False)
+    type = serializers.ChoiceField(choices=["credential", "task"], required=False)  # noqa: VNE003
+
+    def validate(self, attrs):
+        if "file_format" not in attrs:
+            attrs["file_format"] = attrs["file"].name.rpartition(".")[2].lower()
+            if attrs["file_format"] not in self.formats:
+                raise serializers.ValidationError({"file_format": ["Unknown file extension, pass the file format."]})
+        return attrs
+
+
+class SearchHitSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=["credential", "task"])  # noqa: VNE003
+    id = serializers.IntegerField()  # noqa: VNE003
+    project = serializers.IntegerField()
+    name = serializers.CharField(help_text="Title of a task, service name of a credential.")
+    detail = serializers.CharField(allow_null=True, help_text="Start of the description, or username or login URL.")
+    rank = serializers.FloatField()
+
+
+class CredentialSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Credential
-        fields = "__all__"
+        exclude = ["search_vector"]
         read_only_fields = ["project"]
+        list_serializer_class = BulkListSerializer
 
-    def to_representation(self, model: Meta.model):
-        """Represents hashed password as raw password"""
-        model.password = model.decrypt_password()
-        return super().to_representation(model)
+    password = serializers.CharField(max_length=128)
+    password_mask = "********"
 
-    def create(self, validated_data):
-        project_id = self.context["request"].resolver_match.kwargs["project_id"]
-        validated_data["project_id"] = project_id
-        return super().create(validated_data)
+    def validate_password(self, value):
+        if CredentialCipher.is_encrypted(value):
+            raise serializers.ValidationError(f"Password must not start with '{CredentialCipher.prefix}'.")
+        return value
 
+    def to_representation(self, instance: Meta.model):
+        """Represents password as a mask, or as raw password when the `reveal_password` context flag is set"""
+        representation = super().to_representation(instance)
+        if "password" in representation:
+            reveal_password = self.context.get("reveal_password", False)
+            representation["password"] = instance.decrypt_password() if reveal_password else self.password_mask
+        return representation
 
-class TaskSerializer(serializers.ModelSerializer):
+
+class TaskSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Task
-        fields = "__all__"
+        exclude = ["search_vector", "reminder_claimed_at"]
         read_only_fields = ["project"]
+        list_serializer_class = BulkListSerializer
 
-    def create(self, validated_data):
-        project_id = self.context["request"].resolver_match.kwargs["project_id"]
-        validated_data["project_id"] = project_id
-        return super().create(validated_data)
+    def validate(self, attrs):
+        if self.instance is not None and "remind_at" in attrs and attrs["remind_at"] != self.instance.remind_at:
+            attrs["reminder_sent_at"] = None  # a rescheduled reminder is sent again
+            attrs["reminder_claimed_at"] = None  # even when a worker is sending the old one right now
+        return attrs
+
+
+class ProjectStatsSerializer(serializers.Serializer):
+    """Reads the annotations of `ProjectQuerySet.with_stats()`"""
 
+    active_tasks = serializers.IntegerField(source="active_tasks_count")
+    credentials = serializers.IntegerField(source="credentials_count")
+    next_reminder_at = serializers.DateTimeField(allow_null=True)
 
-class ProjectSerializer(serializers.ModelSerializer):
+
+class ProjectSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = "__all__"
         read_only_fields = ["user"]
 
+    expandable_fields = {
+        "credentials": lambda: CredentialSerializer(many=True, read_only=True),
+        "tasks": lambda: TaskSerializer(many=True, read_only=True),
+        "stats": lambda: ProjectStatsSerializer(source="*", read_only=True),
+    }
+
     def create(self, validated_data):
         user = self.context["request"].user
         validated_data["user"] = user
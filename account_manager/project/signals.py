@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_projects, invalidate_user
+from .models import Credential, Project, Task
+
+# Deletes of credentials and tasks are invalidated by the views instead of `post_delete` receivers: a receiver would
+# stop Django from deleting them with a single query, including the cascades from a project or a user.
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project_cache(sender, instance: Project, **kwargs):
+    invalidate_user(instance.user_id)
+    invalidate_projects([instance.id])
+
+
+@receiver(post_save, sender=Credential)
+@receiver(post_save, sender=Task)
+def invalidate_project_children_cache(sender, instance: Credential | Task, **kwargs):
+    invalidate_projects([instance.project_id])
@@ -10,11 +10,13 @@ from tests.conftest import (  # noqa: F401
     Users,
     api_client,
     auth_client,
+    clear_cache,
     credentials,
     django_db_setup,
     projects,
     tasks,
     users,
+    without_silk,
 )
 
 # ----- Data Fixtures --------------------------------------------------------------------------------------------------
@@ -0,0 +1,222 @@
+import asyncio
+import json
+from collections import namedtuple as nt
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from project.models import Credential as CredentialModel
+from project.models import Task as TaskModel
+from project.serializers import CredentialSerializer
+from project.urls import list_view, read_view
+from project.views import TaskViewSet
+
+from .conftest import Users
+
+# ----- Async Views Test Case Schemas ----------------------------------------------------------------------------------
+R_TestCase = nt("Read", ["url_name", "query_params"])
+S_TestCase = nt("Status", ["auth_user", "url_name", "url_kwargs", "query_params", "expected_status"])
+
+# ----- Async Views Test Cases -----------------------------------------------------------------------------------------
+read_test_cases = [
+    # "url_name", "query_params"
+    R_TestCase("project-list", {}),
+    R_TestCase("project-list", {"expand": "stats"}),
+    R_TestCase("project-list", {"fields": "id,title"}),
+    R_TestCase("project-detail", {}),
+    R_TestCase("project-detail", {"fields": "id,credentials"}),
+    R_TestCase("task-list", {}),
+    R_TestCase("task-list", {"ordering": "-title", "page_size": 1}),
+    R_TestCase("task-list", {"is_active": "false"}),
+    R_TestCase("task-detail", {}),
+    R_TestCase("credential-list", {"fields": "id,service_name"}),
+    R_TestCase("credential-list", {"service_name": "AWS"}),
+    R_TestCase("credential-detail", {"fields": "id,password"}),
+]
+status_test_cases = [
+    # "auth_user", "url_name", "url_kwargs", "query_params", "expected_status"
+    S_TestCase("not_auth", "task-list", {}, {}, status.HTTP_401_UNAUTHORIZED),
+    S_TestCase("user2", "task-list", {}, {}, status.HTTP_403_FORBIDDEN),
+    S_TestCase("user2", "project-detail", {}, {}, status.HTTP_403_FORBIDDEN),
+    S_TestCase("user1", "task-list", {"project_id": 0}, {}, status.HTTP_404_NOT_FOUND),
+    S_TestCase("user1", "task-detail", {"id": 0}, {}, status.HTTP_404_NOT_FOUND),
+    S_TestCase("user1", "project-detail", {"project_id": 0}, {}, status.HTTP_404_NOT_FOUND),
+    S_TestCase("user1", "task-list", {}, {"remind_at__gte": "tomorrow"}, status.HTTP_400_BAD_REQUEST),
+    S_TestCase("user1", "credential-list", {}, {"ordering": "password"}, status.HTTP_400_BAD_REQUEST),
+]
+
+
+def in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class AsyncOnlyCache:
+    """Proxies the async methods of the cache and fails on the blocking ones"""
+
+    async_methods = ("aget", "aset", "aget_many", "aadd")
+
+    def __getattr__(self, name):
+        if name not in self.async_methods:
+            raise AssertionError(f"cache.{name}() blocks the event loop")
+        return getattr(cache, name)
+
+
+# ----- Async Views Tests ----------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestAsyncViews:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, api_client, users, projects):
+        self.client = api_client
+        self.users: Users = users
+
+        self.project = projects.project__user1
+        self.task = TaskModel.objects.create(project=self.project, title="Inactive Task", is_active=False)
+        self.credential = CredentialModel.objects.create(
+            project=self.project, email="user1@gmail.com", password="password", service_name="AWS"
+        )
+
+    @pytest.mark.parametrize("test_case", read_test_cases)
+    def test_same_response_as_sync_view(self, test_case: R_TestCase):
+        url = self.get_url(test_case.url_name)
+
+        response = self.get_async(url, test_case.query_params)
+        cache.clear()  # the sync view must build its own response
+        expected = self.get_sync(url, test_case.query_params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(response.content) == expected.json()
+        assert response.get("ETag") == expected.get("ETag")  # none for the expanded project list
+
+    @pytest.mark.parametrize("test_case", status_test_cases)
+    def test_errors_as_sync_view(self, test_case: S_TestCase):
+        url = self.get_url(test_case.url_name, **test_case.url_kwargs)
+        user = getattr(self.users, test_case.auth_user)
+
+        response = self.get_async(url, test_case.query_params, user)
+        expected = self.get_sync(url, test_case.query_params, user)
+
+        assert response.status_code == expected.status_code == test_case.expected_status
+        assert json.loads(response.content) == expected.json()
+
+    def test_not_modified(self):
+        url = self.get_url("task-list")
+        etag = self.get_async(url)["ETag"]
+
+        response = self.get_async(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_cached_response(self):
+        url = self.get_url("project-detail")
+        expected = self.get_async(url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_async(url)
+
+        assert response.content == expected.content
+        assert len(context.captured_queries) == 0  # the cached user, versions and response
+
+    @pytest.mark.parametrize("url_name", ["project-list", "project-detail"])
+    def test_cache_is_not_blocking(self, url_name):
+        url = self.get_url(url_name)
+
+        with (
+            mock.patch("authorization.authentication.cache", AsyncOnlyCache()),
+            mock.patch("project.cache.cache", AsyncOnlyCache()),
+            mock.patch("project.mixins.cache", AsyncOnlyCache()),
+        ):
+            response = self.get_async(url)
+            with CaptureQueriesContext(connection) as context:
+                cached = self.get_async(url)  # the user, versions and response from the cache
+
+        assert response.status_code == status.HTTP_200_OK
+        assert cached.content == response.content
+        assert len(context.captured_queries) == 0
+
+    @pytest.mark.parametrize("url_name", ["credential-list", "credential-detail"])
+    def test_serialized_off_the_event_loop(self, url_name):
+        to_representation, on_loop = CredentialSerializer.to_representation, []
+
+        def record(serializer, instance):
+            on_loop.append(in_event_loop())
+            return to_representation(serializer, instance)
+
+        with mock.patch.object(CredentialSerializer, "to_representation", autospec=True, side_effect=record):
+            response = self.get_async(self.get_url(url_name), {"fields": "id,password"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert on_loop and not any(on_loop)  # the passwords are decrypted in the sync thread
+
+    def test_cursor_pagination(self):
+        names, url, query_params = [], self.get_url("task-list"), {"ordering": "title", "page_size": 1}
+        while url:
+            data = json.loads(self.get_async(url, query_params).content)
+            names += [task["title"] for task in data["results"]]
+            url, query_params = data["next"], None
+
+        assert names == ["Inactive Task", "Task 1"]
+
+    def test_writes_go_to_sync_view(self):
+        request = AsyncRequestFactory().post(
+            self.get_url("task-list"),
+            {"title": "New Task"},
+            content_type="application/json",
+            **self.get_auth(self.users.user1),
+        )
+
+        response = async_to_sync(self.get_async_view(request.path))(request, **resolve(request.path).kwargs)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert TaskModel.objects.filter(project=self.project, title="New Task").exists()
+
+    def test_read_view_setting(self, settings):
+        settings.ASYNC_VIEWS = True
+        assert asyncio.iscoroutinefunction(read_view(TaskViewSet, list_view))
+
+        settings.ASYNC_VIEWS = False
+        assert not asyncio.iscoroutinefunction(read_view(TaskViewSet, list_view))
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, url_name, **url_kwargs):
+        kwargs = {"user_id": self.users.user1.id}
+        if url_name != "project-list":
+            kwargs["project_id"] = self.project.id
+        if url_name in ("task-detail", "credential-detail"):
+            kwargs["id"] = (self.task if url_name == "task-detail" else self.credential).id
+        return reverse(url_name, kwargs={**kwargs, **url_kwargs})
+
+    def get_auth(self, user, headers=None) -> dict:
+        headers = dict(headers or {})
+        if user is not None:
+            headers["Authorization"] = f"Bearer {AccessToken.for_user(user)}"
+        return {"headers": headers}
+
+    def get_async_view(self, path):
+        """The async view of the route, whatever `ASYNC_VIEWS` the URLs were loaded with"""
+        view = resolve(path).func
+        return view.cls.as_async_view(view.actions, **view.initkwargs)
+
+    def get_async(self, url, query_params=None, user=False, headers=None):
+        user = self.users.user1 if user is False else user
+        request = AsyncRequestFactory().get(url, query_params, **self.get_auth(user, headers))
+        return async_to_sync(self.get_async_view(request.path))(request, **resolve(request.path).kwargs)
+
+    def get_sync(self, url, query_params=None, user=False):
+        user = self.users.user1 if user is False else user
+        self.client.credentials(**({"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"} if user else {}))
+        return self.client.get(url, query_params)
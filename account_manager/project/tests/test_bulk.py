@@ -0,0 +1,191 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from project.crypto import CredentialCipher
+from project.models import Credential as CredentialModel
+from project.models import Task as TaskModel
+
+from .conftest import Projects, Users
+
+# ----- Bulk Test Case Schemas -----------------------------------------------------------------------------------------
+A_TestCase = nt("Access", ["auth_user", "project", "method", "expected_status"])
+Q_TestCase = nt("Queries", ["url_name", "method", "max_queries", "expected_status"])
+
+# ----- Bulk Test Cases ------------------------------------------------------------------------------------------------
+access_test_cases = [
+    # "auth_user", "project", "method", "expected_status"
+    A_TestCase("not_auth", "project__user1", "post", status.HTTP_401_UNAUTHORIZED),
+    A_TestCase("user1", "project__user1", "post", status.HTTP_201_CREATED),
+    A_TestCase("user1", "project__user2", "post", status.HTTP_403_FORBIDDEN),
+    A_TestCase("user1", "project__user2", "patch", status.HTTP_403_FORBIDDEN),
+    A_TestCase("user1", "project__user2", "delete", status.HTTP_403_FORBIDDEN),
+]
+query_count_test_cases = [
+    # "url_name", "method", "max_queries", "expected_status"
+    Q_TestCase("task-bulk", "post", 4, status.HTTP_201_CREATED),
+    Q_TestCase("task-bulk", "patch", 5, status.HTTP_200_OK),
+    Q_TestCase("task-bulk", "delete", 5, status.HTTP_204_NO_CONTENT),
+    Q_TestCase("credential-bulk", "post", 4, status.HTTP_201_CREATED),
+    Q_TestCase("credential-bulk", "patch", 5, status.HTTP_200_OK),
+    Q_TestCase("credential-bulk", "delete", 5, status.HTTP_204_NO_CONTENT),
+]
+
+ITEMS_COUNT = 30
+
+
+# ----- Bulk Endpoint Tests --------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestBulkEndpoints:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects):
+        self.auth_client = auth_client
+        self.users: Users = users
+        self.projects: Projects = projects
+
+    @pytest.mark.parametrize("test_case", access_test_cases)
+    def test_access(self, test_case: A_TestCase):
+        client = self.auth_client(getattr(self.users, test_case.auth_user))
+        project = getattr(self.projects, test_case.project)
+        data = {"post": [{"title": "Task"}], "patch": [{"id": 1, "title": "Task"}], "delete": {"ids": [1]}}
+
+        url = self.get_url("task", project)
+
+        response = getattr(client, test_case.method)(url, data[test_case.method], format="json")
+
+        assert response.status_code == test_case.expected_status
+
+    def test_bulk_create_tasks(self):
+        data = [{"title": f"Task {index}", "is_active": True} for index in range(ITEMS_COUNT)]
+
+        response = self.get_client().post(self.get_url("task"), data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [task["title"] for task in response.data] == [task["title"] for task in data]
+        assert TaskModel.objects.filter(id__in=[task["id"] for task in response.data]).count() == ITEMS_COUNT
+
+    def test_bulk_create_credentials_encrypts_passwords(self):
+        data = [
+            {"email": "user1@gmail.com", "password": f"password{index}", "service_name": "GitHub"}
+            for index in range(ITEMS_COUNT)
+        ]
+
+        response = self.get_client().post(self.get_url("credential"), data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert {credential["password"] for credential in response.data} == {"********"}
+        credentials = CredentialModel.objects.filter(id__in=[credential["id"] for credential in response.data])
+        assert all(CredentialCipher.is_encrypted(credential.password) for credential in credentials)
+        assert sorted(credentials.decrypt_passwords().values()) == sorted(item["password"] for item in data)
+
+    def test_bulk_create_returns_errors_per_item(self):
+        data = [{"title": "Valid"}, {"title": ""}, {"title": "Valid", "remind_at": "tomorrow"}]
+        tasks_count = TaskModel.objects.count()
+
+        response = self.get_client().post(self.get_url("task"), data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert set(response.data[1]) == {"title"}
+        assert set(response.data[2]) == {"remind_at"}
+        assert TaskModel.objects.count() == tasks_count
+
+    def test_bulk_update(self):
+        tasks = self.create_tasks(self.projects.project__user1)
+        data = [{"id": task.id, "title": f"Updated {task.id}"} for task in tasks]
+
+        response = self.get_client().patch(self.get_url("task"), data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        for task in TaskModel.objects.filter(id__in=[task.id for task in tasks]):
+            assert task.title == f"Updated {task.id}"
+            assert task.updated_at > task.created_at
+
+    def test_bulk_update_credential_passwords(self):
+        credentials = self.create_credentials(self.projects.project__user1)
+        data = [{"id": credential.id, "password": "new_password"} for credential in credentials]
+
+        response = self.get_client().patch(self.get_url("credential"), data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        passwords = CredentialModel.objects.filter(id__in=[credential.id for credential in credentials])
+        assert set(passwords.decrypt_passwords().values()) == {"new_password"}
+
+    def test_bulk_update_rejects_unknown_and_duplicate_ids(self):
+        task = self.create_tasks(self.projects.project__user1)[0]
+        foreign_task = self.create_tasks(self.projects.project__user2)[0]
+        data = [{"id": task.id, "title": "Updated"}, {"id": foreign_task.id, "title": "Updated"}, {"id": task.id}]
+
+        response = self.get_client().patch(self.get_url("task"), data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert set(response.data[1]) == {"id"}
+        assert set(response.data[2]) == {"id"}
+        assert TaskModel.objects.get(id=task.id).title != "Updated"
+
+    def test_bulk_destroy(self):
+        tasks = self.create_tasks(self.projects.project__user1)
+        ids = [task.id for task in tasks]
+
+        response = self.get_client().delete(self.get_url("task"), {"ids": ids}, format="json")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not TaskModel.objects.filter(id__in=ids).exists()
+
+    def test_bulk_destroy_rejects_unknown_ids(self):
+        task = self.create_tasks(self.projects.project__user1)[0]
+        foreign_task = self.create_tasks(self.projects.project__user2)[0]
+
+        response = self.get_client().delete(self.get_url("task"), {"ids": [task.id, foreign_task.id]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert TaskModel.objects.filter(id__in=[task.id, foreign_task.id]).count() == 2
+
+    @pytest.mark.usefixtures("without_silk")
+    @pytest.mark.parametrize("test_case", query_count_test_cases)
+    def test_query_count(self, test_case: Q_TestCase, django_assert_max_num_queries):
+        resource = test_case.url_name.split("-")[0]
+        data = self.get_data(resource, test_case.method)
+
+        with django_assert_max_num_queries(test_case.max_queries):
+            response = getattr(self.get_client(), test_case.method)(self.get_url(resource), data, format="json")
+
+        assert response.status_code == test_case.expected_status
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_client(self):
+        return self.auth_client(self.users.user1)
+
+    def get_url(self, resource, project=None):
+        project = project or self.projects.project__user1
+        return reverse(f"{resource}-bulk", kwargs={"user_id": project.user_id, "project_id": project.id})
+
+    def get_data(self, resource, method):
+        if method == "post":
+            return self.get_new_items(resource)
+
+        create = self.create_tasks if resource == "task" else self.create_credentials
+        objects = create(self.projects.project__user1)
+        if method == "patch":
+            field = "title" if resource == "task" else "password"
+            return [{"id": obj.id, field: "updated"} for obj in objects]
+        return {"ids": [obj.id for obj in objects]}
+
+    def get_new_items(self, resource):
+        if resource == "task":
+            return [{"title": f"Task {index}"} for index in range(ITEMS_COUNT)]
+        return [{"email": "user1@gmail.com", "password": "password", "service_name": "GitHub"}] * ITEMS_COUNT
+
+    def create_tasks(self, project):
+        tasks = [TaskModel(project=project, title=f"task{index}") for index in range(ITEMS_COUNT)]
+        return TaskModel.objects.bulk_create(tasks)
+
+    def create_credentials(self, project):
+        data = {"email": "user1@gmail.com", "password": "password", "service_name": "GitHub"}
+        return CredentialModel.objects.bulk_create(
+            [CredentialModel(project=project, **data) for _ in range(ITEMS_COUNT)]
+        )
@@ -0,0 +1,144 @@
+import time
+from collections import namedtuple as nt
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Task as TaskModel
+from project.serializers import ProjectSerializer, TaskSerializer
+
+from .conftest import Users
+
+# ----- Conditional GET Test Case Schemas ------------------------------------------------------------------------------
+W_TestCase = nt("Write", ["url_name", "method", "data", "changed_url_names"])
+
+# ----- Conditional GET Test Cases -------------------------------------------------------------------------------------
+read_url_names = ["project-list", "project-detail", "task-list", "task-detail"]
+last_modified_url_names = ["task-detail"]  # a single object, the others would not tell deletions
+validator_test_cases = [(url_name, "If-None-Match") for url_name in read_url_names]
+validator_test_cases += [(url_name, "If-Modified-Since") for url_name in last_modified_url_names]
+write_test_cases = [
+    # "url_name", "method", "data", "changed_url_names"
+    W_TestCase("task-detail", "patch", {"title": "Updated Task"}, ["project-detail", "task-list", "task-detail"]),
+    W_TestCase("task-detail", "delete", None, ["project-detail", "task-list"]),
+    W_TestCase("task-list", "post", {"title": "New Task"}, ["project-detail", "task-list"]),
+    W_TestCase("credential-detail", "delete", None, ["project-detail"]),
+    W_TestCase("project-detail", "patch", {"title": "Updated Project"}, ["project-list", "project-detail"]),
+]
+
+
+# ----- Conditional GET Tests ------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestConditionalGet:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects):
+        self.client = auth_client(users.user1)
+        self.users: Users = users
+
+        self.project = projects.project__user1
+        self.task = TaskModel.objects.create(project=self.project, title="Polled Task")
+        self.credential = CredentialModel.objects.create(
+            project=self.project, email="user1@gmail.com", password="password", service_name="GitHub"
+        )
+
+    @pytest.mark.parametrize("url_name", read_url_names)
+    def test_validators_are_set(self, url_name):
+        response = self.client.get(self.get_url(url_name))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('W/"')
+        assert response.has_header("Last-Modified") is (url_name in last_modified_url_names)
+
+    @pytest.mark.parametrize("url_name, header", validator_test_cases)
+    def test_not_modified(self, url_name, header):
+        url = self.get_url(url_name)
+        response = self.client.get(url)
+        validator = response["ETag" if header == "If-None-Match" else "Last-Modified"]
+
+        cache.clear()  # answered from the aggregates, not from the cached response
+        with mock.patch.object(ProjectSerializer, "to_representation") as project_serializer:
+            with mock.patch.object(TaskSerializer, "to_representation") as task_serializer:
+                not_modified = self.client.get(url, headers={header: validator})
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+        assert not_modified["ETag"] == response["ETag"]
+        assert not project_serializer.called and not task_serializer.called
+
+    @pytest.mark.parametrize("url_name", ["project-list", "project-detail"])
+    def test_cached_response_is_not_modified(self, url_name, django_assert_num_queries):
+        url = self.get_url(url_name)
+        etag = self.client.get(url)["ETag"]
+
+        with django_assert_num_queries(0):
+            not_modified = self.client.get(url, headers={"If-None-Match": etag})
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_not_modified_query_count(self, django_assert_num_queries):
+        url = self.get_url("task-list")
+        etag = self.client.get(url)["ETag"]
+
+        # The project lookup and the aggregate query
+        with django_assert_num_queries(2):
+            self.client.get(url, headers={"If-None-Match": etag})
+
+    @pytest.mark.parametrize("test_case", write_test_cases)
+    def test_writes_change_etag(self, test_case: W_TestCase):
+        etags = {url_name: self.client.get(self.get_url(url_name))["ETag"] for url_name in read_url_names}
+
+        write_response = getattr(self.client, test_case.method)(
+            self.get_url(test_case.url_name), test_case.data, format="json"
+        )
+        assert write_response.status_code < status.HTTP_400_BAD_REQUEST
+
+        for url_name in test_case.changed_url_names:
+            response = self.client.get(self.get_url(url_name), headers={"If-None-Match": etags[url_name]})
+            assert response.status_code == status.HTTP_200_OK
+            assert response["ETag"] != etags[url_name]
+
+    @pytest.mark.parametrize("url_name", ["project-detail", "task-list"])
+    def test_deletion_is_not_hidden_by_if_modified_since(self, url_name):
+        url = self.get_url(url_name)
+        response = self.client.get(url)
+        last_modified = http_date(time.time() + 60)  # later than every row, a Last-Modified check would answer 304
+
+        self.task.delete()
+        cache.clear()
+        modified = self.client.get(url, headers={"If-Modified-Since": last_modified})
+
+        assert modified.status_code == status.HTTP_200_OK
+        assert modified["ETag"] != response["ETag"]
+
+    def test_etag_depends_on_query_params(self):
+        url = self.get_url("task-list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, {"page_size": 1}, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_errors_have_no_validators(self):
+        self.client.force_authenticate(self.users.user2)
+
+        response = self.client.get(self.get_url("project-detail"))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert not response.has_header("ETag")
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, url_name):
+        path_params = {"user_id": self.project.user_id, "project_id": self.project.id}
+        if url_name == "project-list":
+            path_params.pop("project_id")
+        elif url_name.endswith("-detail") and not url_name.startswith("project"):
+            path_params["id"] = self.task.id if url_name.startswith("task") else self.credential.id
+        return reverse(url_name, kwargs=path_params)
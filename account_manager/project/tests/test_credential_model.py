@@ -0,0 +1,69 @@
+import pytest
+
+from project.crypto import CredentialCipher, get_cipher
+from project.models import Credential as CredentialModel
+
+from .conftest import Projects
+
+
+# ----- Credential Model Tests -----------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestCredentialModel:
+
+    model = CredentialModel
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, projects):
+        self.projects: Projects = projects
+
+    def test_save_encrypts_plaintext_password(self):
+        credential = self.create_credential("password")
+
+        assert CredentialCipher.is_encrypted(credential.password)
+        assert credential.decrypt_password() == "password"
+
+    def test_save_keeps_encrypted_password(self):
+        credential = self.create_credential("password")
+        encrypted_password = credential.password
+
+        credential.service_name = "GitLab"
+        credential.save()
+
+        assert self.model.objects.get(id=credential.id).password == encrypted_password
+
+    def test_save_does_not_decrypt(self, decrypt_calls):
+        credential = self.create_credential("password")
+        credential.save()
+
+        assert decrypt_calls == []
+
+    def test_decrypt_accepts_legacy_token_without_marker(self):
+        legacy_token = get_cipher().fernet.encrypt(b"password").decode()
+
+        assert get_cipher().decrypt(legacy_token) == "password"
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_decrypt_passwords(self, settings, max_workers):
+        settings.CREDENTIAL_CIPHER_CHUNK_SIZE = 2
+        credentials = [self.create_credential(f"password{index}") for index in range(5)]
+
+        passwords = self.model.objects.filter(id__in=[credential.id for credential in credentials]).decrypt_passwords(
+            max_workers=max_workers
+        )
+
+        assert passwords == {credential.id: f"password{index}" for index, credential in enumerate(credentials)}
+
+    def test_decrypt_passwords_of_empty_queryset(self):
+        assert self.model.objects.none().decrypt_passwords() == {}
+
+    # ----- Fixtures ---------------------------------------------------------------------------------------------------
+    @pytest.fixture
+    def decrypt_calls(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(CredentialCipher, "decrypt", lambda cipher, value: calls.append(value))
+        return calls
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def create_credential(self, password):
+        data = {"email": "user1@gmail.com", "password": password, "service_name": "GitHub"}
+        return self.model.objects.create(project=self.projects.project__user1, **data)
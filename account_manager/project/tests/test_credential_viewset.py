@@ -5,6 +5,7 @@ from django.urls import reverse
 from rest_framework import status
 
 from project.models import Credential as CredentialModel
+from project.serializers import CredentialSerializer
 
 from .conftest import Credentials, Projects, Users
 
@@ -15,19 +16,21 @@ R_TestCase = nt("Retrieve", ["auth_user", "credential", "expected_status"])
 U_TestCase = nt("Update", ["auth_user", "credential", "include_optional_fields", "expected_status"])
 P_TestCase = nt("PartialUpdate", ["auth_user", "credential", "expected_status"])
 D_TestCase = nt("Destroy", ["auth_user", "credential", "expected_status"])
+RV_TestCase = nt("Reveal", ["auth_user", "credential", "expected_status"])
+F_TestCase = nt("Fields", ["query_params", "expected_password"])
 
 # ----- CredentialViewSet Test Cases -----------------------------------------------------------------------------------
 list_credential_test_cases = [
     # "auth_user", "project", "expected_status"
     L_TestCase("not_auth", "project__user1", status.HTTP_401_UNAUTHORIZED),
-    L_TestCase("admin", "project__user1", status.HTTP_200_OK),
+    L_TestCase("admin", "project__user1", status.HTTP_403_FORBIDDEN),
     L_TestCase("user1", "project__user1", status.HTTP_200_OK),
     L_TestCase("user1", "project__user2", status.HTTP_403_FORBIDDEN),
 ]
 create_credential_test_cases = [
     # "auth_user", "project", "include_optional_fields", "expected_status"
     C_TestCase("not_auth", "project__user1", False, status.HTTP_401_UNAUTHORIZED),
-    C_TestCase("admin", "project__user1", False, status.HTTP_201_CREATED),
+    C_TestCase("admin", "project__user1", False, status.HTTP_403_FORBIDDEN),
     C_TestCase("user1", "project__user1", False, status.HTTP_201_CREATED),
     C_TestCase("user1", "project__user1", True, status.HTTP_201_CREATED),
     C_TestCase("user1", "project__user2", False, status.HTTP_403_FORBIDDEN),
@@ -35,31 +38,44 @@ create_credential_test_cases = [
 retrieve_credential_test_cases = [
     # "auth_user", "credential", "expected_status"
     R_TestCase("not_auth", "cred__project__user1", status.HTTP_401_UNAUTHORIZED),
-    R_TestCase("admin", "cred__project__user1", status.HTTP_200_OK),
+    R_TestCase("admin", "cred__project__user1", status.HTTP_403_FORBIDDEN),
     R_TestCase("user1", "cred__project__user1", status.HTTP_200_OK),
     R_TestCase("user1", "cred__project__user2", status.HTTP_403_FORBIDDEN),
 ]
 update_credential_test_cases = [
     # "auth_user", "credential", "include_optional_fields", "expected_status"
     U_TestCase("not_auth", "cred__project__user1", False, status.HTTP_401_UNAUTHORIZED),
-    U_TestCase("admin", "cred__project__user1", False, status.HTTP_200_OK),
+    U_TestCase("admin", "cred__project__user1", False, status.HTTP_403_FORBIDDEN),
     U_TestCase("user1", "cred__project__user1", False, status.HTTP_200_OK),
     U_TestCase("user1", "cred__project__user2", False, status.HTTP_403_FORBIDDEN),
 ]
 partial_update_credential_test_cases = [
     # "auth_user", "credential", "partial_update_data", "expected_status"
     P_TestCase("not_auth", "cred__project__user1", status.HTTP_401_UNAUTHORIZED),
-    P_TestCase("admin", "cred__project__user1", status.HTTP_200_OK),
+    P_TestCase("admin", "cred__project__user1", status.HTTP_403_FORBIDDEN),
     P_TestCase("user1", "cred__project__user1", status.HTTP_200_OK),
     P_TestCase("user1", "cred__project__user2", status.HTTP_403_FORBIDDEN),
 ]
 destroy_credential_test_cases = [
     # "auth_user", "credential", "expected_status"
     D_TestCase("not_auth", "cred__project__user1", status.HTTP_401_UNAUTHORIZED),
-    D_TestCase("admin", "cred__project__user1", status.HTTP_204_NO_CONTENT),
+    D_TestCase("admin", "cred__project__user1", status.HTTP_403_FORBIDDEN),
     D_TestCase("user1", "cred__project__user1", status.HTTP_204_NO_CONTENT),
     D_TestCase("user1", "cred__project__user2", status.HTTP_403_FORBIDDEN),
 ]
+reveal_credential_test_cases = [
+    # "auth_user", "credential", "expected_status"
+    RV_TestCase("not_auth", "cred__project__user1", status.HTTP_401_UNAUTHORIZED),
+    RV_TestCase("admin", "cred__project__user1", status.HTTP_403_FORBIDDEN),
+    RV_TestCase("user1", "cred__project__user1", status.HTTP_200_OK),
+    RV_TestCase("user1", "cred__project__user2", status.HTTP_403_FORBIDDEN),
+]
+fields_credential_test_cases = [
+    # "query_params", "expected_password"
+    F_TestCase({}, CredentialSerializer.password_mask),
+    F_TestCase({"fields": "service_name"}, None),
+    F_TestCase({"fields": "service_name,password"}, "password"),
+]
 
 
 # ----- CredentialViewSet Tests ----------------------------------------------------------------------------------------
@@ -92,8 +108,8 @@ class TestCredentialViewSet:
 
         assert response.status_code == test_case.expected_status
         if test_case.expected_status == status.HTTP_200_OK:
-            assert isinstance(response.data, list)
-            assert len(response.data) == self.initial_credential_count(project)
+            assert isinstance(response.data["results"], list)
+            assert len(response.data["results"]) == self.initial_credential_count(project)
 
     # ----- Create Credential ------------------------------------------------------------------------------------------
     @pytest.mark.parametrize("test_case", create_credential_test_cases)
@@ -171,6 +187,33 @@ class TestCredentialViewSet:
             assert self.model.objects.filter(id=credential.id).first() is None
             assert self.model.objects.filter(project=project).count() == credentials_count - 1
 
+    # ----- Reveal Credential ------------------------------------------------------------------------------------------
+    @pytest.mark.parametrize("test_case", reveal_credential_test_cases)
+    def test_reveal_credential(self, test_case: RV_TestCase):
+        client, credential = self.get_testcase_client_and_credential(test_case)
+        project, user = credential.project, credential.project.user
+
+        path_params = {"user_id": user.id, "project_id": project.id, "id": credential.id}
+        url = reverse("credential-reveal", kwargs=path_params)
+        response = client.get(url)
+
+        assert response.status_code == test_case.expected_status
+        if test_case.expected_status == status.HTTP_200_OK:
+            assert response.data.get("password") == credential.decrypt_password()
+
+    # ----- List Credential Fields -------------------------------------------------------------------------------------
+    @pytest.mark.parametrize("test_case", fields_credential_test_cases)
+    def test_list_credential_password(self, test_case: F_TestCase):
+        client = self.client(self.users.user1)
+        project = self.projects.project__user1
+
+        path_params = {"user_id": project.user.id, "project_id": project.id}
+        url = reverse("credential-list", kwargs=path_params)
+        response = client.get(url, data=test_case.query_params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(credential.get("password") == test_case.expected_password for credential in response.data["results"])
+
     # ----- Helper Methods ---------------------------------------------------------------------------------------------
     def initial_credential_count(self, project):
         return self.model.objects.filter(project=project).count()
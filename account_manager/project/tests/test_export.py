@@ -0,0 +1,158 @@
+import json
+import warnings
+from collections import namedtuple as nt
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from project.export import ProjectTreeExport
+from project.models import Credential as CredentialModel
+from project.models import Project as ProjectModel
+from project.models import Task as TaskModel
+from project.serializers import CredentialSerializer
+
+from .conftest import Users
+
+# ----- Export Test Case Schemas ---------------------------------------------------------------------------------------
+A_TestCase = nt("Access", ["auth_user", "user", "expected_status"])
+F_TestCase = nt("Format", ["query_params", "headers", "expected_content_type"])
+
+# ----- Export Test Cases ----------------------------------------------------------------------------------------------
+access_test_cases = [
+    # "auth_user", "user", "expected_status"
+    A_TestCase("not_auth", "user1", status.HTTP_401_UNAUTHORIZED),
+    A_TestCase("admin", "user1", status.HTTP_403_FORBIDDEN),
+    A_TestCase("user1", "user1", status.HTTP_200_OK),
+    A_TestCase("user1", "user2", status.HTTP_403_FORBIDDEN),
+]
+format_test_cases = [
+    # "query_params", "headers", "expected_content_type"
+    F_TestCase({}, {}, "application/json"),
+    F_TestCase({"format": "ndjson"}, {}, "application/x-ndjson"),
+    F_TestCase({}, {"Accept": "application/x-ndjson"}, "application/x-ndjson"),
+]
+
+PROJECTS_COUNT = 3
+CHILDREN_COUNT = 4
+
+
+# ----- Export Tests ---------------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestProjectExport:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users):
+        self.auth_client = auth_client
+        self.users: Users = users
+
+        self.create_projects(users.user1)
+
+    @pytest.mark.parametrize("test_case", access_test_cases)
+    def test_access(self, test_case: A_TestCase):
+        client = self.auth_client(getattr(self.users, test_case.auth_user))
+
+        # Revealed passwords are the most sensitive export, only the owner may get it
+        response = client.get(self.get_url(getattr(self.users, test_case.user)), {"reveal_passwords": "true"})
+
+        assert response.status_code == test_case.expected_status
+
+    @pytest.mark.parametrize("test_case", format_test_cases)
+    def test_format(self, test_case: F_TestCase):
+        client = self.auth_client(self.users.user1)
+
+        response = client.get(self.get_url(), test_case.query_params, headers=test_case.headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"].startswith(test_case.expected_content_type)
+
+    def test_export_json(self):
+        response = self.auth_client(self.users.user1).get(self.get_url())
+        projects = json.loads(b"".join(response.streaming_content))["projects"]
+
+        expected = ProjectModel.objects.filter(user=self.users.user1).order_by("id")
+        assert [project["id"] for project in projects] == list(expected.values_list("id", flat=True))
+        for project in projects:
+            credentials = CredentialModel.objects.filter(project_id=project["id"]).order_by("id")
+            tasks = TaskModel.objects.filter(project_id=project["id"]).order_by("id")
+            assert [credential["id"] for credential in project["credentials"]] == [obj.id for obj in credentials]
+            assert [task["id"] for task in project["tasks"]] == [obj.id for obj in tasks]
+            passwords = {credential["password"] for credential in project["credentials"]}
+            assert passwords <= {CredentialSerializer.password_mask}
+
+    def test_export_ndjson(self):
+        response = self.auth_client(self.users.user1).get(self.get_url(), {"format": "ndjson"})
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+
+        projects = ProjectModel.objects.filter(user=self.users.user1)
+        credentials = CredentialModel.objects.filter(project__in=projects)
+        tasks = TaskModel.objects.filter(project__in=projects)
+        assert sum(line["type"] == "project" for line in lines) == projects.count()
+        assert sum(line["type"] == "credential" for line in lines) == credentials.count()
+        assert sum(line["type"] == "task" for line in lines) == tasks.count()
+
+        project_id = None
+        for line in lines:
+            if line["type"] == "project":
+                project_id = line["id"]
+            else:
+                assert line["project"] == project_id
+
+    def test_export_reveals_passwords(self):
+        query_params = {"format": "ndjson", "reveal_passwords": "true"}
+
+        response = self.auth_client(self.users.user1).get(self.get_url(), query_params)
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+
+        credentials = [line for line in lines if line["type"] == "credential"]
+        assert credentials
+        assert CredentialSerializer.password_mask not in {credential["password"] for credential in credentials}
+
+    def test_export_query_count(self, django_assert_max_num_queries):
+        response = self.auth_client(self.users.user1).get(self.get_url())
+
+        # Projects, credentials and tasks, each read with a server-side cursor, plus the transaction savepoint
+        with django_assert_max_num_queries(5):
+            b"".join(response.streaming_content)
+
+    def test_export_streams_under_asgi(self):
+        dumps = mock.patch.object(ProjectTreeExport, "dumps", autospec=True, side_effect=ProjectTreeExport.dumps)
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(self.users.user1)}"}
+
+        async def read():
+            response = await AsyncClient().get(self.get_url(), {"format": "ndjson"}, headers=headers)
+            chunks = [await anext(response.streaming_content)]
+            dumped = serializer.call_count  # when the first chunk is sent
+            chunks += [chunk async for chunk in response.streaming_content]
+            return response, chunks, dumped
+
+        with dumps as serializer, mock.patch.object(ProjectTreeExport, "batch_size", 5), warnings.catch_warnings():
+            warnings.filterwarnings("error", "StreamingHttpResponse must consume")  # a sync iterator read whole
+            response, chunks, dumped = async_to_sync(read)()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.is_async
+        assert len(chunks) > 1
+        assert dumped < serializer.call_count == len(b"".join(chunks).splitlines())
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, user=None):
+        return reverse("project-export", kwargs={"user_id": (user or self.users.user1).id})
+
+    def create_projects(self, user):
+        credential_data = {"email": "user1@gmail.com", "password": "password", "service_name": "GitHub"}
+        for index in range(PROJECTS_COUNT):
+            project = ProjectModel.objects.create(user=user, title=f"Export {index}")
+            CredentialModel.objects.bulk_create(
+                [CredentialModel(project=project, **credential_data) for _ in range(CHILDREN_COUNT)]
+            )
+            TaskModel.objects.bulk_create(
+                [TaskModel(project=project, title=f"Task {position}") for position in range(CHILDREN_COUNT)]
+            )
+        ProjectModel.objects.create(user=user, title="Empty")
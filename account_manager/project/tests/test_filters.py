@@ -0,0 +1,153 @@
+import warnings
+from collections import namedtuple as nt
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Project as ProjectModel
+from project.models import Task as TaskModel
+
+from .conftest import Users
+
+# ----- Filters Test Case Schemas --------------------------------------------------------------------------------------
+F_TestCase = nt("Filter", ["url_name", "query_params", "expected_names"])
+O_TestCase = nt("Ordering", ["url_name", "ordering", "expected_names"])
+I_TestCase = nt("Invalid", ["url_name", "query_params", "expected_errors"])
+
+# ----- Filters Test Cases ---------------------------------------------------------------------------------------------
+filter_test_cases = [
+    # "url_name", "query_params", "expected_names"
+    F_TestCase("task-list", {}, ["Later", "Tomorrow", "Inactive", "No Reminder"]),
+    F_TestCase("task-list", {"is_active": "false"}, ["Inactive"]),
+    F_TestCase("task-list", {"is_active": "true"}, ["Later", "Tomorrow", "No Reminder"]),
+    F_TestCase("task-list", {"remind_at__isnull": "true"}, ["No Reminder"]),
+    F_TestCase("task-list", {"remind_at__gte": "days:1"}, ["Later", "Tomorrow"]),
+    F_TestCase("task-list", {"remind_at__gte": "days:1", "remind_at__lte": "days:5"}, ["Tomorrow"]),
+    F_TestCase("task-list", {"is_active": "true", "remind_at__lte": "days:5"}, ["Tomorrow"]),
+    F_TestCase("task-list", {"created_at__gte": "days:1"}, []),
+    F_TestCase("task-list", {"created_at__lte": "days:1"}, ["Later", "Tomorrow", "Inactive", "No Reminder"]),
+    F_TestCase("task-list", {"title": "Later"}, ["Later", "Tomorrow", "Inactive", "No Reminder"]),
+    F_TestCase("credential-list", {"service_name": "GitHub"}, ["GitHub"]),
+    F_TestCase("credential-list", {"service_name": "github"}, []),
+]
+ordering_test_cases = [
+    # "url_name", "ordering", "expected_names"
+    O_TestCase("task-list", "title", ["Inactive", "Later", "No Reminder", "Tomorrow"]),
+    O_TestCase("task-list", "-title", ["Tomorrow", "No Reminder", "Later", "Inactive"]),
+    O_TestCase("task-list", "created_at", ["No Reminder", "Inactive", "Tomorrow", "Later"]),
+    O_TestCase("credential-list", "service_name", ["AWS", "GitHub", "GitLab"]),
+    O_TestCase("credential-list", "-service_name", ["GitLab", "GitHub", "AWS"]),
+]
+invalid_test_cases = [
+    # "url_name", "query_params", "expected_errors"
+    I_TestCase("task-list", {"is_active": "maybe"}, ["is_active"]),
+    I_TestCase("task-list", {"remind_at__gte": "tomorrow"}, ["remind_at__gte"]),
+    I_TestCase("task-list", {"ordering": "remind_at"}, ["ordering"]),
+    I_TestCase("task-list", {"ordering": "title,description"}, ["ordering"]),
+    I_TestCase("credential-list", {"ordering": "password"}, ["ordering"]),
+    I_TestCase("task-list", {"ordering": "title,-title"}, ["ordering"]),
+    I_TestCase("credential-list", {"ordering": "service_name,created_at,service_name"}, ["ordering"]),
+]
+
+
+# ----- Filters Tests --------------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestFilters:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users):
+        self.client = auth_client(users.user1)
+        self.users: Users = users
+
+        self.now = timezone.now()
+        self.project = ProjectModel.objects.create(user=users.user1, title="Filtered")
+        for title, remind_at, is_active in [
+            ("No Reminder", None, True),
+            ("Inactive", self.now, False),
+            ("Tomorrow", self.now + timedelta(days=2), True),
+            ("Later", self.now + timedelta(days=10), True),
+        ]:
+            TaskModel.objects.create(project=self.project, title=title, remind_at=remind_at, is_active=is_active)
+        for service_name in ("GitHub", "AWS", "GitLab"):
+            CredentialModel.objects.create(
+                project=self.project, email="user1@gmail.com", password="password", service_name=service_name
+            )
+
+    @pytest.mark.parametrize("test_case", filter_test_cases)
+    def test_filter(self, test_case: F_TestCase):
+        response = self.client.get(self.get_url(test_case.url_name), self.get_query_params(test_case.query_params))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.get_names(response) == test_case.expected_names
+
+    @pytest.mark.parametrize("test_case", ordering_test_cases)
+    def test_ordering(self, test_case: O_TestCase):
+        response = self.client.get(self.get_url(test_case.url_name), {"ordering": test_case.ordering})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.get_names(response) == test_case.expected_names
+
+    @pytest.mark.parametrize("test_case", ordering_test_cases)
+    def test_ordering_cursor(self, test_case: O_TestCase):
+        query_params = {"ordering": test_case.ordering, "fields": "id,title,service_name", "page_size": 1}
+
+        names, url = [], self.get_url(test_case.url_name)
+        while url:
+            response = self.client.get(url, query_params)
+            names += self.get_names(response)
+            url, query_params = response.data["next"], None  # the next link keeps the ordering
+
+        assert names == test_case.expected_names
+
+    def test_ordering_and_filter(self):
+        query_params = {"ordering": "-title", "is_active": "true", "remind_at__isnull": "false"}
+
+        response = self.client.get(self.get_url("task-list"), query_params)
+
+        assert self.get_names(response) == ["Tomorrow", "Later"]
+
+    @pytest.mark.parametrize("param", ["remind_at__gte", "created_at__lte"])
+    def test_naive_timestamp_is_aware(self, param):
+        value = (self.now + timedelta(days=1)).replace(tzinfo=None).isoformat()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)  # a naive value warns when it reaches the query
+            response = self.client.get(self.get_url("task-list"), {param: value})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"]
+
+    def test_sparse_ordering_query_count(self, django_assert_num_queries):
+        url = self.get_url("task-list")
+
+        # The project lookup, the aggregate query and the page, the title of the last row is loaded with the page
+        with django_assert_num_queries(3):
+            response = self.client.get(url, {"ordering": "title", "fields": "id", "page_size": 1})
+
+        assert response.data["next"]
+
+    @pytest.mark.parametrize("test_case", invalid_test_cases)
+    def test_invalid_params(self, test_case: I_TestCase):
+        response = self.client.get(self.get_url(test_case.url_name), test_case.query_params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data) == test_case.expected_errors
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_names(self, response):
+        return [item.get("title") or item.get("service_name") for item in response.data["results"]]
+
+    def get_url(self, url_name):
+        return reverse(url_name, kwargs={"user_id": self.users.user1.id, "project_id": self.project.id})
+
+    def get_query_params(self, query_params):
+        """Replaces `days:<n>` values with the ISO timestamp of now plus n days"""
+        return {
+            param: (self.now + timedelta(days=int(value[5:]))).isoformat() if value.startswith("days:") else value
+            for param, value in query_params.items()
+        }
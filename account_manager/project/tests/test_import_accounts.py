@@ -0,0 +1,219 @@
+import json
+from collections import namedtuple as nt
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+
+from project.crypto import CredentialCipher
+from project.models import Credential as CredentialModel
+from project.models import Project as ProjectModel
+from project.models import Task as TaskModel
+from project.serializers import CredentialSerializer
+
+from .conftest import Projects, Users
+
+# ----- Import Test Case Schemas ---------------------------------------------------------------------------------------
+C_TestCase = nt("Command", ["file_name", "content", "options", "expected_credentials", "expected_tasks"])
+A_TestCase = nt("Access", ["auth_user", "project", "expected_status"])
+I_TestCase = nt("InvalidRow", ["file_name", "content", "expected_rows", "expected_field"])
+
+CSV_CREDENTIALS = (
+    "email,password,service_name,username\n"
+    "user1@gmail.com,password1,GitHub,user1\n"
+    'user2@gmail.com,"pass,word",GitLab,\n'
+)
+NDJSON_ROWS = (
+    '{"type": "project", "id": 1, "title": "Exported"}\n'
+    '{"type": "credential", "email": "user1@gmail.com", "password": "password1", "service_name": "GitHub"}\n'
+    '{"type": "task", "title": "Task 1", "is_active": false}\n'
+    "\n"
+    '{"type": "task", "title": "Task 2", "remind_at": "2030-01-01T10:00:00Z"}\n'
+)
+
+MASKED_CREDENTIAL = json.dumps(
+    {
+        "type": "credential",
+        "email": "user1@gmail.com",
+        "password": CredentialSerializer.password_mask,
+        "service_name": "X",
+    }
+)
+
+# ----- Import Test Cases ----------------------------------------------------------------------------------------------
+command_test_cases = [
+    # "file_name", "content", "options", "expected_credentials", "expected_tasks"
+    C_TestCase("credentials.csv", CSV_CREDENTIALS, {"type": "credential"}, 2, 0),
+    C_TestCase("credentials.csv", CSV_CREDENTIALS, {"type": "credential", "no_copy": True}, 2, 0),
+    C_TestCase("export.ndjson", NDJSON_ROWS, {}, 1, 2),
+    C_TestCase("export.ndjson", NDJSON_ROWS, {"batch_size": 1}, 1, 2),
+    C_TestCase("tasks.txt", "title\nTask 1\nTask 2\nTask 3\n", {"format": "csv", "type": "task"}, 0, 3),
+]
+access_test_cases = [
+    # "auth_user", "project", "expected_status"
+    A_TestCase("not_auth", "project__user1", status.HTTP_401_UNAUTHORIZED),
+    A_TestCase("user1", "project__user1", status.HTTP_201_CREATED),
+    A_TestCase("user1", "project__user2", status.HTTP_403_FORBIDDEN),
+]
+invalid_row_test_cases = [
+    # "file_name", "content", "expected_rows", "expected_field"
+    I_TestCase(
+        "export.ndjson", '{"type": "task", "title": "Task 1"}\n{"type": "task", "title": \n', [2], "non_field_errors"
+    ),
+    I_TestCase("export.ndjson", '{"type": "task", "title": "Task 1"}\n' + MASKED_CREDENTIAL + "\n", [2], "password"),
+]
+
+
+# ----- import_accounts Tests ------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestImportAccounts:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, users, tmp_path):
+        self.tmp_path = tmp_path
+        self.project = ProjectModel.objects.create(user=users.user1, title="Import")
+
+    @pytest.mark.parametrize("test_case", command_test_cases)
+    def test_import_accounts(self, test_case: C_TestCase):
+        path = self.write_file(test_case.file_name, test_case.content)
+
+        call_command("import_accounts", self.project.id, path, **test_case.options)
+
+        credentials = CredentialModel.objects.filter(project=self.project)
+        assert credentials.count() == test_case.expected_credentials
+        assert TaskModel.objects.filter(project=self.project).count() == test_case.expected_tasks
+        assert all(CredentialCipher.is_encrypted(credential.password) for credential in credentials)
+        assert set(credentials.decrypt_passwords().values()) <= {"password1", "pass,word"}
+        assert not path.with_name(f"{path.name}.checkpoint").exists()
+
+    def test_import_accounts_skips_invalid_rows(self, capsys):
+        content = CSV_CREDENTIALS + "not-an-email,password,GitHub,\n,password,GitHub,\n"
+        path = self.write_file("credentials.csv", content)
+
+        call_command("import_accounts", self.project.id, path, type="credential")
+
+        assert CredentialModel.objects.filter(project=self.project).count() == 2
+        errors = capsys.readouterr().err
+        assert "Row 3" in errors and "Row 4" in errors
+
+    def test_import_accounts_reports_invalid_json(self, capsys):
+        path = self.write_file("export.ndjson", NDJSON_ROWS + "{not json}\n")
+
+        call_command("import_accounts", self.project.id, path)
+
+        assert TaskModel.objects.filter(project=self.project).count() == 2
+        assert "Row 5" in capsys.readouterr().err
+
+    def test_import_accounts_rejects_undecodable_file(self):
+        path = self.tmp_path / "tasks.csv"
+        path.write_bytes("title\nT\u00e2che\n".encode("latin-1"))
+
+        with pytest.raises(CommandError, match="UTF-8"):
+            call_command("import_accounts", self.project.id, path, type="task")
+
+    def test_import_accounts_resumes_from_checkpoint(self):
+        path = self.write_file("tasks.csv", "title\nTask 1\nTask 2\nTask 3\n")
+        path.with_name(f"{path.name}.checkpoint").write_text(json.dumps({"rows": 2}))
+
+        call_command("import_accounts", self.project.id, path, type="task")
+
+        assert list(TaskModel.objects.filter(project=self.project).values_list("title", flat=True)) == ["Task 3"]
+
+    def test_imported_rows_match_created_ones(self):
+        path = self.write_file("export.ndjson", NDJSON_ROWS)
+
+        call_command("import_accounts", self.project.id, path)
+
+        task = TaskModel.objects.get(project=self.project, title="Task 2")
+        assert task.is_active and task.remind_at.year == 2030
+        assert task.created_at and task.updated_at and task.reminder_sent_at is None
+        assert not TaskModel.objects.get(project=self.project, title="Task 1").is_active
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def write_file(self, name, content):
+        path = self.tmp_path / name
+        path.write_text(content)
+        return path
+
+
+# ----- ProjectImportView Tests ----------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestProjectImportView:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects):
+        self.auth_client = auth_client
+        self.users: Users = users
+        self.projects: Projects = projects
+
+    @pytest.mark.parametrize("test_case", access_test_cases)
+    def test_access(self, test_case: A_TestCase):
+        client = self.auth_client(getattr(self.users, test_case.auth_user))
+        project = getattr(self.projects, test_case.project)
+
+        response = client.post(self.get_url(project), {"file": self.get_file("export.ndjson", NDJSON_ROWS)})
+
+        assert response.status_code == test_case.expected_status
+
+    def test_import(self):
+        project = self.projects.project__user1
+        credentials_count = CredentialModel.objects.filter(project=project).count()
+        data = {"file": self.get_file("credentials.csv", CSV_CREDENTIALS), "type": "credential"}
+
+        response = self.auth_client(self.users.user1).post(self.get_url(project), data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["imported"] == 2
+        assert "rows_per_second" in response.data
+        assert CredentialModel.objects.filter(project=project).count() == credentials_count + 2
+
+    def test_import_is_rolled_back_on_errors(self):
+        project = self.projects.project__user1
+        tasks_count = TaskModel.objects.filter(project=project).count()
+        data = {"file": self.get_file("tasks.csv", "title\nTask 1\n,\nTask 3\n"), "type": "task"}
+
+        response = self.auth_client(self.users.user1).post(self.get_url(project), data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["imported"] == 0
+        assert [error["row"] for error in response.data["errors"]] == [2]
+        assert TaskModel.objects.filter(project=project).count() == tasks_count
+
+    @pytest.mark.parametrize("test_case", invalid_row_test_cases)
+    def test_import_reports_invalid_rows(self, test_case: I_TestCase):
+        project = self.projects.project__user1
+        data = {"file": self.get_file(test_case.file_name, test_case.content)}
+
+        response = self.auth_client(self.users.user1).post(self.get_url(project), data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [error["row"] for error in response.data["errors"]] == test_case.expected_rows
+        assert all(test_case.expected_field in error["errors"] for error in response.data["errors"])
+
+    def test_import_rejects_undecodable_file(self):
+        project = self.projects.project__user1
+        tasks_count = TaskModel.objects.filter(project=project).count()
+        upload = SimpleUploadedFile("tasks.csv", "title\nTask 1\nT\u00e2che\n".encode("latin-1"))
+
+        response = self.auth_client(self.users.user1).post(self.get_url(project), {"file": upload, "type": "task"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file" in response.data
+        assert TaskModel.objects.filter(project=project).count() == tasks_count
+
+    def test_import_requires_known_format(self):
+        data = {"file": self.get_file("tasks.txt", "title\nTask 1\n"), "type": "task"}
+
+        response = self.auth_client(self.users.user1).post(self.get_url(self.projects.project__user1), data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file_format" in response.data
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, project):
+        return reverse("project-import", kwargs={"user_id": project.user_id, "project_id": project.id})
+
+    def get_file(self, name, content):
+        return SimpleUploadedFile(name, content.encode())
@@ -0,0 +1,106 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from project.models import Credential as CredentialModel
+from project.models import Project as ProjectModel
+from project.models import Task as TaskModel
+from project.search import parse_search_query
+
+from .conftest import Projects
+
+# ----- Index Test Case Schemas ----------------------------------------------------------------------------------------
+I_TestCase = nt("Index", ["access_path", "get_queryset", "expected_index"])
+
+# ----- Index Test Cases -----------------------------------------------------------------------------------------------
+index_test_cases = [
+    # "access_path", "get_queryset", "expected_index"
+    I_TestCase(
+        "project list",
+        lambda project: ProjectModel.objects.filter(user_id=project.user_id).order_by("-created_at", "-id"),
+        "project_user_created_idx",
+    ),
+    I_TestCase(
+        "task list",
+        lambda project: TaskModel.objects.filter(project_id=project.id).order_by("-created_at", "-id"),
+        "task_project_created_idx",
+    ),
+    I_TestCase(
+        "task list by title",
+        lambda project: TaskModel.objects.filter(project_id=project.id).order_by("title", "id"),
+        "task_project_title_idx",
+    ),
+    I_TestCase(
+        "task list by a reminder range",
+        lambda project: TaskModel.objects.filter(project_id=project.id, remind_at__gte=timezone.now()).order_by(
+            "remind_at", "id"
+        ),
+        "task_project_remind_at_idx",
+    ),
+    I_TestCase(
+        "task lookups by project",
+        lambda project: TaskModel.objects.filter(project_id=project.id).order_by("id"),
+        "task_project_id_idx",
+    ),
+    I_TestCase(
+        "due reminders",
+        lambda project: TaskModel.objects.due(timezone.now()).order_by("remind_at", "id"),
+        "task_pending_remind_at_idx",
+    ),
+    I_TestCase(
+        "next reminder of a project",
+        lambda project: TaskModel.objects.pending().filter(project_id=project.id).order_by("remind_at"),
+        "task_project_pending_idx",
+    ),
+    I_TestCase(
+        "credential list",
+        lambda project: CredentialModel.objects.filter(project_id=project.id).order_by("-created_at", "-id"),
+        "credential_project_created_idx",
+    ),
+    I_TestCase(
+        "credential list by service name",
+        lambda project: CredentialModel.objects.filter(project_id=project.id, service_name="GitHub").order_by("id"),
+        "credential_project_service_idx",
+    ),
+    I_TestCase(
+        "credential lookups by project",
+        lambda project: CredentialModel.objects.filter(project_id=project.id).order_by("id"),
+        "credential_project_id_idx",
+    ),
+]
+
+
+# ----- Index Tests ----------------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="EXPLAIN plans are checked against PostgreSQL")
+class TestIndexes:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, projects):
+        self.projects: Projects = projects
+
+        # The test tables are tiny, a sequential scan or sorting a handful of rows would always win without this
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_bitmapscan = off")
+            cursor.execute("SET LOCAL enable_sort = off")
+
+    @pytest.mark.parametrize("test_case", index_test_cases, ids=lambda test_case: test_case.access_path)
+    def test_access_path_uses_index(self, test_case: I_TestCase):
+        plan = test_case.get_queryset(self.projects.project__user1).explain()
+
+        assert "Index" in plan
+        assert test_case.expected_index in plan
+
+    @pytest.mark.parametrize("model", [TaskModel, CredentialModel], ids=lambda model: model.__name__)
+    def test_search_uses_gin_index(self, model):
+        # GIN indexes are only read through bitmap scans
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_bitmapscan = on")
+
+        plan = model.objects.filter(search_vector=parse_search_query("aws")).explain()
+
+        assert f"{model.__name__.lower()}_search_idx" in plan
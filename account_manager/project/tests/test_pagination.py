@@ -0,0 +1,125 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Project as ProjectModel
+from project.models import Task as TaskModel
+from project.pagination import CursorPagination
+
+from .conftest import Projects, Users
+
+# ----- CursorPagination Test Case Schemas -----------------------------------------------------------------------------
+L_TestCase = nt("List", ["url_name", "model"])
+
+# ----- CursorPagination Test Cases ------------------------------------------------------------------------------------
+list_test_cases = [
+    # "url_name", "model"
+    L_TestCase("project-list", ProjectModel),
+    L_TestCase("task-list", TaskModel),
+    L_TestCase("credential-list", CredentialModel),
+]
+
+OBJECTS_COUNT = 23
+PAGE_SIZE = 5
+
+
+# ----- CursorPagination Tests -----------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestCursorPagination:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects, without_silk):
+        self.users: Users = users
+        self.projects: Projects = projects
+        self.client = auth_client(users.user1)
+
+    @pytest.mark.parametrize("test_case", list_test_cases)
+    def test_walks_all_pages_in_order(self, test_case: L_TestCase):
+        self.create_objects(test_case.model)
+        queryset = self.get_queryset(test_case.model).order_by("-created_at", "-id")
+        expected_ids = list(queryset.values_list("id", flat=True))
+
+        ids, url = [], self.get_url(test_case)
+        while url:
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            ids += [item["id"] for item in response.data["results"]]
+            url = response.data["next"]
+
+        assert ids == expected_ids
+
+    @pytest.mark.parametrize("test_case", list_test_cases)
+    def test_query_cost_is_flat(self, test_case: L_TestCase):
+        self.create_objects(test_case.model)
+
+        queries_per_page, url = [], self.get_url(test_case)
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+            queries_per_page.append(context.captured_queries)
+            url = response.data["next"]
+
+        assert len(queries_per_page) > 2
+        assert len({len(queries) for queries in queries_per_page}) == 1
+        assert not any("OFFSET" in query["sql"] for queries in queries_per_page for query in queries)
+
+    @pytest.mark.parametrize("test_case", list_test_cases)
+    def test_previous_link_returns_previous_page(self, test_case: L_TestCase):
+        self.create_objects(test_case.model)
+
+        first_page = self.client.get(self.get_url(test_case)).data
+        second_page = self.client.get(first_page["next"]).data
+        previous_page = self.client.get(second_page["previous"]).data
+
+        assert first_page["previous"] is None
+        assert previous_page["results"] == first_page["results"]
+
+    def test_page_size_is_capped(self, monkeypatch):
+        monkeypatch.setattr(CursorPagination, "max_page_size", 10)
+        self.create_objects(TaskModel)
+        url = reverse("task-list", kwargs=self.get_path_params("task-list"))
+
+        assert len(self.client.get(url, data={"page_size": 10_000}).data["results"]) == 10
+        assert len(self.client.get(url, data={"page_size": 2}).data["results"]) == 2
+
+    def test_invalid_cursor(self):
+        url = reverse("task-list", kwargs=self.get_path_params("task-list"))
+        response = self.client.get(url, data={"cursor": "cD1bIm5vdC1hLWRhdGUiLCAiMSJd"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, test_case):
+        return reverse(test_case.url_name, kwargs=self.get_path_params(test_case.url_name)) + f"?page_size={PAGE_SIZE}"
+
+    def get_path_params(self, url_name):
+        project = self.projects.project__user1
+        if url_name == "project-list":
+            return {"user_id": project.user.id}
+        return {"user_id": project.user.id, "project_id": project.id}
+
+    def get_queryset(self, model):
+        project = self.projects.project__user1
+        if model is ProjectModel:
+            return model.objects.filter(user=project.user)
+        return model.objects.filter(project=project)
+
+    def create_objects(self, model):
+        project = self.projects.project__user1
+        for index in range(OBJECTS_COUNT):
+            if model is ProjectModel:
+                model.objects.create(user=project.user, title=f"project{index}")
+            elif model is TaskModel:
+                model.objects.create(project=project, title=f"task{index}")
+            else:
+                model.objects.create(project=project, email="user1@gmail.com", password="password", service_name="S")
+
+        # Objects created within the same instant must still be paginated without gaps or duplicates
+        same_instant_ids = self.get_queryset(model).order_by("id").values_list("id", flat=True)[: OBJECTS_COUNT // 2]
+        model.objects.filter(id__in=list(same_instant_ids)).update(created_at=timezone.now())
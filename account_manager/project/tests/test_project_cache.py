@@ -0,0 +1,103 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Task as TaskModel
+
+from .conftest import Projects, Users
+
+# ----- Project Cache Test Case Schemas --------------------------------------------------------------------------------
+I_TestCase = nt("Invalidation", ["url_name", "method", "data"])
+
+# ----- Project Cache Test Cases ---------------------------------------------------------------------------------------
+invalidation_test_cases = [
+    # "url_name", "method", "data"
+    I_TestCase("task-list", "post", {"title": "New Task"}),
+    I_TestCase("task-detail", "patch", {"title": "Updated Task"}),
+    I_TestCase("task-detail", "delete", None),
+    I_TestCase("task-bulk", "post", [{"title": "New Task"}]),
+    I_TestCase("task-bulk", "delete", {"ids": []}),
+    I_TestCase("credential-detail", "patch", {"service_name": "GitLab"}),
+    I_TestCase("credential-detail", "delete", None),
+    I_TestCase("project-detail", "patch", {"title": "Updated Project"}),
+]
+
+PLAINTEXT_PASSWORD = "plaintext-password-1234"
+
+
+# ----- Project Cache Tests --------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestProjectCache:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects):
+        self.client = auth_client(users.user1)
+        self.users: Users = users
+        self.projects: Projects = projects
+
+        self.project = projects.project__user1
+        self.task = TaskModel.objects.create(project=self.project, title="Cached Task")
+        self.credential = CredentialModel.objects.create(
+            project=self.project, email="user1@gmail.com", password=PLAINTEXT_PASSWORD, service_name="GitHub"
+        )
+
+    @pytest.mark.parametrize("url_name", ["project-list", "project-detail"])
+    def test_response_is_cached(self, url_name, django_assert_num_queries):
+        url = self.get_url(url_name)
+        response = self.client.get(url)
+
+        with django_assert_num_queries(0):
+            cached_response = self.client.get(url)
+
+        assert cached_response.status_code == status.HTTP_200_OK
+        assert cached_response.data == response.data
+
+    @pytest.mark.parametrize("test_case", invalidation_test_cases)
+    def test_writes_invalidate_project_detail(self, test_case: I_TestCase):
+        detail_url = self.get_url("project-detail")
+        response = self.client.get(detail_url)
+
+        data = {"ids": [self.task.id]} if test_case.data == {"ids": []} else test_case.data
+        write_response = getattr(self.client, test_case.method)(self.get_url(test_case.url_name), data, format="json")
+
+        assert write_response.status_code < status.HTTP_400_BAD_REQUEST
+        assert self.client.get(detail_url).data != response.data
+
+    def test_orm_writes_invalidate_project_list(self):
+        list_url = self.get_url("project-list")
+        self.client.get(list_url)
+
+        self.project.title = "Renamed"
+        self.project.save()
+
+        titles = {project["title"] for project in self.client.get(list_url).data["results"]}
+        assert "Renamed" in titles
+
+    def test_cached_response_is_not_served_to_other_users(self):
+        url = self.get_url("project-detail")
+        self.client.get(url)
+
+        self.client.force_authenticate(self.users.user2)
+
+        assert self.client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_passwords_are_not_cached_in_plaintext(self):
+        self.client.get(self.get_url("project-detail"))
+
+        cached_values = b"".join(value for value in cache._cache.values())
+        assert cached_values
+        assert PLAINTEXT_PASSWORD.encode() not in cached_values
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, url_name):
+        path_params = {"user_id": self.project.user_id, "project_id": self.project.id}
+        if url_name == "project-list":
+            path_params.pop("project_id")
+        elif url_name.endswith("-detail") and not url_name.startswith("project"):
+            path_params["id"] = self.task.id if url_name.startswith("task") else self.credential.id
+        return reverse(url_name, kwargs=path_params)
@@ -0,0 +1,80 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from project.models import Task as TaskModel
+
+from .conftest import Projects, Users
+
+# ----- ProjectScopeMixin Test Case Schemas ----------------------------------------------------------------------------
+S_TestCase = nt("Scope", ["auth_user", "path_user", "project", "expected_status", "max_queries"])
+
+# ----- ProjectScopeMixin Test Cases -----------------------------------------------------------------------------------
+scope_test_cases = [
+    # "auth_user", "path_user", "project", "expected_status", "max_queries"
+    S_TestCase("user1", "user1", "project__user1", status.HTTP_200_OK, 3),
+    S_TestCase("user1", "user2", "project__user2", status.HTTP_403_FORBIDDEN, 0),
+    S_TestCase("user1", "user1", "project__user2", status.HTTP_404_NOT_FOUND, 1),
+    S_TestCase("admin", "user2", "project__user2", status.HTTP_403_FORBIDDEN, 0),
+    S_TestCase("admin", "user1", "project__user1", status.HTTP_403_FORBIDDEN, 0),
+]
+
+
+# ----- ProjectScopeMixin Tests ----------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestProjectScopeMixin:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects):
+        self.client = auth_client
+        self.users: Users = users
+        self.projects: Projects = projects
+
+    @pytest.mark.parametrize("test_case", scope_test_cases)
+    def test_list_scope(self, test_case: S_TestCase, django_assert_max_num_queries):
+        client = self.client(getattr(self.users, test_case.auth_user))
+        project = getattr(self.projects, test_case.project)
+
+        path_params = {"user_id": getattr(self.users, test_case.path_user).id, "project_id": project.id}
+        url = reverse("task-list", kwargs=path_params)
+        with django_assert_max_num_queries(test_case.max_queries):
+            response = client.get(url)
+
+        assert response.status_code == test_case.expected_status
+        if test_case.expected_status == status.HTTP_200_OK:
+            assert {task["project"] for task in response.data["results"]} == {project.id}
+
+    def test_create_is_scoped_to_url_project(self):
+        client = self.client(self.users.user1)
+        project = self.projects.project__user1
+
+        url = reverse("task-list", kwargs={"user_id": project.user.id, "project_id": project.id})
+        response = client.post(url, data={"title": "Scoped Task", "project": self.projects.project__user2.id})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert TaskModel.objects.get(id=response.data["id"]).project_id == project.id
+
+    def test_retrieve_uses_id_from_url(self):
+        client = self.client(self.users.user1)
+        project = self.projects.project__user1
+        tasks = [TaskModel.objects.create(project=project, title=f"task{index}") for index in range(3)]
+
+        for task in tasks:
+            path_params = {"user_id": project.user.id, "project_id": project.id, "id": task.id}
+            response = client.get(reverse("task-detail", kwargs=path_params))
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data["id"] == task.id
+
+    def test_retrieve_child_of_other_project(self):
+        client = self.client(self.users.user1)
+        project = self.projects.project__user1
+        foreign_task = TaskModel.objects.create(project=self.projects.project__user2, title="foreign")
+
+        path_params = {"user_id": project.user.id, "project_id": project.id, "id": foreign_task.id}
+        response = client.get(reverse("task-detail", kwargs=path_params))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Project as ProjectModel
+from project.models import Task as TaskModel
+
+from .conftest import Users
+
+PROJECTS_COUNT = 5
+
+
+# ----- Project Stats Tests --------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestProjectStats:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users):
+        self.client = auth_client(users.user1)
+        self.users: Users = users
+
+        self.now = timezone.now()
+        self.project = ProjectModel.objects.create(user=users.user1, title="Dashboard")
+        self.empty_project = ProjectModel.objects.create(user=users.user1, title="Empty")
+        TaskModel.objects.bulk_create(
+            [
+                TaskModel(project=self.project, title="Pending", remind_at=self.now + timedelta(days=2)),
+                TaskModel(project=self.project, title="Next", remind_at=self.now + timedelta(days=1)),
+                TaskModel(project=self.project, title="Sent", remind_at=self.now, reminder_sent_at=self.now),
+                TaskModel(project=self.project, title="No Reminder"),
+                TaskModel(project=self.project, title="Inactive", remind_at=self.now, is_active=False),
+            ]
+        )
+        CredentialModel.objects.bulk_create(
+            [
+                CredentialModel(project=self.project, email="user1@gmail.com", password="password", service_name=name)
+                for name in ("GitHub", "GitLab")
+            ]
+        )
+
+    def test_list_stats(self):
+        response = self.client.get(self.get_url(), {"expand": "stats"})
+
+        assert response.status_code == status.HTTP_200_OK
+        stats = {project["id"]: project["stats"] for project in response.data["results"]}
+        assert stats[self.project.id]["active_tasks"] == 4
+        assert stats[self.project.id]["credentials"] == 2
+        assert parse_datetime(stats[self.project.id]["next_reminder_at"]) == self.now + timedelta(days=1)
+        assert stats[self.empty_project.id] == {"active_tasks": 0, "credentials": 0, "next_reminder_at": None}
+
+    def test_detail_stats(self):
+        url = reverse("project-detail", kwargs={"user_id": self.users.user1.id, "project_id": self.project.id})
+
+        response = self.client.get(url, {"expand": "stats", "fields": "id"})
+
+        assert response.data == {"id": self.project.id, "stats": {**response.data["stats"], "active_tasks": 4}}
+
+    def test_stats_are_not_stale(self):
+        self.client.get(self.get_url(), {"expand": "stats"})
+
+        self.client.post(self.get_task_list_url(), {"title": "New Task"}, format="json")
+
+        response = self.client.get(self.get_url(), {"expand": "stats"})
+        stats = {project["id"]: project["stats"] for project in response.data["results"]}
+        assert stats[self.project.id]["active_tasks"] == 5
+
+    def test_stats_query_count(self, django_assert_num_queries):
+        for index in range(PROJECTS_COUNT):
+            project = ProjectModel.objects.create(user=self.users.user1, title=f"Project {index}")
+            TaskModel.objects.create(project=project, title="Task")
+
+        # Only the page, whatever the number of projects and children
+        with django_assert_num_queries(1):
+            response = self.client.get(self.get_url(), {"expand": "stats"})
+
+        assert len(response.data["results"]) == ProjectModel.objects.filter(user=self.users.user1).count()
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self):
+        return reverse("project-list", kwargs={"user_id": self.users.user1.id})
+
+    def get_task_list_url(self):
+        return reverse("task-list", kwargs={"user_id": self.users.user1.id, "project_id": self.project.id})
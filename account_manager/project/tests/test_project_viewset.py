@@ -21,14 +21,14 @@ list_project_test_cases = [
     # "auth_user", "user", "expected_status"
     L_TestCase("not_auth", "user1", status.HTTP_401_UNAUTHORIZED),
     L_TestCase("admin", "admin", status.HTTP_404_NOT_FOUND),
-    L_TestCase("admin", "user1", status.HTTP_200_OK),
+    L_TestCase("admin", "user1", status.HTTP_403_FORBIDDEN),
     L_TestCase("user1", "user1", status.HTTP_200_OK),
     L_TestCase("user1", "user2", status.HTTP_403_FORBIDDEN),
 ]
 create_project_test_cases = [
     # "auth_user", "user", "include_optional_fields", "expected_status"
     C_TestCase("not_auth", "user1", False, status.HTTP_401_UNAUTHORIZED),
-    C_TestCase("admin", "user1", False, status.HTTP_201_CREATED),
+    C_TestCase("admin", "user1", False, status.HTTP_403_FORBIDDEN),
     C_TestCase("user1", "user1", False, status.HTTP_201_CREATED),
     C_TestCase("user1", "user1", True, status.HTTP_201_CREATED),
     C_TestCase("user1", "user2", False, status.HTTP_403_FORBIDDEN),
@@ -36,28 +36,28 @@ create_project_test_cases = [
 retrieve_project_test_cases = [
     # "auth_user", "project", "expected_status"
     R_TestCase("not_auth", "project__user1", status.HTTP_401_UNAUTHORIZED),
-    R_TestCase("admin", "project__user1", status.HTTP_200_OK),
+    R_TestCase("admin", "project__user1", status.HTTP_403_FORBIDDEN),
     R_TestCase("user1", "project__user1", status.HTTP_200_OK),
     R_TestCase("user1", "project__user2", status.HTTP_403_FORBIDDEN),
 ]
 update_project_test_cases = [
     # "auth_user", "project", "include_optional_fields", "expected_status"
     U_TestCase("not_auth", "project__user1", False, status.HTTP_401_UNAUTHORIZED),
-    U_TestCase("admin", "project__user1", False, status.HTTP_200_OK),
+    U_TestCase("admin", "project__user1", False, status.HTTP_403_FORBIDDEN),
     U_TestCase("user1", "project__user1", False, status.HTTP_200_OK),
     U_TestCase("user1", "project__user2", False, status.HTTP_403_FORBIDDEN),
 ]
 partial_update_project_test_cases = [
     # "auth_user", "project", "expected_status"
     P_TestCase("not_auth", "project__user1", status.HTTP_401_UNAUTHORIZED),
-    P_TestCase("admin", "project__user1", status.HTTP_200_OK),
+    P_TestCase("admin", "project__user1", status.HTTP_403_FORBIDDEN),
     P_TestCase("user1", "project__user1", status.HTTP_200_OK),
     P_TestCase("user1", "project__user2", status.HTTP_403_FORBIDDEN),
 ]
 destroy_project_test_cases = [
     # "auth_user", "project", "expected_status"
     D_TestCase("not_auth", "project__user1", status.HTTP_401_UNAUTHORIZED),
-    D_TestCase("admin", "project__user1", status.HTTP_204_NO_CONTENT),
+    D_TestCase("admin", "project__user1", status.HTTP_403_FORBIDDEN),
     D_TestCase("user1", "project__user1", status.HTTP_204_NO_CONTENT),
     D_TestCase("user1", "project__user2", status.HTTP_403_FORBIDDEN),
 ]
@@ -90,8 +90,8 @@ class TestProjectViewSet:
 
         assert response.status_code == test_case.expected_status
         if test_case.expected_status == status.HTTP_200_OK:
-            assert isinstance(response.data, list)
-            assert len(response.data) == self.initial_project_count(user)
+            assert isinstance(response.data["results"], list)
+            assert len(response.data["results"]) == self.initial_project_count(user)
 
     # ----- Create Project ---------------------------------------------------------------------------------------------
     @pytest.mark.parametrize("test_case", create_project_test_cases)
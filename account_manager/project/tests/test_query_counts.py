@@ -0,0 +1,90 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Task as TaskModel
+
+from .conftest import Projects, Users
+
+# ----- Query Count Test Case Schemas ----------------------------------------------------------------------------------
+Q_TestCase = nt("Queries", ["url_name", "method", "max_queries", "expected_status"])
+
+# ----- Query Count Test Cases -----------------------------------------------------------------------------------------
+query_count_test_cases = [
+    # "url_name", "method", "max_queries", "expected_status" (list and detail GETs include the ETag aggregate query)
+    Q_TestCase("project-list", "get", 2, status.HTTP_200_OK),
+    Q_TestCase("project-list", "post", 1, status.HTTP_201_CREATED),
+    Q_TestCase("project-detail", "get", 4, status.HTTP_200_OK),
+    Q_TestCase("project-detail", "put", 2, status.HTTP_200_OK),
+    Q_TestCase("project-detail", "patch", 2, status.HTTP_200_OK),
+    Q_TestCase("project-detail", "delete", 4, status.HTTP_204_NO_CONTENT),
+    Q_TestCase("task-list", "get", 3, status.HTTP_200_OK),
+    Q_TestCase("task-list", "post", 2, status.HTTP_201_CREATED),
+    Q_TestCase("task-detail", "get", 3, status.HTTP_200_OK),
+    Q_TestCase("task-detail", "put", 3, status.HTTP_200_OK),
+    Q_TestCase("task-detail", "patch", 3, status.HTTP_200_OK),
+    Q_TestCase("task-detail", "delete", 3, status.HTTP_204_NO_CONTENT),
+    Q_TestCase("credential-list", "get", 3, status.HTTP_200_OK),
+    Q_TestCase("credential-list", "post", 2, status.HTTP_201_CREATED),
+    Q_TestCase("credential-detail", "get", 3, status.HTTP_200_OK),
+    Q_TestCase("credential-detail", "put", 3, status.HTTP_200_OK),
+    Q_TestCase("credential-detail", "patch", 3, status.HTTP_200_OK),
+    Q_TestCase("credential-detail", "delete", 3, status.HTTP_204_NO_CONTENT),
+    Q_TestCase("credential-reveal", "get", 2, status.HTTP_200_OK),
+]
+
+CHILDREN_COUNT = 30
+DATA_BY_METHOD = {"post": "for_create", "put": "for_update", "patch": "for_partial_update"}
+
+
+# ----- Query Count Tests ----------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestProjectQueryCounts:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects, testcase_data):
+        self.client = auth_client(users.user1)
+        self.users: Users = users
+        self.projects: Projects = projects
+        self.testcase_data = testcase_data
+
+        self.children = self.create_children(projects.project__user1)
+
+    @pytest.mark.parametrize("test_case", query_count_test_cases)
+    def test_query_count(self, test_case: Q_TestCase, django_assert_max_num_queries):
+        url = reverse(test_case.url_name, kwargs=self.get_path_params(test_case.url_name))
+        data = self.get_data(test_case)
+
+        with django_assert_max_num_queries(test_case.max_queries):
+            response = getattr(self.client, test_case.method)(url, data=data)
+
+        assert response.status_code == test_case.expected_status
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_path_params(self, url_name):
+        project = self.projects.project__user1
+        path_params = {"user_id": project.user.id, "project_id": project.id}
+
+        resource, view = url_name.split("-")
+        if url_name == "project-list":
+            path_params.pop("project_id")
+        elif resource != "project" and view != "list":
+            path_params["id"] = self.children[resource].id
+        return path_params
+
+    def get_data(self, test_case):
+        resource = test_case.url_name.split("-")[0]
+        data_field = DATA_BY_METHOD.get(test_case.method)
+        return getattr(self.testcase_data[resource], data_field) if data_field else None
+
+    def create_children(self, project):
+        tasks = [TaskModel.objects.create(project=project, title=f"task{index}") for index in range(CHILDREN_COUNT)]
+        credential_data = {"email": "user1@gmail.com", "password": "password", "service_name": "GitHub"}
+        credentials = [CredentialModel(project=project, **credential_data) for _ in range(CHILDREN_COUNT)]
+        for credential in credentials:
+            credential.save()
+        return {"task": tasks[0], "credential": credentials[0]}
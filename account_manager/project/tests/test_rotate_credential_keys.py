@@ -0,0 +1,57 @@
+import json
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+from django.core.management import call_command
+
+from project.crypto import CredentialCipher
+from project.models import Credential as CredentialModel
+
+from .conftest import Projects
+
+
+# ----- rotate_credential_keys Tests -----------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestRotateCredentialKeys:
+
+    model = CredentialModel
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, settings, projects, tmp_path):
+        self.settings = settings
+        self.projects: Projects = projects
+        self.checkpoint = tmp_path / "rotate.checkpoint"
+
+        self.old_key, self.new_key = settings.ENCRYPTION_KEYS[0], Fernet.generate_key().decode()
+        self.credentials = [self.create_credential(f"password{index}") for index in range(5)]
+        self.settings.ENCRYPTION_KEYS = [self.new_key, self.old_key]
+
+    def test_rotate_credential_keys(self):
+        call_command("rotate_credential_keys", batch_size=2, checkpoint=self.checkpoint)
+
+        new_cipher = CredentialCipher([self.new_key])
+        for index, credential in enumerate(self.model.objects.filter(id__in=self.get_credential_ids()).order_by("id")):
+            assert new_cipher.decrypt(credential.password) == f"password{index}"
+        assert not self.checkpoint.exists()
+
+    def test_rotate_credential_keys_resumes_from_checkpoint(self):
+        resume_after = self.credentials[1].id
+        self.checkpoint.write_text(json.dumps({"last_id": resume_after}))
+
+        call_command("rotate_credential_keys", batch_size=2, checkpoint=self.checkpoint)
+
+        new_cipher = CredentialCipher([self.new_key])
+        for credential in self.model.objects.filter(id__in=self.get_credential_ids()):
+            if credential.id <= resume_after:
+                with pytest.raises(InvalidToken):
+                    new_cipher.decrypt(credential.password)
+            else:
+                assert new_cipher.decrypt(credential.password)
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_credential_ids(self):
+        return [credential.id for credential in self.credentials]
+
+    def create_credential(self, password):
+        data = {"email": "user1@gmail.com", "password": password, "service_name": "GitHub"}
+        return self.model.objects.create(project=self.projects.project__user1, **data)
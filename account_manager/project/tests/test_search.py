@@ -0,0 +1,125 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Project as ProjectModel
+from project.models import Task as TaskModel
+
+from .conftest import Users
+
+# ----- Search Test Case Schemas ---------------------------------------------------------------------------------------
+A_TestCase = nt("Access", ["auth_user", "user", "expected_status"])
+Q_TestCase = nt("Query", ["query_params", "expected_names"])
+
+# ----- Search Test Cases ----------------------------------------------------------------------------------------------
+access_test_cases = [
+    # "auth_user", "user", "expected_status"
+    A_TestCase("not_auth", "user1", status.HTTP_401_UNAUTHORIZED),
+    A_TestCase("admin", "user1", status.HTTP_403_FORBIDDEN),
+    A_TestCase("user1", "user1", status.HTTP_200_OK),
+    A_TestCase("user1", "user2", status.HTTP_403_FORBIDDEN),
+]
+query_test_cases = [
+    # "query_params", "expected_names"
+    Q_TestCase({"q": "aws"}, ["AWS", "Rotate AWS keys", "Billing"]),
+    Q_TestCase({"q": "AW"}, ["AWS", "Rotate AWS keys", "Billing"]),
+    Q_TestCase({"q": "aws rotate"}, ["Rotate AWS keys"]),
+    Q_TestCase({"q": "aws", "type": "credential"}, ["AWS"]),
+    Q_TestCase({"q": "aws", "type": "task,credential"}, ["AWS", "Rotate AWS keys", "Billing"]),
+    Q_TestCase({"q": "amazon"}, ["AWS"]),
+    Q_TestCase({"q": "deploy"}, ["AWS"]),
+    Q_TestCase({"q": "gitlab"}, []),
+]
+invalid_test_cases = [
+    # "query_params", "expected_names" (the invalid parameter)
+    Q_TestCase({}, ["q"]),
+    Q_TestCase({"q": "  ,  "}, ["q"]),
+    Q_TestCase({"q": "aws", "type": "project"}, ["type"]),
+]
+
+
+# ----- ProjectSearchView Tests ----------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestProjectSearchView:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users):
+        self.auth_client = auth_client
+        self.users: Users = users
+
+        project = ProjectModel.objects.create(user=users.user1, title="Search")
+        CredentialModel.objects.create(
+            project=project,
+            email="user1@gmail.com",
+            password="password",
+            service_name="AWS",
+            username="deploy",
+            login_url="https://console.aws.amazon.com/login",
+        )
+        self.task = TaskModel.objects.create(project=project, title="Rotate AWS keys")
+        TaskModel.objects.create(project=project, title="Billing", description="Check the AWS invoice")
+
+        other_project = ProjectModel.objects.create(user=users.user2, title="Other")
+        TaskModel.objects.create(project=other_project, title="AWS of another user")
+
+    @pytest.mark.parametrize("test_case", access_test_cases)
+    def test_access(self, test_case: A_TestCase):
+        client = self.auth_client(getattr(self.users, test_case.auth_user))
+
+        response = client.get(self.get_url(getattr(self.users, test_case.user)), {"q": "aws"})
+
+        assert response.status_code == test_case.expected_status
+
+    @pytest.mark.parametrize("test_case", query_test_cases)
+    def test_search(self, test_case: Q_TestCase):
+        response = self.auth_client(self.users.user1).get(self.get_url(), test_case.query_params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [hit["name"] for hit in response.data["results"]] == test_case.expected_names
+
+    @pytest.mark.parametrize("test_case", invalid_test_cases)
+    def test_invalid_query(self, test_case: Q_TestCase):
+        response = self.auth_client(self.users.user1).get(self.get_url(), test_case.query_params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data) == test_case.expected_names
+
+    def test_search_hit(self):
+        response = self.auth_client(self.users.user1).get(self.get_url(), {"q": "aws", "type": "credential"})
+
+        hit = response.data["results"][0]
+        assert hit["type"] == "credential"
+        assert hit["detail"] == "deploy"
+        assert hit["rank"] > 0
+
+    def test_search_vector_follows_updates(self):
+        client = self.auth_client(self.users.user1)
+        self.task.description = "Use the vault"
+        self.task.save()
+
+        response = client.get(self.get_url(), {"q": "vault"})
+
+        assert [hit["id"] for hit in response.data["results"]] == [self.task.id]
+
+    def test_cursor_pagination(self, django_assert_num_queries):
+        client = self.auth_client(self.users.user1)
+        expected = client.get(self.get_url(), {"q": "aws"}).data["results"]
+
+        hits, url, query_params = [], self.get_url(), {"q": "aws", "page_size": 1}
+        while url:
+            with django_assert_num_queries(1):
+                response = client.get(url, query_params)
+            hits += response.data["results"]
+            url, query_params = response.data["next"], None
+
+        assert hits == expected
+        previous = client.get(response.data["previous"]).data["results"]
+        assert previous == expected[-2:-1]
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, user=None):
+        return reverse("project-search", kwargs={"user_id": (user or self.users.user1).id})
@@ -0,0 +1,151 @@
+from datetime import timedelta
+
+import pytest
+import requests
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from project.models import Task as TaskModel
+from project.notifiers import BaseNotifier, LocMemNotifier, NotificationError, TelegramNotifier
+from project.reminders import dispatch_due_reminders
+from project.serializers import TaskSerializer
+
+from .conftest import Projects
+
+
+class FailingNotifier(BaseNotifier):
+    def send(self, task):
+        raise NotificationError("Service unavailable")
+
+
+class CallbackNotifier(BaseNotifier):
+    """Runs `callback(task)` while the task is being sent, like another worker or request would meanwhile"""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def send(self, task):
+        self.callback(task)
+
+
+# ----- send_reminders Tests -------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestSendReminders:
+
+    model = TaskModel
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, settings, projects):
+        settings.REMINDER_NOTIFIER_BACKEND = "project.notifiers.LocMemNotifier"
+        LocMemNotifier.outbox.clear()
+        self.projects: Projects = projects
+
+        now = timezone.now()
+        self.due = [self.create_task(remind_at=now - timedelta(minutes=index)) for index in range(5)]
+        self.not_due = [
+            self.create_task(remind_at=now + timedelta(hours=1)),
+            self.create_task(remind_at=now - timedelta(hours=1), is_active=False),
+            self.create_task(remind_at=now - timedelta(hours=1), reminder_sent_at=now),
+            self.create_task(remind_at=None),
+        ]
+
+    def test_send_reminders(self):
+        expected_ids = set(self.model.objects.due(timezone.now()).values_list("id", flat=True))
+
+        call_command("send_reminders", batch_size=2)
+
+        assert {task.id for task in LocMemNotifier.outbox} == expected_ids
+        assert not self.model.objects.filter(id__in=expected_ids, reminder_sent_at__isnull=True).exists()
+        assert not self.model.objects.filter(id__in=expected_ids).exclude(updated_at=F("reminder_sent_at")).exists()
+        assert {task.id for task in self.not_due}.isdisjoint(expected_ids)
+
+    def test_reminders_are_sent_once(self):
+        dispatch_due_reminders(batch_size=2)
+        sent = len(LocMemNotifier.outbox)
+
+        assert dispatch_due_reminders(batch_size=2) == 0
+        assert len(LocMemNotifier.outbox) == sent
+
+    def test_failed_reminders_stay_pending(self):
+        assert dispatch_due_reminders(FailingNotifier(), batch_size=2) == 0
+
+        assert self.model.objects.filter(id__in=[task.id for task in self.due], reminder_sent_at=None).count() == 5
+        assert not self.model.objects.filter(reminder_claimed_at__isnull=False).exists()
+
+    def test_due_tasks_are_locked_with_skip_locked(self):
+        with CaptureQueriesContext(connection) as context:
+            dispatch_due_reminders(batch_size=2)
+
+        assert any("FOR UPDATE OF" in query["sql"] and "SKIP LOCKED" in query["sql"] for query in context)
+
+    def test_reminders_are_sent_outside_the_transaction(self):
+        depth, atomic_blocks, claims, due_count = len(connection.atomic_blocks), [], [], self.due_count()
+
+        def callback(task):
+            atomic_blocks.append(len(connection.atomic_blocks) - depth)
+            claims.append(self.model.objects.get(id=task.id).reminder_claimed_at)
+
+        assert dispatch_due_reminders(CallbackNotifier(callback), batch_size=2) == due_count
+        assert set(atomic_blocks) == {0}  # neither a transaction nor its row locks are held while sending
+        assert None not in claims  # the claim keeps other workers away instead
+
+    def test_stale_claim_is_taken_over(self, settings):
+        stale = timezone.now() - timedelta(seconds=settings.REMINDER_CLAIM_TIMEOUT + 1)
+        self.model.objects.filter(id=self.due[0].id).update(reminder_claimed_at=stale)
+        self.model.objects.filter(id=self.due[1].id).update(reminder_claimed_at=timezone.now())
+        due_count = self.due_count()
+
+        assert dispatch_due_reminders(batch_size=2) == due_count - 1
+        assert self.due[1].id not in {task.id for task in LocMemNotifier.outbox}
+
+    def test_reminder_rescheduled_while_sending_is_sent_again(self):
+        rescheduled, due_count = self.due[0], self.due_count()
+
+        def callback(task):
+            if task.id == rescheduled.id:
+                serializer = TaskSerializer(task, data={"remind_at": timezone.now()}, partial=True)
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+
+        assert dispatch_due_reminders(CallbackNotifier(callback), batch_size=2) == due_count
+
+        rescheduled.refresh_from_db()
+        assert rescheduled.reminder_sent_at is None
+        assert rescheduled.reminder_claimed_at is None
+
+    def test_rescheduled_reminder_is_sent_again(self):
+        task = self.not_due[2]
+        remind_at = timezone.now() - timedelta(minutes=1)
+
+        serializer = TaskSerializer(task, data={"remind_at": remind_at}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        task.refresh_from_db()
+        assert task.reminder_sent_at is None
+
+    def test_telegram_notifier(self, settings, monkeypatch):
+        settings.TELEGRAM_BOT_TOKEN = "token"
+        sent_messages, response = [], requests.Response()
+        response.status_code = 200
+        monkeypatch.setattr(requests.Session, "post", lambda session, url, **kw: sent_messages.append(kw) or response)
+
+        task = self.due[0]
+        task.project.user.telegram_id = 42
+        TelegramNotifier().send(task)
+        task.project.user.telegram_id = None
+        TelegramNotifier().send(task)
+
+        assert len(sent_messages) == 1
+        assert sent_messages[0]["json"]["chat_id"] == 42
+        assert task.title in sent_messages[0]["json"]["text"]
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def due_count(self):
+        return self.model.objects.due(timezone.now()).count()
+
+    def create_task(self, **data):
+        return self.model.objects.create(project=self.projects.project__user1, title="Reminder", **data)
@@ -0,0 +1,131 @@
+import sys
+import warnings
+from collections import namedtuple as nt
+from io import StringIO
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from django.core.asgi import get_asgi_application
+from django.core.management import CommandError, call_command
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections, connections
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from project.export import ProjectTreeExport
+from project.management.commands.serve import Command as ServeCommand
+
+# ----- serve Test Case Schemas ----------------------------------------------------------------------------------------
+C_TestCase = nt("Config", ["options", "expected_config"])
+
+# ----- serve Test Cases -----------------------------------------------------------------------------------------------
+config_test_cases = [
+    # "options", "expected_config"
+    C_TestCase([], {"app": "account_manager.wsgi.application", "worker_class": "sync", "workers": 3}),
+    C_TestCase(["--threads", "4"], {"worker_class": "gthread", "threads": 4}),
+    C_TestCase(
+        ["--interface", "asgi"],
+        {"app": "account_manager.asgi.application", "worker_class": "uvicorn_worker.UvicornWorker"},
+    ),
+    C_TestCase(["--bind", "unix:/run/app.sock"], {"bind": ["unix:/run/app.sock"]}),
+    C_TestCase(["--keep-alive", "75", "--graceful-timeout", "10"], {"keepalive": 75, "graceful_timeout": 10}),
+    C_TestCase(["--max-requests", "0"], {"max_requests": 0, "max_requests_jitter": 100}),
+]
+
+
+# ----- serve Tests ----------------------------------------------------------------------------------------------------
+class TestServe:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, settings):
+        settings.SERVER_WORKERS = 3
+        settings.SERVER_MAX_REQUESTS_JITTER = 100
+        settings.ASYNC_VIEWS = False
+        with mock.patch.dict(connections.settings["default"], {"CONN_MAX_AGE": 0}):  # as with SERVER_INTERFACE asgi
+            yield
+
+    @pytest.mark.parametrize("test_case", config_test_cases)
+    def test_config(self, test_case: C_TestCase):
+        config = self.call_serve(*test_case.options)
+
+        assert config.items() >= test_case.expected_config.items()
+
+    @pytest.mark.parametrize("option", ["--workers", "--threads"])
+    def test_invalid_count(self, option):
+        with pytest.raises(CommandError):
+            self.call_serve(option, "0")
+
+    def test_async_views_need_asgi(self, settings):
+        settings.ASYNC_VIEWS = True
+        stderr = StringIO()
+
+        self.call_serve(stderr=stderr)
+
+        assert "--interface asgi" in stderr.getvalue()
+
+    def test_asgi_needs_non_persistent_connections(self):
+        with mock.patch.dict(connections.settings["default"], {"CONN_MAX_AGE": 60}):
+            with pytest.raises(CommandError, match="Persistent connections"):
+                self.call_serve("--interface", "asgi")
+
+            assert self.call_serve("--interface", "wsgi")["worker_class"] == "sync"
+
+    @pytest.mark.parametrize("module", ["gunicorn.app.base", "uvicorn_worker"])
+    def test_server_not_installed(self, module):
+        with mock.patch.dict(sys.modules, {module: None}), pytest.raises(CommandError, match="is not installed"):
+            call_command("serve", "--interface", "asgi", stdout=StringIO())
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def call_serve(self, *options, stderr=None) -> dict:
+        """Returns the gunicorn config the command would run with"""
+        with mock.patch.object(ServeCommand, "run") as run:
+            call_command("serve", *options, stdout=StringIO(), stderr=stderr or StringIO())
+        return run.call_args.args[0]
+
+
+# ----- ASGI Application Tests -----------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestAsgiApplication:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, users, projects):
+        self.user = users.user1
+
+        # Like the test client, keep the connection of the test transaction open across the requests
+        request_started.disconnect(close_old_connections)
+        request_finished.disconnect(close_old_connections)
+        yield
+        request_started.connect(close_old_connections)
+        request_finished.connect(close_old_connections)
+
+    def test_export_is_streamed(self):
+        with mock.patch.object(ProjectTreeExport, "batch_size", 1), warnings.catch_warnings():
+            warnings.filterwarnings("error", "StreamingHttpResponse must consume")  # a sync iterator read whole
+            messages = async_to_sync(self.get)(reverse("project-export", kwargs={"user_id": self.user.id}))
+
+        assert messages[0]["status"] == 200
+        bodies = messages[1:]
+        assert len(bodies) > 2 and all(body["more_body"] for body in bodies[:-1])  # sent line by line
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    async def get(self, path: str) -> list[dict]:
+        """Sends a GET to the app `serve --interface asgi` runs, returns the messages it answers with"""
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"format=ndjson",
+            "server": ("testserver", 80),
+            "headers": [(b"authorization", f"Bearer {AccessToken.for_user(self.user)}".encode())],
+        }
+        communicator = ApplicationCommunicator(get_asgi_application(), scope)
+        await communicator.send_input({"type": "http.request", "body": b""})
+
+        messages = [await communicator.receive_output(timeout=5)]
+        while messages[-1].get("more_body", messages[-1]["type"] == "http.response.start"):
+            messages.append(await communicator.receive_output(timeout=5))
+        await communicator.wait()
+        return messages
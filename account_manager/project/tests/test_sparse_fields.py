@@ -0,0 +1,140 @@
+from collections import namedtuple as nt
+from urllib.parse import urlencode
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from project.models import Credential as CredentialModel
+from project.models import Task as TaskModel
+
+from .conftest import Users
+
+# ----- Sparse Fields Test Case Schemas --------------------------------------------------------------------------------
+F_TestCase = nt("Fields", ["url_name", "query_params", "expected_fields", "expected_nested_fields"])
+S_TestCase = nt("Selected", ["url_name", "query_params", "table", "unexpected_column"])
+W_TestCase = nt("Write", ["url_name", "method", "query_params", "data", "expected_errors"])
+
+# ----- Sparse Fields Test Cases ---------------------------------------------------------------------------------------
+fields_test_cases = [
+    # "url_name", "query_params", "expected_fields", "expected_nested_fields"
+    F_TestCase("task-list", {"fields": "id,title"}, {"id", "title"}, None),
+    F_TestCase("task-detail", {"fields": "title, is_active"}, {"title", "is_active"}, None),
+    F_TestCase("credential-list", {"fields": "service_name"}, {"service_name"}, None),
+    F_TestCase("credential-detail", {"fields": "id,password"}, {"id", "password"}, None),
+    F_TestCase("project-list", {"fields": "id"}, {"id"}, None),
+    F_TestCase("project-list", {"fields": "id", "expand": "tasks"}, {"id", "tasks"}, {"tasks": None}),
+    F_TestCase("project-list", {"fields": "id,tasks.id", "expand": "tasks"}, {"id", "tasks"}, {"tasks": {"id"}}),
+    F_TestCase("project-detail", {"fields": "title"}, {"title"}, None),
+    F_TestCase(
+        "project-detail",
+        {"fields": "title,tasks.title,credentials.email"},
+        {"title", "tasks", "credentials"},
+        {"tasks": {"title"}, "credentials": {"email"}},
+    ),
+    F_TestCase("project-detail", {"fields": "unknown"}, set(), None),
+]
+selected_test_cases = [
+    # "url_name", "query_params", "table", "unexpected_column"
+    S_TestCase("credential-list", {"fields": "id,service_name"}, "project_credential", "password"),
+    S_TestCase("task-detail", {"fields": "title"}, "project_task", "remind_at"),
+    S_TestCase("project-detail", {"fields": "title,tasks.title"}, "project_task", "remind_at"),
+    S_TestCase("project-detail", {"fields": "title"}, "project_task", None),
+    S_TestCase("project-detail", {"fields": "title"}, "project_credential", None),
+]
+write_test_cases = [
+    # "url_name", "method", "query_params", "data", "expected_errors"
+    W_TestCase("credential-list", "post", {"fields": "service_name"}, {"service_name": "X"}, {"email", "password"}),
+    W_TestCase("task-detail", "put", {"fields": "id"}, {}, {"title"}),
+    W_TestCase("task-list", "post", {"fields": "id", "expand": "project"}, {"description": "X"}, {"title"}),
+    W_TestCase("project-list", "post", {"fields": "id"}, {}, {"title"}),
+]
+
+
+# ----- Sparse Fields Tests --------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_silk")
+class TestSparseFields:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, projects):
+        self.client = auth_client(users.user1)
+        self.users: Users = users
+
+        self.project = projects.project__user1
+        self.task = TaskModel.objects.create(project=self.project, title="Sparse Task")
+        self.credential = CredentialModel.objects.create(
+            project=self.project, email="user1@gmail.com", password="password", service_name="GitHub"
+        )
+
+    @pytest.mark.parametrize("test_case", fields_test_cases)
+    def test_fields(self, test_case: F_TestCase):
+        response = self.client.get(self.get_url(test_case.url_name), test_case.query_params)
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"] if "results" in response.data else [response.data]
+        assert results
+        for result in results:
+            assert set(result) == test_case.expected_fields
+            for name, expected_nested_fields in (test_case.expected_nested_fields or {}).items():
+                for nested in result[name]:
+                    assert expected_nested_fields is None or set(nested) == expected_nested_fields
+
+    def test_default_fields(self):
+        response = self.client.get(self.get_url("project-detail"))
+
+        assert {"id", "title", "credentials", "tasks"} <= set(response.data)
+        assert {"id", "title", "remind_at"} <= set(response.data["tasks"][0])
+
+    def test_expanded_list_is_not_stale(self):
+        url = self.get_url("project-list")
+        self.client.get(url, {"expand": "tasks"})
+
+        self.client.patch(self.get_url("task-detail"), {"title": "Renamed"}, format="json")
+
+        response = self.client.get(url, {"expand": "tasks"})
+        titles = {task["title"] for project in response.data["results"] for task in project["tasks"]}
+        assert "Renamed" in titles
+
+    @pytest.mark.parametrize("test_case", selected_test_cases)
+    def test_selected_columns(self, test_case: S_TestCase):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.get_url(test_case.url_name), test_case.query_params)
+
+        assert response.status_code == status.HTTP_200_OK
+        selects = [query["sql"] for query in context.captured_queries if f'FROM "{test_case.table}"' in query["sql"]]
+        if test_case.unexpected_column is None:
+            assert not [sql for sql in selects if "COUNT(" not in sql and "MAX(" not in sql]
+        else:
+            assert selects
+            assert all(f'"{test_case.unexpected_column}"' not in sql for sql in selects if "MAX(" not in sql)
+
+    @pytest.mark.parametrize("test_case", write_test_cases)
+    def test_writes_validate_every_field(self, test_case: W_TestCase):
+        url = f"{self.get_url(test_case.url_name)}?{urlencode(test_case.query_params)}"
+        response = getattr(self.client, test_case.method)(url, test_case.data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.data) == test_case.expected_errors
+
+    def test_paginated_sparse_list(self, django_assert_num_queries):
+        TaskModel.objects.create(project=self.project, title="Another Task")
+        url = self.get_url("task-list")
+
+        # The project lookup, the aggregate query and the page, with no deferred field loaded per row
+        with django_assert_num_queries(3):
+            response = self.client.get(url, {"fields": "title", "page_size": 1})
+
+        next_page = self.client.get(response.data["next"])
+        assert [set(task) for task in response.data["results"] + next_page.data["results"]] == [{"title"}, {"title"}]
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_url(self, url_name):
+        path_params = {"user_id": self.project.user_id, "project_id": self.project.id}
+        if url_name == "project-list":
+            path_params.pop("project_id")
+        elif url_name.endswith("-detail") and not url_name.startswith("project"):
+            path_params["id"] = self.task.id if url_name.startswith("task") else self.credential.id
+        return reverse(url_name, kwargs=path_params)
@@ -20,14 +20,14 @@ D_TestCase = nt("Destroy", ["auth_user", "task", "expected_status"])
 list_task_test_cases = [
     # "auth_user", "project", "expected_status"
     L_TestCase("not_auth", "project__user1", status.HTTP_401_UNAUTHORIZED),
-    L_TestCase("admin", "project__user1", status.HTTP_200_OK),
+    L_TestCase("admin", "project__user1", status.HTTP_403_FORBIDDEN),
     L_TestCase("user1", "project__user1", status.HTTP_200_OK),
     L_TestCase("user1", "project__user2", status.HTTP_403_FORBIDDEN),
 ]
 create_task_test_cases = [
     # "auth_user", "project", "include_optional_fields", "expected_status"
     C_TestCase("not_auth", "project__user1", False, status.HTTP_401_UNAUTHORIZED),
-    C_TestCase("admin", "project__user1", False, status.HTTP_201_CREATED),
+    C_TestCase("admin", "project__user1", False, status.HTTP_403_FORBIDDEN),
     C_TestCase("user1", "project__user1", False, status.HTTP_201_CREATED),
     C_TestCase("user1", "project__user1", True, status.HTTP_201_CREATED),
     C_TestCase("user1", "project__user2", False, status.HTTP_403_FORBIDDEN),
@@ -35,28 +35,28 @@ create_task_test_cases = [
 retrieve_task_test_cases = [
     # "auth_user", "task", "expected_status"
     R_TestCase("not_auth", "task__project__user1", status.HTTP_401_UNAUTHORIZED),
-    R_TestCase("admin", "task__project__user1", status.HTTP_200_OK),
+    R_TestCase("admin", "task__project__user1", status.HTTP_403_FORBIDDEN),
     R_TestCase("user1", "task__project__user1", status.HTTP_200_OK),
     R_TestCase("user1", "task__project__user2", status.HTTP_403_FORBIDDEN),
 ]
 update_task_test_cases = [
     # "auth_user", "task", "include_optional_fields", "expected_status"
     U_TestCase("not_auth", "task__project__user1", False, status.HTTP_401_UNAUTHORIZED),
-    U_TestCase("admin", "task__project__user1", False, status.HTTP_200_OK),
+    U_TestCase("admin", "task__project__user1", False, status.HTTP_403_FORBIDDEN),
     U_TestCase("user1", "task__project__user1", False, status.HTTP_200_OK),
     U_TestCase("user1", "task__project__user2", False, status.HTTP_403_FORBIDDEN),
 ]
 partial_update_task_test_cases = [
     # "auth_user", "task", "partial_update_data", "expected_status"
     P_TestCase("not_auth", "task__project__user1", status.HTTP_401_UNAUTHORIZED),
-    P_TestCase("admin", "task__project__user1", status.HTTP_200_OK),
+    P_TestCase("admin", "task__project__user1", status.HTTP_403_FORBIDDEN),
     P_TestCase("user1", "task__project__user1", status.HTTP_200_OK),
     P_TestCase("user1", "task__project__user2", status.HTTP_403_FORBIDDEN),
 ]
 destroy_task_test_cases = [
     # "auth_user", "task", "expected_status"
     D_TestCase("not_auth", "task__project__user1", status.HTTP_401_UNAUTHORIZED),
-    D_TestCase("admin", "task__project__user1", status.HTTP_204_NO_CONTENT),
+    D_TestCase("admin", "task__project__user1", status.HTTP_403_FORBIDDEN),
     D_TestCase("user1", "task__project__user1", status.HTTP_204_NO_CONTENT),
     D_TestCase("user1", "task__project__user2", status.HTTP_403_FORBIDDEN),
 ]
@@ -92,8 +92,8 @@ class TestTaskViewSet:
 
         assert response.status_code == test_case.expected_status
         if test_case.expected_status == status.HTTP_200_OK:
-            assert isinstance(response.data, list)
-            assert len(response.data) == self.initial_task_count(project)
+            assert isinstance(response.data["results"], list)
+            assert len(response.data["results"]) == self.initial_task_count(project)
 
     # ----- Create Task ------------------------------------------------------------------------------------------------
     @pytest.mark.parametrize("test_case", create_task_test_cases)
@@ -1,20 +1,45 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from .views import CredentialViewSet, ProjectViewSet, TaskViewSet
+from .views import (
+    CredentialViewSet,
+    ProjectExportView,
+    ProjectImportView,
+    ProjectSearchView,
+    ProjectViewSet,
+    TaskViewSet,
+)
 
 router = DefaultRouter()
 
 list_view = {"get": "list", "post": "create"}
 detail_view = {"get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy"}
+bulk_view = {"post": "bulk_create", "patch": "bulk_update", "delete": "bulk_destroy"}
+
+
+def read_view(viewset, actions: dict[str, str]):
+    """The view of the hot reads, whose GET is served by a coroutine when `ASYNC_VIEWS` is on"""
+    return viewset.as_async_view(actions) if settings.ASYNC_VIEWS else viewset.as_view(actions)
+
 
 urlpatterns = [
-    path("", ProjectViewSet.as_view(list_view), name="project-list"),
-    path("<int:project_id>/", ProjectViewSet.as_view(detail_view), name="project-detail"),
-    path("<int:project_id>/tasks/", TaskViewSet.as_view(list_view), name="task-list"),
-    path("<int:project_id>/tasks/<int:id>/", TaskViewSet.as_view(detail_view), name="task-detail"),
-    path("<int:project_id>/credentials/", CredentialViewSet.as_view(list_view), name="credential-list"),
-    path("<int:project_id>/credentials/<int:id>/", CredentialViewSet.as_view(detail_view), name="credential-detail"),
+    path("", read_view(ProjectViewSet, list_view), name="project-list"),
+    path("export/", ProjectExportView.as_view(), name="project-export"),
+    path("search/", ProjectSearchView.as_view(), name="project-search"),
+    path("<int:project_id>/", read_view(ProjectViewSet, detail_view), name="project-detail"),
+    path("<int:project_id>/import/", ProjectImportView.as_view(), name="project-import"),
+    path("<int:project_id>/tasks/", read_view(TaskViewSet, list_view), name="task-list"),
+    path("<int:project_id>/tasks/bulk/", TaskViewSet.as_view(bulk_view), name="task-bulk"),
+    path("<int:project_id>/tasks/<int:id>/", read_view(TaskViewSet, detail_view), name="task-detail"),
+    path("<int:project_id>/credentials/", read_view(CredentialViewSet, list_view), name="credential-list"),
+    path("<int:project_id>/credentials/bulk/", CredentialViewSet.as_view(bulk_view), name="credential-bulk"),
+    path("<int:project_id>/credentials/<int:id>/", read_view(CredentialViewSet, detail_view), name="credential-detail"),
+    path(
+        "<int:project_id>/credentials/<int:id>/reveal/",
+        CredentialViewSet.as_view({"get": "reveal"}),
+        name="credential-reveal",
+    ),
 ]
 
 urlpatterns += router.urls
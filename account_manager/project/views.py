@@ -1,55 +1,270 @@
-from drf_spectacular.utils import extend_schema
-from rest_framework.exceptions import PermissionDenied
-from rest_framework.generics import get_object_or_404
+import codecs
+
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Max, OuterRef, Subquery, Sum
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.generics import ListAPIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
+from .export import ProjectTreeExport
+from .filters import WhitelistFilter, WhitelistOrderingFilter
+from .importer import AccountImporter, read_rows
+from .mixins import (
+    AsyncReadMixin,
+    BulkModelMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ProjectScopeMixin,
+    SparseFieldsMixin,
+)
 from .models import Credential, Project, Task
-from .serializers import CredentialSerializer, ProjectDetailSerializer, ProjectSerializer, TaskSerializer
+from .pagination import CursorPagination
+from .renderers import NDJSONRenderer
+from .search import SEARCH_TYPES, SearchPagination, parse_search_query, search_hits
+from .serializers import (
+    AccountImportSerializer,
+    BulkDestroySerializer,
+    CredentialSerializer,
+    ProjectDetailSerializer,
+    ProjectSerializer,
+    SearchHitSerializer,
+    TaskSerializer,
+    parse_names,
+)
+
+
+def bulk_schema(serializer_class):
+    return extend_schema_view(
+        bulk_create=extend_schema(request=serializer_class(many=True), responses=serializer_class(many=True)),
+        bulk_update=extend_schema(request=serializer_class(many=True), responses=serializer_class(many=True)),
+        bulk_destroy=extend_schema(request=BulkDestroySerializer, responses={204: None}),
+    )
 
 
-class BaseViewSet(ModelViewSet):
+def sparse_fields_schema(fields_description: str = "", expandable_fields=()):
+    description = f"Comma-separated fields to include, nested ones as `tasks.title`. {fields_description}"
+    parameters = [OpenApiParameter("fields", str, description=description.strip())]
+    if expandable_fields:
+        description = f"Comma-separated fields to add: {', '.join(f'`{name}`' for name in expandable_fields)}."
+        parameters.append(OpenApiParameter("expand", str, description=description))
+    return extend_schema_view(list=extend_schema(parameters=parameters), retrieve=extend_schema(parameters=parameters))
+
+
+class BaseViewSet(
+    ProjectScopeMixin, BulkModelMixin, ConditionalGetMixin, SparseFieldsMixin, AsyncReadMixin, ModelViewSet
+):
     permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
+    filter_backends = [WhitelistFilter, WhitelistOrderingFilter]
+    lookup_field = "id"
     model = None
 
+    # Each of them leads an index after `project`, see the `Meta.indexes` of the model
+    filter_fields = {}
+    ordering_fields = ["created_at"]
+
     def get_queryset(self):
-        kwargs = {"project__user": self.kwargs.get("user_id"), "project_id": self.kwargs.get("project_id")}
-        if not kwargs["project__user"] == self.request.user.id:
-            raise PermissionDenied("You do not have permission")
-        return self.model.objects.filter(**kwargs)
-
-    def get_object(self):
-        kwargs = {"project_id": self.kwargs.get("project_id"), "project__user": self.kwargs.get("user_id")}
-        if not kwargs["project__user"] == self.request.user.id:
-            raise PermissionDenied("You do not have permission.")
-        return get_object_or_404(self.model, **kwargs)
+        return self.model.objects.filter(project_id=self.project.id)
 
 
 @extend_schema(tags=["projects"])
-class ProjectViewSet(ModelViewSet):
+@sparse_fields_schema(expandable_fields=ProjectSerializer.expandable_fields)
+class ProjectViewSet(CachedResponseMixin, ConditionalGetMixin, SparseFieldsMixin, AsyncReadMixin, ModelViewSet):
     permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
+    lookup_field = "id"
+    lookup_url_kwarg = "project_id"
 
     def get_queryset(self):
         if not self.kwargs.get("user_id") == self.request.user.id:
             raise PermissionDenied("You do not have permissions")
         return Project.objects.filter(user=self.request.user)
 
-    def get_object(self):
-        return get_object_or_404(Project, id=self.kwargs["project_id"], user=self.request.user)
+    def create(self, request, *args, **kwargs):
+        self.get_queryset()  # the scope check, a create reads no queryset of its own
+        return super().create(request, *args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in self.narrowed_actions and "stats" in self.get_serializer_context()["expand"]:
+            queryset = queryset.with_stats()
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "retrieve":
             return ProjectDetailSerializer
         return ProjectSerializer
 
+    def is_expanded_list(self) -> bool:
+        return self.action == "list" and bool(self.get_serializer_context()["expand"])
+
+    def is_cacheable(self):
+        # Changes of credentials and tasks only bump the versions of their project, not the one of the user lists
+        return super().is_cacheable() and not self.is_expanded_list()
+
+    def has_validators(self):
+        # Aggregating the children of every project of the user would cost more than the page itself
+        return not self.is_expanded_list()
+
+    def has_last_modified(self):
+        return False  # the detail nests credentials and tasks, a deleted one would not move the timestamp
+
+    def get_freshness_query(self):
+        if self.action != "retrieve":
+            return super().get_freshness_query()
+
+        # The detail nests credentials and tasks, so they are aggregated too, in subqueries of the same statement
+        queryset = self.get_queryset().order_by().filter(id=self.kwargs["project_id"])
+
+        annotations, aggregates = {}, {"last_modified": Max("updated_at"), "count": Count("id")}
+        for relation, model in (("credentials", Credential), ("tasks", Task)):
+            children = model.objects.filter(project_id=OuterRef("id")).order_by().values("project_id")
+            annotations[f"{relation}_max"] = Subquery(children.annotate(value=Max("updated_at")).values("value"))
+            annotations[f"{relation}_rows"] = Subquery(children.annotate(value=Count("id")).values("value"))
+            aggregates[f"{relation}_updated_at"] = Max(f"{relation}_max")
+            aggregates[f"{relation}_count"] = Sum(f"{relation}_rows")
+
+        return queryset.annotate(**annotations), aggregates
+
+    def read_freshness(self, row):
+        if self.action != "retrieve":
+            return super().read_freshness(row)
+
+        timestamps = [row["last_modified"], row["credentials_updated_at"], row["tasks_updated_at"]]
+        last_modified = max(filter(None, timestamps), default=None)
+        return last_modified, row["count"] + (row["credentials_count"] or 0) + (row["tasks_count"] or 0)
+
 
 @extend_schema(tags=["project-credentials"])
+@bulk_schema(CredentialSerializer)
+@sparse_fields_schema("`password` returns raw passwords.")
 class CredentialViewSet(BaseViewSet):
     serializer_class = CredentialSerializer
     model = Credential
+    filter_fields = {"service_name": ["exact"], "created_at": ["gte", "lte"]}
+    ordering_fields = ["created_at", "service_name"]
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["reveal_password"] = self.action == "reveal" or "password" in context.get("fields", ())
+        return context
+
+    @action(detail=True, methods=["get"])
+    def reveal(self, request, *args, **kwargs):
+        """Returns the credential with its raw password"""
+        serializer = self.get_serializer(self.get_object())
+        return Response(serializer.data)
 
 
 @extend_schema(tags=["project-tasks"])
+@bulk_schema(TaskSerializer)
+@sparse_fields_schema()
 class TaskViewSet(BaseViewSet):
     serializer_class = TaskSerializer
     model = Task
+    filter_fields = {"is_active": ["exact"], "remind_at": ["gte", "lte", "isnull"], "created_at": ["gte", "lte"]}
+    ordering_fields = ["created_at", "title"]
+
+
+@extend_schema(
+    tags=["projects"],
+    parameters=[
+        OpenApiParameter("format", str, enum=["json", "ndjson"], description="`ndjson` streams one object per line."),
+        OpenApiParameter("reveal_passwords", bool, description="Export raw credential passwords instead of a mask."),
+    ],
+    responses={(200, "application/json"): OpenApiTypes.OBJECT, (200, "application/x-ndjson"): OpenApiTypes.STR},
+)
+class ProjectExportView(APIView):
+    """Streams all projects of the user with their credentials and tasks"""
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, NDJSONRenderer]
+
+    def get(self, request, *args, **kwargs):
+        if not self.kwargs["user_id"] == request.user.id:
+            raise PermissionDenied("You do not have permission.")
+
+        reveal_passwords = request.query_params.get("reveal_passwords") == "true"
+        export = ProjectTreeExport(request.user.id, reveal_passwords=reveal_passwords)  # only ever the own projects
+        ndjson = request.accepted_renderer.format == NDJSONRenderer.format
+        content = export.iter_ndjson() if ndjson else export.iter_json()
+        if isinstance(request._request, ASGIRequest):
+            content = export.aiter(content)  # Django would read a sync iterator whole before the first byte
+
+        response = StreamingHttpResponse(content, content_type=request.accepted_renderer.media_type)
+        response["Content-Disposition"] = f'attachment; filename="projects.{request.accepted_renderer.format}"'
+        return response
+
+
+@extend_schema(
+    tags=["projects"],
+    request={"multipart/form-data": AccountImportSerializer},
+    responses={201: OpenApiTypes.OBJECT, 400: OpenApiTypes.OBJECT},
+)
+class ProjectImportView(ProjectScopeMixin, APIView):
+    """
+    Imports credentials and tasks from an uploaded CSV or NDJSON file (e.g. an export), see `AccountImporter`.
+
+    The upload is imported in one transaction: when any row is invalid nothing is imported and the report lists the
+    errors, so the same file can be fixed and sent again. Use `manage.py import_accounts` for resumable imports.
+    """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = AccountImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload, file_format = serializer.validated_data["file"], serializer.validated_data["file_format"]
+
+        importer = AccountImporter(self.project, serializer.validated_data.get("type"))
+        with transaction.atomic():
+            report = importer.run(read_rows(codecs.iterdecode(upload, "utf-8"), file_format))
+            if report.failed:
+                transaction.set_rollback(True)
+                report.imported = 0
+
+        response_status = status.HTTP_400_BAD_REQUEST if report.failed else status.HTTP_201_CREATED
+        return Response(report.as_dict(), status=response_status)
+
+
+@extend_schema(
+    tags=["projects"],
+    parameters=[
+        OpenApiParameter("q", str, required=True, description="Words to find, each as a word prefix."),
+        OpenApiParameter("type", str, description=f"Comma-separated types to search: {', '.join(SEARCH_TYPES)}."),
+    ],
+)
+class ProjectSearchView(ListAPIView):
+    """
+    Searches the tasks (title, description) and credentials (service name, username, login URL) of all projects of
+    the user, best matches first.
+    """
+
+    permission_classes = [IsAuthenticated]
+    pagination_class = SearchPagination
+    serializer_class = SearchHitSerializer
+
+    def get_queryset(self):
+        user_id = self.kwargs["user_id"]
+        if not user_id == self.request.user.id:
+            raise PermissionDenied("You do not have permission.")
+
+        query = parse_search_query(self.request.query_params.get("q"))
+        if query is None:
+            raise ValidationError({"q": ["Enter at least one word to search for."]})
+        types = parse_names(self.request.query_params.get("type")) or set(SEARCH_TYPES)
+        if not types <= set(SEARCH_TYPES):
+            raise ValidationError({"type": [f"Expected any of {list(SEARCH_TYPES)}."]})
+        return search_hits(user_id, query, types)
@@ -2,7 +2,9 @@ from collections import namedtuple
 from datetime import datetime
 
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
+from silk.collector import DataCollector
 
 from project.models import Credential as CredentialModel
 from project.models import Project as ProjectModel
@@ -31,6 +33,19 @@ def auth_client(api_client):
     return _auth_client
 
 
+@pytest.fixture
+def without_silk(settings):
+    """Disables django-silk profiling (development settings), so query counts only include the app queries"""
+    settings.MIDDLEWARE = [middleware for middleware in settings.MIDDLEWARE if not middleware.startswith("silk.")]
+    DataCollector().clear()  # silk keeps the last profiled request in a thread local and would keep recording
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """The local-memory cache outlives the rolled back test transactions, so responses must not leak between tests"""
+    cache.clear()
+
+
 @pytest.fixture(scope="session")
 def django_db_setup(django_db_setup, django_db_blocker):  # noqa: django_db_setup
     with django_db_blocker.unblock():
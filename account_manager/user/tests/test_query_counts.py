@@ -0,0 +1,50 @@
+from collections import namedtuple as nt
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from .conftest import Users
+
+# ----- Query Count Test Case Schemas ----------------------------------------------------------------------------------
+Q_TestCase = nt("Queries", ["auth_user", "url_name", "method", "max_queries", "expected_status"])
+
+# ----- Query Count Test Cases -----------------------------------------------------------------------------------------
+query_count_test_cases = [
+    # "auth_user", "url_name", "method", "max_queries", "expected_status"
+    Q_TestCase("not_auth", "user-list", "post", 2, status.HTTP_201_CREATED),
+    Q_TestCase("user1", "user-detail", "get", 1, status.HTTP_200_OK),
+    Q_TestCase("user1", "user-detail", "put", 3, status.HTTP_200_OK),
+    Q_TestCase("user1", "user-detail", "patch", 3, status.HTTP_200_OK),
+    Q_TestCase("user1", "user-detail", "delete", 9, status.HTTP_204_NO_CONTENT),
+]
+
+DATA_BY_METHOD = {"post": "for_create", "put": "for_update", "patch": "for_partial_update"}
+
+
+# ----- Query Count Tests ----------------------------------------------------------------------------------------------
+@pytest.mark.django_db
+class TestUserQueryCounts:
+
+    @pytest.fixture(autouse=True)
+    def inject_fixtures(self, auth_client, users, testcase_data, without_silk):
+        self.client = auth_client
+        self.users: Users = users
+        self.testcase_data = testcase_data
+
+    @pytest.mark.parametrize("test_case", query_count_test_cases)
+    def test_query_count(self, test_case: Q_TestCase, django_assert_max_num_queries):
+        client = self.client(getattr(self.users, test_case.auth_user))
+        kwargs = {"pk": self.users.user1.id} if test_case.url_name == "user-detail" else {}
+        url = reverse(test_case.url_name, kwargs=kwargs)
+        data = self.get_data(test_case)
+
+        with django_assert_max_num_queries(test_case.max_queries):
+            response = getattr(client, test_case.method)(url, data=data)
+
+        assert response.status_code == test_case.expected_status
+
+    # ----- Helper Methods ---------------------------------------------------------------------------------------------
+    def get_data(self, test_case):
+        data_field = DATA_BY_METHOD.get(test_case.method)
+        return getattr(self.testcase_data, data_field) if data_field else None